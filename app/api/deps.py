@@ -1,37 +1,203 @@
+from typing import Optional
+
+from redis.asyncio import Redis
+
 from app.core.config import settings
-from app.domain.dto import CachedListings
+from app.domain.dto import CachedListings, CachedSearchRefs, Center
 from app.domain.ports.caching_port import CachePort
+from app.domain.ports.listing_index_port import ListingIndexPort
+from app.providers.gazetteer.gazetteer import us_gazetteer
+from app.providers.opencage.adapter import OpenCageAdapter
+from app.providers.opencage.client import OpenCageClient
 from app.providers.redis.adapter import RedisModelCacheAdapter
 from app.providers.redis.client import get_redis_client
+from app.providers.redis.codecs import CachedListingsCodec
+from app.providers.redis.listing_index import RedisListingIndex
+from app.providers.redis.listings_store import NormalizedListingsCacheAdapter
+from app.providers.redis.sketch_store import RedisSketchStore
+from app.providers.redis.tiered_adapter import (LocalCacheAdapter,
+                                                get_l1_cache, get_tiered_cache)
 from app.providers.redis.utils import is_redis_connected
 from app.providers.rentcast.adapter import RentCastAdapter
 from app.providers.rentcast.client import RentCastClient
+from app.services.geo_cache import listings_geo_index
+from app.services.geocoding_service import GeocodingService
 from app.services.listings_service import ListingsService
+from app.services.rent_estimate_service import RentEstimateService
+from app.services.rent_index_service import RentIndexService
+from app.services.single_flight import listings_single_flight
+from app.services.spatial_index import listings_spatial_index
 
 
-async def get_listings_cache() -> CachePort[CachedListings]:
+async def _connected_redis() -> Optional[Redis]:
     """
-    Construct a Redis-backed cache for normalized listings.
+    The shared Redis client, or None if it does not answer a PING. Builders
+    that share a request take its result instead of pinging again.
     """
     redis = await get_redis_client()
 
     if not await is_redis_connected(redis):
         return None
+    return redis
+
+
+async def get_listings_cache() -> CachePort[CachedListings]:
+    """
+    Construct a Redis-backed cache for normalized listings.
+    """
+    return await _listings_cache(await _connected_redis())
+
 
-    return RedisModelCacheAdapter(
+async def _listings_cache(
+    redis: Optional[Redis],
+) -> Optional[CachePort[CachedListings]]:
+    if redis is None:
+        return None
+
+    prefix = f"{settings.redis_cache_prefix}:listings"
+    lease_ttl_ms = settings.lease_ttl_ms if settings.cache_lease_enabled else None
+    if settings.cache_layout == "normalized":
+        searches = RedisModelCacheAdapter(
+            redis=redis,
+            model_cls=CachedSearchRefs,
+            prefix=f"{settings.redis_cache_prefix}:searches",
+            default_ttl=settings.cache_ttl_seconds,
+            lease_ttl_ms=lease_ttl_ms,
+            xfetch_beta=settings.cache_xfetch_beta,
+            ttl_jitter_ratio=settings.cache_ttl_jitter_ratio,
+        )
+        cache = NormalizedListingsCacheAdapter(
+            searches=searches, index=_listing_index(redis)
+        )
+    else:
+        cache = RedisModelCacheAdapter(
+            redis=redis,
+            model_cls=CachedListings,
+            prefix=prefix,
+            default_ttl=settings.cache_ttl_seconds,
+            lease_ttl_ms=lease_ttl_ms,
+            xfetch_beta=settings.cache_xfetch_beta,
+            ttl_jitter_ratio=settings.cache_ttl_jitter_ratio,
+            codec=(
+                CachedListingsCodec() if settings.cache_codec == "columnar" else None
+            ),
+        )
+    if not settings.cache_l1_enabled:
+        return cache
+
+    return await get_tiered_cache(
+        cache, redis, prefix, weigher=lambda cached: len(cached.items)
+    )
+
+
+async def get_listing_index() -> Optional[ListingIndexPort]:
+    """
+    Construct the shared Redis listing-by-id index (None without Redis).
+    """
+    redis = await _connected_redis()
+    return None if redis is None else _listing_index(redis)
+
+
+def _listing_index(redis) -> RedisListingIndex:
+    return RedisListingIndex(
         redis=redis,
-        model_cls=CachedListings,
-        prefix=f"{settings.redis_cache_prefix}:listings",
-        default_ttl=settings.cache_ttl_seconds,
+        prefix=settings.redis_cache_prefix,
+        ttl_seconds=settings.cache_listing_ttl_seconds,
+        max_entries=settings.listing_index_max_entries,
     )
 
 
 async def get_listings_service() -> ListingsService:
     client = RentCastClient()
     adapter = RentCastAdapter(client)
-    cache = await get_listings_cache()
+    # One PING for every Redis-backed collaborator
+    redis = await _connected_redis()
+    cache = await _listings_cache(redis)
+
+    # The normalized layout registers listing bodies as part of every write
+    listing_index = None
+    if redis is not None and settings.cache_layout != "normalized":
+        listing_index = _listing_index(redis)
 
     return ListingsService(
         listings_port=adapter,
         cache_port=cache,
+        single_flight=listings_single_flight,
+        geo_index=listings_geo_index,
+        listing_index=listing_index,
+        rent_index=_rent_index_service(redis),
+        spatial_index=(
+            listings_spatial_index if settings.spatial_index_enabled else None
+        ),
+    )
+
+
+async def get_rent_estimate_service() -> RentEstimateService:
+    return RentEstimateService(await get_listings_service())
+
+
+async def get_rent_index_service() -> Optional[RentIndexService]:
+    """
+    Construct the per-ZIP rent index over Redis sketches (None without
+    Redis or when disabled).
+    """
+    if not settings.rent_index_enabled:
+        return None
+    return _rent_index_service(await _connected_redis())
+
+
+def _rent_index_service(redis: Optional[Redis]) -> Optional[RentIndexService]:
+    if redis is None or not settings.rent_index_enabled:
+        return None
+    return RentIndexService(
+        RedisSketchStore(
+            redis=redis,
+            prefix=settings.redis_cache_prefix,
+            ttl_seconds=settings.sketch_ttl_seconds,
+        )
+    )
+
+
+async def get_geocode_cache() -> CachePort[Center]:
+    """
+    Construct the two-tier geocode cache: a process-wide LRU in front of
+    Redis, both with the long geocode TTL. Without Redis the LRU serves
+    alone, so repeat lookups still skip OpenCage.
+    """
+    prefix = f"{settings.redis_cache_prefix}:geocode"
+    redis = await _connected_redis()
+    if redis is None:
+        return LocalCacheAdapter(
+            get_l1_cache(
+                prefix,
+                max_weight=settings.geocode_l1_max_entries,
+                ttl_seconds=settings.geocode_cache_ttl_seconds,
+            )
+        )
+
+    l2 = RedisModelCacheAdapter(
+        redis=redis,
+        model_cls=Center,
+        prefix=prefix,
+        default_ttl=settings.geocode_cache_ttl_seconds,
+        ttl_jitter_ratio=settings.cache_ttl_jitter_ratio,
+    )
+    return await get_tiered_cache(
+        l2,
+        redis,
+        prefix,
+        max_weight=settings.geocode_l1_max_entries,
+        ttl_seconds=settings.geocode_cache_ttl_seconds,
+    )
+
+
+async def get_geocoding_service() -> GeocodingService:
+    client = OpenCageClient()
+    adapter = OpenCageAdapter(client)
+    cache = await get_geocode_cache()
+
+    return GeocodingService(
+        geocoding_port=adapter,
+        cache_port=cache,
+        gazetteer=us_gazetteer if settings.gazetteer_enabled else None,
     )
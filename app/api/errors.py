@@ -3,15 +3,11 @@ import logging
 
 from fastapi import HTTPException, status
 
-from app.domain.exceptions.provider_exceptions import (ProviderAuthError,
-                                                       ProviderClientError,
-                                                       ProviderError,
-                                                       ProviderNetworkError,
-                                                       ProviderParsingError,
-                                                       ProviderRateLimitError,
-                                                       ProviderServerError,
-                                                       ProviderTimeoutError,
-                                                       ProviderUnexpectedError)
+from app.domain.exceptions.provider_exceptions import (
+    ProviderAuthError, ProviderCircuitOpenError, ProviderClientError,
+    ProviderError, ProviderNetworkError, ProviderNoResultsError,
+    ProviderParsingError, ProviderRateLimitError, ProviderServerError,
+    ProviderTimeoutError, ProviderUnexpectedError)
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +33,11 @@ PROVIDER_ERROR_MAP = {
         "provider_client_error",
         "Invalid request was sent to the upstream service.",
     ),
+    ProviderNoResultsError: (
+        status.HTTP_404_NOT_FOUND,
+        "provider_no_results",
+        "No results were found for the requested location.",
+    ),
     ProviderServerError: (
         status.HTTP_502_BAD_GATEWAY,
         "provider_server_error",
@@ -57,6 +58,11 @@ PROVIDER_ERROR_MAP = {
         "provider_network_error",
         "Network error while contacting the upstream service.",
     ),
+    ProviderCircuitOpenError: (
+        status.HTTP_503_SERVICE_UNAVAILABLE,
+        "provider_circuit_open",
+        "Upstream service is unavailable. Please retry later.",
+    ),
 }
 
 
@@ -16,6 +16,9 @@ def create_response(
     context: OperationType,
     rid: str,
     start: float,
+    cache: str = "miss",
+    provider_calls: int = 1,
+    stale: bool = False,
 ) -> ListingsResponse:
     total = len(listings)
     page_items = slice_page(listings, req.limit, req.offset)
@@ -33,8 +36,9 @@ def create_response(
             category=context.value,
             request_id=rid,
             duration_ms=duration_ms(start),
-            cache="miss",
-            provider_calls=1,
+            cache=cache,
+            provider_calls=provider_calls,
+            stale=stale,
         ),
     )
 
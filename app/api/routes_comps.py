@@ -1,37 +1,41 @@
 from __future__ import annotations
 
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Union
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
+from app.api.deps import get_listing_index
 from app.domain.analytics import compute_metrics
 from app.domain.dto import (CompRow, CompsRequestByIds, CompsRequestInline,
                             CompsResponse)
-from app.services.result_cache import result_cache
+from app.domain.ports.listing_index_port import ListingIndexPort
 
 router = APIRouter()
 
 
 @router.post("/comps", response_model=CompsResponse)
 async def comps_by_ids(
-    req: Union[CompsRequestByIds, CompsRequestInline]
+    req: Union[CompsRequestByIds, CompsRequestInline],
+    listing_index: Optional[ListingIndexPort] = Depends(get_listing_index),
 ) -> CompsResponse:
     # Support inline and by-ids (from server cache)
     start = __import__("time").perf_counter()
-    assumptions: Dict = (
-        (req.assumptions or {}).__dict__ if hasattr(req, "assumptions") else {}
-    )
+    assumptions: Dict = dict(req.assumptions.__dict__) if req.assumptions else {}
 
     listings: List[Dict] = []
+    missing_ids: List[str] = []
     source = "inline"
     if hasattr(req, "listings"):
         listings = [l.model_dump(by_alias=True) for l in req.listings]  # type: ignore
     elif hasattr(req, "ids"):
         source = "cache"
-        for id_ in req.ids:  # type: ignore
-            nl = result_cache.get_listing("last", id_)
-            if nl is not None:
-                listings.append(nl.model_dump(by_alias=True))
+        # Listings registered by earlier /rentals or /sales searches
+        missing_ids = list(req.ids)  # type: ignore
+        if listing_index is not None:
+            found, missing_ids = await listing_index.resolve(
+                req.ids, req.category  # type: ignore
+            )
+            listings = [nl.model_dump(by_alias=True) for nl in found]
 
     rows: List[CompRow] = []
     for l in listings[: req.limit]:
@@ -64,5 +68,6 @@ async def comps_by_ids(
         meta={
             "duration_ms": int((__import__("time").perf_counter() - start) * 1000),
             "source": source,
+            "missing_ids": missing_ids,
         },
     )
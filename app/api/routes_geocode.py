@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+import logging
+import time
+from typing import AsyncIterator, Dict, List
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+
+from app.api.deps import get_geocoding_service
+from app.core.config import settings
+from app.core.telemetry import duration_ms, request_id
+from app.domain.dto import (GeocodeBatchRequest, GeocodeLocation,
+                            ListingsRequest)
+from app.services.geocoding_service import BatchGeocodeResult, GeocodingService
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+INVALID_LOCATION = "Must provide either address, latitude & longitude, or city + state"
+
+
+@router.post("/geocode/batch")
+async def geocode_batch(
+    req: GeocodeBatchRequest,
+    geocoding_service: GeocodingService = Depends(get_geocoding_service),
+) -> StreamingResponse:
+    """
+    Geocode many locations, streaming one NDJSON line per input as each
+    resolves (not in input order):
+
+        {"index": 0, "input": {...}, "center": {"lat": .., "lon": ..}, "cached": true}
+        {"index": 1, "input": {...}, "error": "provider_no_results", "message": ".."}
+    """
+    rid = request_id()
+    if len(req.locations) > settings.geocode_batch_max_items:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"At most {settings.geocode_batch_max_items} locations per batch",
+        )
+
+    requests: List[ListingsRequest] = []
+    # Position in `requests` -> index in the submitted batch
+    positions: List[int] = []
+    invalid: Dict[int, str] = {}
+    for index, location in enumerate(req.locations):
+        try:
+            requests.append(ListingsRequest(**location.model_dump(exclude_none=True)))
+            positions.append(index)
+        except ValidationError:
+            invalid[index] = INVALID_LOCATION
+
+    async def lines() -> AsyncIterator[str]:
+        start = time.perf_counter()
+        for index, message in invalid.items():
+            yield _line(
+                index, req.locations[index], error="invalid_location", message=message
+            )
+
+        async for result in geocoding_service.geocode_batch(
+            requests, settings.geocode_batch_concurrency
+        ):
+            for position in result.indexes:
+                index = positions[position]
+                yield _result_line(index, req.locations[index], result)
+
+        logger.info(
+            "geocoded batch",
+            extra={
+                "request_id": rid,
+                "locations": len(req.locations),
+                "duration_ms": duration_ms(start),
+            },
+        )
+
+    return StreamingResponse(
+        lines(),
+        media_type="application/x-ndjson",
+        headers={"X-Request-ID": rid},
+    )
+
+
+def _result_line(
+    index: int, location: GeocodeLocation, result: BatchGeocodeResult
+) -> str:
+    if result.error is not None:
+        return _line(
+            index,
+            location,
+            error=result.error.error_code,
+            message=result.error.client_message,
+        )
+    return _line(
+        index, location, center=result.center.model_dump(), cached=result.cached
+    )
+
+
+def _line(index: int, location: GeocodeLocation, **fields) -> str:
+    body = {"index": index, "input": location.model_dump(exclude_none=True), **fields}
+    return json.dumps(body, separators=(",", ":")) + "\n"
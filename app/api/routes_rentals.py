@@ -27,12 +27,21 @@ async def rentals(
     start = time.perf_counter()
 
     try:
-        listings = await listings_service.get_rental_data(req)
+        result = await listings_service.search_rentals(req)
 
     except Exception as e:
         raise handle_provider_error(e, OperationType.RENTALS.value, rid)
 
-    return create_response(listings, req, OperationType.RENTALS, rid, start)
+    return create_response(
+        result.listings,
+        req,
+        OperationType.RENTALS,
+        rid,
+        start,
+        cache=result.cache,
+        provider_calls=result.provider_calls,
+        stale=result.stale,
+    )
 
 
 @router.post("/rentals/regional-metrics", response_model=RegionalMetrics)
@@ -5,13 +5,18 @@ import time
 
 from fastapi import APIRouter, Depends
 
-from app.api.deps import get_listings_service
+from app.api.deps import get_listings_service, get_rent_estimate_service
 from app.api.errors import handle_provider_error
 from app.api.presenters.listings_presenter import create_response
-from app.core.telemetry import request_id
-from app.domain.dto import ListingsRequest, ListingsResponse
+from app.core.pagination import paginate
+from app.core.telemetry import duration_ms, request_id
+from app.domain.dto import (EnvelopeSummary, ListingsRequest, ListingsResponse,
+                            PageSpec, RentEstimatesMeta, RentEstimatesResponse,
+                            SearchInputSummary)
 from app.domain.enums.context_request import OperationType
 from app.services.listings_service import ListingsService
+from app.services.rent_estimate_service import (RentalSearchError,
+                                                RentEstimateService)
 
 logger = logging.getLogger(__name__)
 
@@ -27,9 +32,57 @@ async def sales(
     start = time.perf_counter()
 
     try:
-        listings = await listings_service.get_sale_data(req)
+        result = await listings_service.search_sales(req)
 
     except Exception as e:
         raise handle_provider_error(e, OperationType.SALES.value, rid)
 
-    return create_response(listings, req, OperationType.SALES, rid, start)
+    return create_response(
+        result.listings,
+        req,
+        OperationType.SALES,
+        rid,
+        start,
+        cache=result.cache,
+        provider_calls=result.provider_calls,
+        stale=result.stale,
+    )
+
+
+@router.post("/sales/rent-estimates", response_model=RentEstimatesResponse)
+async def sales_rent_estimates(
+    req: ListingsRequest,
+    rent_estimate_service: RentEstimateService = Depends(get_rent_estimate_service),
+) -> RentEstimatesResponse:
+    """
+    Sale listings with an estimated monthly rent each, from a kNN model over
+    rentals matching the same search (no per-property comp calls).
+    """
+    rid = request_id()
+    start = time.perf_counter()
+
+    try:
+        result = await rent_estimate_service.estimate_sales(req)
+    except RentalSearchError as e:
+        raise handle_provider_error(e.error, OperationType.RENTALS.value, rid)
+    except Exception as e:
+        raise handle_provider_error(e, OperationType.SALES.value, rid)
+
+    returned, limit, next_offset = paginate(result.total, req.limit, req.offset)
+    return RentEstimatesResponse(
+        input=SearchInputSummary.generate_input_summary(req),
+        summary=EnvelopeSummary(
+            returned=returned,
+            count=None,
+            page=PageSpec(limit=limit, offset=req.offset, next_offset=next_offset),
+        ),
+        listings=result.listings,
+        meta=RentEstimatesMeta(
+            request_id=rid,
+            duration_ms=duration_ms(start),
+            region_key=result.region_key,
+            rentals_used=result.rentals_used,
+            estimator_cached=result.estimator_cached,
+            provider_calls=result.provider_calls,
+        ),
+    )
@@ -5,6 +5,10 @@ from redis.asyncio import Redis
 
 from app.providers.redis.client import get_redis_client
 from app.providers.redis.stats import get_redis_stats
+from app.providers.redis.tiered_adapter import l1_cache_snapshot
+from app.providers.shared.hedging import hedger_snapshot
+from app.providers.shared.resilience import circuit_breaker_snapshot
+from app.services.single_flight import listings_single_flight
 
 logger = logging.getLogger(__name__)
 
@@ -21,3 +25,24 @@ async def health_check():
 async def get_cache_stats(redis: Redis = Depends(get_redis_client)):
     """Get cache statistics (for debugging)"""
     return await get_redis_stats(redis)
+
+
+@router.get("/cache/l1")
+async def get_l1_cache_stats():
+    """Get in-process L1 cache counters per prefix (for debugging)"""
+    return l1_cache_snapshot()
+
+
+@router.get("/cache/single-flight")
+async def get_single_flight_stats():
+    """Get listings request-coalescing counters (for debugging)"""
+    return listings_single_flight.stats()
+
+
+@router.get("/diagnostics/providers")
+async def get_provider_diagnostics():
+    """Get provider circuit breaker state (for debugging)"""
+    return {
+        "circuit_breakers": circuit_breaker_snapshot(),
+        "hedging": hedger_snapshot(),
+    }
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import logging
+import time
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Path, status
+
+from app.api.deps import get_rent_index_service
+from app.core.telemetry import duration_ms, request_id
+from app.domain.dto import ZipRentIndex
+from app.services.rent_index_service import RentIndexService
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+@router.get("/zips/{zip_code}/rent-index", response_model=ZipRentIndex)
+async def zip_rent_index(
+    zip_code: str = Path(..., pattern=r"^\d{5}$"),
+    rent_index: Optional[RentIndexService] = Depends(get_rent_index_service),
+) -> ZipRentIndex:
+    """
+    Rent, rent/sqft and days-on-market statistics for a ZIP, overall and
+    per bedroom count, accumulated from every rental search that returned
+    listings there. `listings` is the sample count behind each bucket and
+    `updated_at` / `age_seconds` tell how fresh it is.
+    """
+    rid = request_id()
+    start = time.perf_counter()
+    if rent_index is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Rent index is unavailable",
+        )
+
+    index = await rent_index.get_zip_index(zip_code)
+    logger.info(
+        "served rent index",
+        extra={
+            "request_id": rid,
+            "zip": zip_code,
+            "found": index is not None,
+            "duration_ms": duration_ms(start),
+        },
+    )
+    if index is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No rentals recorded for ZIP {zip_code}",
+        )
+    return index
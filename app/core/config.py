@@ -1,5 +1,10 @@
+from typing import Any, Dict, Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Headroom past the retry deadline for the leader to write the filled value
+LEASE_MARGIN_SECONDS = 5.0
+
 
 class Settings(BaseSettings):
     # API Keys
@@ -12,6 +17,8 @@ class Settings(BaseSettings):
     rentcast_rental_url: str
     rentcast_sale_url: str
     opencage_url: str
+    rentcast_base_url: str | None = None
+    opencage_base_url: str | None = None
 
     # Configuration
     rentcast_radius_miles_default: float = 5.0
@@ -21,9 +28,104 @@ class Settings(BaseSettings):
     max_results: int = 50
     rate_limit_rps: int = 20
     cache_ttl_seconds: int = 600
+    # Stale-while-revalidate: after this age a hit is served as stale and
+    # refreshed in the background; cache_ttl_seconds is the hard TTL.
+    cache_soft_ttl_seconds: int | None = None
+    # XFetch probabilistic early refresh (0 disables) and TTL jitter
+    cache_xfetch_beta: float = 1.0
+    cache_ttl_jitter_ratio: float = 0.1
+    # Listings cache value format: "columnar" (compact binary) or "json"
+    cache_codec: Literal["json", "columnar"] = "columnar"
+    # "normalized" stores each listing once and searches as id lists
+    cache_layout: Literal["entries", "normalized"] = "entries"
+    cache_listing_ttl_seconds: int = 1800
+    # Negative caching: searches with no listings / geocodes with no result,
+    # and deterministic provider 4xx (never 5xx or timeouts)
+    cache_empty_ttl_seconds: int = 60
+    cache_error_ttl_seconds: int = 30
+    # Geocodes rarely change: in-process LRU plus Redis, keyed by query
+    geocode_cache_ttl_seconds: int = 2592000
+    geocode_l1_max_entries: int = 10000
+    # POST /geocode/batch
+    geocode_batch_max_items: int = 1000
+    geocode_batch_concurrency: int = 8
+    # Offline ZIP / city centroids consulted before OpenCage
+    gazetteer_enabled: bool = False
+    gazetteer_path: str | None = None
+    # Shared listing-by-id index (POST /comps with ids)
+    listing_index_max_entries: int = 50000
+    # Mergeable rent / rent-per-sqft / DOM sketches per ZIP and property type
+    sketch_ttl_seconds: int = 2592000
+    sketch_kll_k: int = 200
+    # Per-ZIP rent index fed by rental fetches (GET /zips/{zip}/rent-index)
+    rent_index_enabled: bool = True
+    rent_index_dedup_seconds: int = 86400
+    rent_index_max_pending: int = 64
+    # POST /sales/rent-estimates: kNN neighbours and fitted region models
+    rent_estimate_k: int = 8
+    rent_model_ttl_seconds: int = 3600
+    rent_model_cache_entries: int = 256
+    # In-process grid of recently fetched listings; answers radius searches
+    # inside a fresh covering search without reading the listings cache
+    spatial_index_enabled: bool = True
+    spatial_index_ttl_seconds: int = 3600
+    spatial_index_cell_degrees: float = 0.05
+    spatial_index_max_listings: int = 100000
     log_level: str = "INFO"
     environment: str = "dev"
 
+    # Pooled HTTP clients
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry_seconds: float = 30.0
+    http2_enabled: bool = False
+
+    # Cross-worker cache fill leases
+    cache_lease_enabled: bool = False
+    # Unset: the retry deadline plus a margin, so a leader still retrying
+    # keeps its lease (see lease_ttl_ms)
+    cache_lease_ttl_ms: int | None = None
+    cache_lease_wait_seconds: float = 5.0
+
+    # In-process L1 in front of the Redis listings cache
+    cache_l1_enabled: bool = False
+    cache_l1_max_weight: int = 20000  # total cached listings
+    cache_l1_ttl_seconds: int = 30
+
+    # Provider rate limiting (token bucket; rate_limit_rps <= 0 disables)
+    rentcast_rate_limit_rps: float | None = None
+    opencage_rate_limit_rps: float | None = None
+    rate_limit_burst: int | None = None
+    rate_limit_max_waiters: int = 100
+    rate_limit_max_wait_seconds: float = 2.0
+    rate_limit_shared: bool = False
+
+    # Provider retries and circuit breaker
+    retry_max_attempts: int = 3
+    retry_base_delay_seconds: float = 0.2
+    retry_max_delay_seconds: float = 2.0
+    retry_deadline_seconds: float = 20.0
+    # JSON overrides, e.g. {"RentCast:sale": {"max_attempts": 2}}
+    retry_policies: Dict[str, Dict[str, Any]] = {}
+    circuit_failure_threshold: int = 5
+    circuit_reset_seconds: float = 30.0
+
+    # Hedged RentCast requests
+    hedge_enabled: bool = False
+    hedge_percentile: float = 0.95
+    hedge_budget_ratio: float = 0.05
+    hedge_min_samples: int = 20
+    hedge_min_delay_ms: int = 50
+
+    @property
+    def lease_ttl_ms(self) -> int:
+        """
+        Fill-lease lifetime, never shorter than a leader's retry deadline
+        plus LEASE_MARGIN_SECONDS.
+        """
+        floor = int((self.retry_deadline_seconds + LEASE_MARGIN_SECONDS) * 1000)
+        return max(self.cache_lease_ttl_ms or 0, floor)
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
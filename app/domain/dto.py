@@ -87,6 +87,19 @@ class Center(BaseModel):
     lon: float
 
 
+class GeocodeLocation(BaseModel):
+    address: Optional[str] = None
+    city: Optional[str] = None
+    state: Optional[str] = None
+    zip: Optional[str] = None
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
+
+
+class GeocodeBatchRequest(BaseModel):
+    locations: List[GeocodeLocation] = Field(min_length=1)
+
+
 class InputFilters(BaseModel):
     beds: Optional[int] = None
     baths: Optional[float] = None
@@ -191,6 +204,27 @@ class NormalizedListing(BaseModel):
         default_factory=lambda: ProviderInfo(name="RentCast")
     )
 
+    @property
+    def has_id(self) -> bool:
+        return not is_placeholder_id(self.id)
+
+
+def is_placeholder_id(listing_id: str) -> bool:
+    """True for `prov:<provider>:unknown`, given to rows without a provider id."""
+    return listing_id.endswith(":unknown")
+
+
+class RentEstimate(BaseModel):
+    rent: float
+    rent_low: float  # rent -/+ the weighted spread of the comps
+    rent_high: float
+    confidence: float  # 0-1
+    comps_used: int
+
+
+class EstimatedListing(NormalizedListing):
+    rent_estimate: Optional[RentEstimate] = None
+
 
 class EnvelopeSummary(BaseModel):
     returned: int
@@ -249,12 +283,42 @@ class RegionalMetrics(BaseModel):
     clusters_by_zip: List[ClusterRentStats]
 
 
+class SketchStats(BaseModel):
+    """Exact count/min/max/mean/std; quartiles from a KLL sketch."""
+
+    count: int = 0
+    min: Optional[float] = None
+    max: Optional[float] = None
+    mean: Optional[float] = None
+    std: Optional[float] = None
+    p25: Optional[float] = None
+    median: Optional[float] = None
+    p75: Optional[float] = None
+
+
+class RentIndexBucket(BaseModel):
+    beds: Optional[str] = None  # "0".."5", "6+"; None for the whole ZIP
+    listings: int
+    updated_at: Optional[float] = None
+    age_seconds: Optional[float] = None
+    rent: SketchStats
+    rent_per_sqft: SketchStats
+    days_on_market: SketchStats
+
+
+class ZipRentIndex(BaseModel):
+    zip: str
+    overall: RentIndexBucket
+    by_beds: List[RentIndexBucket] = Field(default_factory=list)
+
+
 class EnvelopeMeta(BaseModel):
     category: Literal["rental", "sale"]
     request_id: str
     duration_ms: int
     cache: Literal["hit", "miss", "partial"]
     provider_calls: int
+    stale: bool = False
 
 
 class ListingsResponse(BaseModel):
@@ -264,8 +328,47 @@ class ListingsResponse(BaseModel):
     meta: EnvelopeMeta
 
 
+class RentEstimatesMeta(BaseModel):
+    request_id: str
+    duration_ms: int
+    region_key: str
+    rentals_used: int
+    estimator_cached: bool
+    provider_calls: int
+
+
+class RentEstimatesResponse(BaseModel):
+    input: SearchInputSummary
+    summary: EnvelopeSummary
+    listings: List[EstimatedListing]
+    meta: RentEstimatesMeta
+
+
 class CachedListings(BaseModel):
     items: List[NormalizedListing]
+    # Epoch seconds of the provider fetch; drives the soft (stale) TTL
+    fetched_at: Optional[float] = None
+    # Message of a cached ProviderClientError; such entries have no items
+    error: Optional[str] = None
+
+
+class CachedSearchRefs(BaseModel):
+    """A cached search in the normalized layout: listing ids in provider order."""
+
+    ids: List[str]
+    category: Optional[str] = None
+    # Bodies of id-less listings, in the order their placeholders appear
+    unkeyed: List[NormalizedListing] = Field(default_factory=list)
+    fetched_at: Optional[float] = None
+    provider: Optional[str] = None
+    error: Optional[str] = None
+
+
+class ListingsSearchResult(BaseModel):
+    listings: List[NormalizedListing]
+    cache: Literal["hit", "miss", "partial"] = "miss"
+    provider_calls: int = 1
+    stale: bool = False
 
 
 class ErrorDetail(BaseModel):
@@ -335,6 +438,8 @@ class CompsAssumptions(BaseModel):
 
 class CompsRequestByIds(BaseModel):
     ids: List[str]
+    # Ids name properties; without a category both listings of an id match
+    category: Optional[Literal["rental", "sale"]] = None
     assumptions: Optional[CompsAssumptions] = None
     metrics: List[str]
     group_by: Optional[List[str]] = None
@@ -41,6 +41,14 @@ class ProviderClientError(ProviderError):
     client_message = "Invalid request was sent to the upstream service."
 
 
+class ProviderNoResultsError(ProviderClientError):
+    """Raised when a provider answers but finds nothing for the request."""
+
+    status_code = 404
+    error_code = "provider_no_results"
+    client_message = "No results were found for the requested location."
+
+
 class ProviderServerError(ProviderError):
     """Raised for provider 5xx errors."""
 
@@ -65,6 +73,14 @@ class ProviderParsingError(ProviderError):
     client_message = "Received an invalid response from the upstream service."
 
 
+class ProviderCircuitOpenError(ProviderError):
+    """Raised without calling the provider while its circuit breaker is open."""
+
+    status_code = 503
+    error_code = "provider_circuit_open"
+    client_message = "Upstream service is unavailable. Please retry later."
+
+
 class ProviderUnexpectedError(ProviderError):
     """Catch-all for any unexpected or unclassified provider failure."""
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Generic, Optional, Protocol, TypeVar
+from typing import Generic, Optional, Protocol, TypeVar, runtime_checkable
 
 T = TypeVar("T")
 
@@ -11,12 +11,25 @@ class CachePort(Protocol, Generic[T]):
     Keys are strings; values are typed domain objects (e.g. Pydantic DTOs).
     """
 
-    async def get(self, key: str) -> Optional[T]:
-        """Return cached value or None if not found / expired."""
+    async def get(self, key: str, early_expiry: bool = True) -> Optional[T]:
+        """
+        Return cached value or None if not found / expired. With
+        `early_expiry` off, caches that refresh costly keys early return the
+        value until it really expires.
+        """
         ...
 
-    async def set(self, key: str, value: T, ttl_seconds: int | None = None) -> None:
-        """Store value under key with optional TTL."""
+    async def set(
+        self,
+        key: str,
+        value: T,
+        ttl_seconds: int | None = None,
+        compute_seconds: float | None = None,
+    ) -> None:
+        """
+        Store value under key with optional TTL. `compute_seconds` (how long
+        the value took to produce) lets caches refresh costly keys earlier.
+        """
         ...
 
     async def delete(self, key: str) -> None:
@@ -26,3 +39,27 @@ class CachePort(Protocol, Generic[T]):
     async def clear(self) -> None:
         """Clear all cached entries (implementation-dependent)."""
         ...
+
+
+@runtime_checkable
+class CacheLeasePort(Protocol, Generic[T]):
+    """
+    Optional extension for caches shared between workers.
+    A lease lets exactly one worker refill a missing key while others wait.
+    """
+
+    @property
+    def leases_enabled(self) -> bool:
+        ...
+
+    async def acquire_lease(self, key: str) -> Optional[str]:
+        """Return a lease token, or None if another worker holds the lease."""
+        ...
+
+    async def release_lease(self, key: str, token: str) -> None:
+        """Release the lease if `token` still owns it."""
+        ...
+
+    async def wait_for_value(self, key: str, timeout_seconds: float) -> Optional[T]:
+        """Wait (bounded) for another worker to fill `key`; None on timeout."""
+        ...
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from typing import Optional, Protocol
+
+from app.domain.dto import Center, ListingsRequest
+
+
+class GazetteerPort(Protocol):
+    """
+    Port for an offline centroid lookup of coarse locations (ZIP, city +
+    state). Lookups are local and synchronous.
+    """
+
+    def lookup(self, request: ListingsRequest) -> Optional[Center]:
+        """Centroid for the request's location, or None if not covered."""
+        ...
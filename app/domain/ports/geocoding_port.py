@@ -1,4 +1,4 @@
-from typing import Protocol, runtime_checkable
+from typing import Optional, Protocol, runtime_checkable
 
 from app.domain.dto import Center, ListingsRequest
 
@@ -20,3 +20,17 @@ class GeocodingPort(Protocol):
             4. zip.
         """
         ...
+
+    def cache_key(self, request: ListingsRequest) -> str:
+        """
+        Stable key for the location `request` resolves to; requests that
+        the provider would geocode identically share a key.
+        """
+        ...
+
+    def call_budget(self) -> Optional[int]:
+        """
+        Provider calls still allowed in the current rate window, or None
+        when the provider has not reported a limit.
+        """
+        ...
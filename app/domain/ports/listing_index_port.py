@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from typing import List, Optional, Protocol, Tuple
+
+from app.domain.dto import NormalizedListing
+
+
+class ListingIndexPort(Protocol):
+    """
+    Port for a shared listing-by-id lookup, filled from search results so a
+    later request (e.g. comps by ids) can resolve listings on any worker.
+    """
+
+    async def register(self, listings: List[NormalizedListing]) -> None:
+        """Store or refresh the given listings under their ids."""
+        ...
+
+    async def resolve(
+        self, ids: List[str], category: Optional[str] = None
+    ) -> Tuple[List[NormalizedListing], List[str]]:
+        """
+        Return (found listings in request order, ids that were missing). An
+        id names a property, so without a category both its rental and sale
+        listings may be returned.
+        """
+        ...
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from typing import Dict, List, Protocol
+
+from app.domain.sketches import ListingSketch
+
+
+class SketchStorePort(Protocol):
+    """
+    Port for shared, mergeable listing sketches (see app.domain.sketches),
+    keyed by group such as `zip:78701` or `type:condo`.
+    """
+
+    async def merge(self, sketches: Dict[str, ListingSketch]) -> bool:
+        """
+        Fold each sketch into the stored one under its key. Returns False
+        if the merge was dropped and nothing was stored.
+        """
+        ...
+
+    async def get_many(self, keys: List[str]) -> Dict[str, ListingSketch]:
+        """Stored sketches for the keys that have one."""
+        ...
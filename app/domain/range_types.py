@@ -21,3 +21,31 @@ class Range(BaseModel, Generic[T]):
         left = "*" if self.min is None else str(self.min)
         right = "*" if self.max is None else str(self.max)
         return f"{left}:{right}"
+
+    @classmethod
+    def from_provider(cls, text: str) -> "Range":
+        """Parse the provider "min:max" form, where "*" means unbounded."""
+        left, _, right = text.partition(":")
+        return cls(
+            min=None if left in ("", "*") else float(left),
+            max=None if right in ("", "*") else float(right),
+        )
+
+    def covers(self, other: Optional["Range"]) -> bool:
+        """True if every value allowed by `other` is also allowed by self."""
+        if other is None:
+            return self.min is None and self.max is None
+        if self.min is not None and (other.min is None or other.min < self.min):
+            return False
+        if self.max is not None and (other.max is None or other.max > self.max):
+            return False
+        return True
+
+    def contains(self, value: Optional[T]) -> bool:
+        if value is None:
+            return self.min is None and self.max is None
+        if self.min is not None and value < self.min:
+            return False
+        if self.max is not None and value > self.max:
+            return False
+        return True
@@ -2,13 +2,18 @@ from __future__ import annotations
 
 import math
 from collections import defaultdict
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from statistics import mean, median
 from typing import Dict, List, Optional, Sequence, Tuple
 
+import numpy as np
+
 from app.domain.dto import (ClusterRentStats, DistanceMetrics,
                             NormalizedListing, OverallRentMetrics,
                             PropertyTypeStats, RegionalMetrics)
+from app.domain.sample_summary import SampleSummary, exact_mean
 from app.utils.distance import haversine_distance
 
 
@@ -17,6 +22,71 @@ def compute_regional_metrics(
     center_lat: Optional[float],
     center_lon: Optional[float],
 ) -> RegionalMetrics:
+    """
+    Columnar engine: listings are read once into NumPy arrays, each array is
+    sorted once for all of its quantiles, and per-group medians come from a
+    single lexsort per column. Output is identical to
+    `compute_regional_metrics_scalar`, including float rounding.
+    """
+    columns = ListingColumns.extract(rentals, center_lat, center_lon)
+    overall_metrics = _overall_metrics(
+        len(rentals),
+        SampleSummary.of(columns.rent),
+        SampleSummary.of(columns.rent_per_sqft),
+        SampleSummary.of(columns.dom),
+    )
+
+    paired = ~np.isnan(columns.rent) & ~np.isnan(columns.distance)
+    paired_rent = columns.rent[paired]
+    paired_distance = columns.distance[paired]
+    distance_metrics = DistanceMetrics(
+        median_distance_miles=SampleSummary.of(columns.distance).median,
+        rent_distance_correlation=_columnar_pearson(paired_rent, paired_distance),
+        distance_weighted_median_rent=_columnar_weighted_median(
+            paired_rent, paired_distance
+        ),
+    )
+
+    property_groups = _Groups(columns.property_codes, columns.property_names)
+    property_type_metrics = [
+        _property_stats(name, count, *summaries)
+        for (name, count), *summaries in zip(
+            property_groups.sizes(),
+            property_groups.summaries(columns.rent),
+            property_groups.summaries(columns.rent_per_sqft),
+            property_groups.summaries(columns.sqft),
+            property_groups.summaries(columns.dom),
+        )
+    ]
+
+    zip_groups = _Groups(columns.zip_codes, columns.zip_names)
+    clusters_by_zip = [
+        _cluster_stats(name, count, *summaries)
+        for (name, count), *summaries in zip(
+            zip_groups.sizes(),
+            zip_groups.summaries(columns.rent),
+            zip_groups.summaries(columns.rent_per_sqft),
+        )
+    ]
+
+    return RegionalMetrics(
+        overall=overall_metrics,
+        distance=distance_metrics,
+        property_type_metrics=property_type_metrics,
+        clusters_by_zip=clusters_by_zip,
+    )
+
+
+def compute_regional_metrics_scalar(
+    rentals: List[NormalizedListing],
+    center_lat: Optional[float],
+    center_lon: Optional[float],
+) -> RegionalMetrics:
+    """
+    Reference implementation over plain Python lists and the statistics
+    module, independent of SampleSummary; the columnar engine must match it
+    exactly (see tests and benchmarks).
+    """
     rents: List[float] = []
     rent_per_sqft_values: List[float] = []
     days_on_market_values: List[int] = []
@@ -106,6 +176,62 @@ def compute_regional_metrics(
     )
 
 
+def _overall_metrics(
+    count: int,
+    rent: SampleSummary,
+    rent_per_sqft: SampleSummary,
+    dom: SampleSummary,
+) -> OverallRentMetrics:
+    return OverallRentMetrics(
+        count=count,
+        min_rent=rent.min,
+        max_rent=rent.max,
+        mean_rent=rent.mean,
+        median_rent=rent.median,
+        p25_rent=rent.percentile(0.25),
+        p75_rent=rent.percentile(0.75),
+        min_rent_per_sqft=rent_per_sqft.min,
+        max_rent_per_sqft=rent_per_sqft.max,
+        mean_rent_per_sqft=rent_per_sqft.mean,
+        median_rent_per_sqft=rent_per_sqft.median,
+        p25_rent_per_sqft=rent_per_sqft.percentile(0.25),
+        p75_rent_per_sqft=rent_per_sqft.percentile(0.75),
+        mean_days_on_market=dom.mean,
+        median_days_on_market=dom.median,
+        fastest_days_on_market=None if dom.min is None else int(dom.min),
+        slowest_days_on_market=None if dom.max is None else int(dom.max),
+    )
+
+
+def _property_stats(
+    property_type: str,
+    count: int,
+    rent: SampleSummary,
+    rent_per_sqft: SampleSummary,
+    sqft: SampleSummary,
+    dom: SampleSummary,
+) -> PropertyTypeStats:
+    return PropertyTypeStats(
+        property_type=property_type,
+        count=count,
+        median_rent=rent.median,
+        median_rent_per_sqft=rent_per_sqft.median,
+        median_sqft=sqft.median,
+        mean_days_on_market=dom.mean,
+    )
+
+
+def _cluster_stats(
+    cluster_key: str, count: int, rent: SampleSummary, rent_per_sqft: SampleSummary
+) -> ClusterRentStats:
+    return ClusterRentStats(
+        cluster_key=cluster_key,
+        count=count,
+        median_rent=rent.median,
+        median_rent_per_sqft=rent_per_sqft.median,
+    )
+
+
 def _positive_number(value: Optional[int]) -> Optional[float]:
     if value is None:
         return None
@@ -153,6 +279,7 @@ def _compute_days_on_market(listing: NormalizedListing) -> Optional[int]:
     return delta
 
 
+@lru_cache(maxsize=4096)
 def _parse_date(value: Optional[str]) -> Optional[datetime]:
     if value is None:
         return None
@@ -295,3 +422,198 @@ def _build_cluster_stats(
         median_rent=_median_value(rent_values),
         median_rent_per_sqft=_median_value(rent_per_sqft_values),
     )
+
+
+# ---------------------------------------------------------------------------
+# Columnar engine
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ListingColumns:
+    """Per-listing values as float64 arrays; NaN marks a missing value."""
+
+    rent: np.ndarray
+    rent_per_sqft: np.ndarray
+    sqft: np.ndarray
+    dom: np.ndarray
+    distance: np.ndarray
+    beds: np.ndarray
+    property_codes: np.ndarray
+    property_names: List[str]
+    zip_codes: np.ndarray
+    zip_names: List[str]
+
+    @classmethod
+    def extract(
+        cls,
+        rentals: Sequence[NormalizedListing],
+        center_lat: Optional[float],
+        center_lon: Optional[float],
+    ) -> "ListingColumns":
+        rents: List[Optional[float]] = []
+        sqfts: List[Optional[int]] = []
+        doms: List[Optional[int]] = []
+        distances: List[Optional[float]] = []
+        lats: List[Optional[float]] = []
+        lons: List[Optional[float]] = []
+        beds: List[Optional[int]] = []
+        property_index: Dict[str, int] = {}
+        property_codes: List[int] = []
+        zip_index: Dict[str, int] = {}
+        zip_codes: List[int] = []
+
+        for listing in rentals:
+            rents.append(listing.pricing.list_price)
+            sqfts.append(listing.facts.sqft)
+            doms.append(_compute_days_on_market(listing))
+            distances.append(listing.distance_miles)
+            lats.append(listing.address.lat)
+            lons.append(listing.address.lon)
+            beds.append(listing.facts.beds)
+            key = listing.facts.property_type or "unknown"
+            property_codes.append(property_index.setdefault(key, len(property_index)))
+            key = listing.address.zip or "unknown"
+            zip_codes.append(zip_index.setdefault(key, len(zip_index)))
+
+        rent = np.array(rents, dtype=np.float64)
+        raw_sqft = np.array(sqfts, dtype=np.float64)
+        with np.errstate(invalid="ignore"):
+            sqft = np.where(raw_sqft > 0, raw_sqft, np.nan)
+        property_codes_arr, property_names = _sorted_codes(
+            property_codes, property_index
+        )
+        zip_codes_arr, zip_names = _sorted_codes(zip_codes, zip_index)
+        return cls(
+            rent=rent,
+            rent_per_sqft=rent / sqft,
+            sqft=sqft,
+            dom=np.array(doms, dtype=np.float64),
+            distance=_fill_distances(
+                np.array(distances, dtype=np.float64),
+                np.array(lats, dtype=np.float64),
+                np.array(lons, dtype=np.float64),
+                center_lat,
+                center_lon,
+            ),
+            beds=np.array(beds, dtype=np.float64),
+            property_codes=property_codes_arr,
+            property_names=property_names,
+            zip_codes=zip_codes_arr,
+            zip_names=zip_names,
+        )
+
+
+def _sorted_codes(
+    codes: List[int], index: Dict[str, int]
+) -> Tuple[np.ndarray, List[str]]:
+    """Renumber first-seen group codes so code order is name order."""
+    names = sorted(index)
+    remap = np.empty(len(index), dtype=np.intp)
+    for rank, name in enumerate(names):
+        remap[index[name]] = rank
+    return remap[np.array(codes, dtype=np.intp)], names
+
+
+class _Groups:
+    """Vectorized group-by over integer codes (0..len(names)-1)."""
+
+    def __init__(self, codes: np.ndarray, names: List[str]) -> None:
+        self.codes = codes
+        self.names = names
+        self.counts = np.bincount(codes, minlength=len(names))
+
+    def sizes(self) -> List[Tuple[str, int]]:
+        return list(zip(self.names, self.counts.tolist()))
+
+    def summaries(self, values: np.ndarray) -> List[SampleSummary]:
+        """Each group's present values, sorted by one lexsort for all groups."""
+        present = ~np.isnan(values)
+        codes = self.codes[present]
+        kept = values[present]
+        ordered = kept[np.lexsort((kept, codes))]
+        ends = np.cumsum(np.bincount(codes, minlength=len(self.names)))
+        return [
+            SampleSummary.from_sorted(segment)
+            for segment in np.split(ordered, ends[:-1])
+        ]
+
+
+def _fill_distances(
+    distances: np.ndarray,
+    lats: np.ndarray,
+    lons: np.ndarray,
+    center_lat: Optional[float],
+    center_lon: Optional[float],
+) -> np.ndarray:
+    """
+    Vectorized `_listing_distance`: haversine miles rounded to 0.1 where the
+    listing has no distance but has coordinates. NumPy's trig may differ from
+    math's by an ulp, so values within reach of a rounding boundary are
+    recomputed with haversine_distance to keep results bit-identical.
+    """
+    if center_lat is None or center_lon is None:
+        return distances
+    missing = np.flatnonzero(np.isnan(distances) & ~np.isnan(lats) & ~np.isnan(lons))
+    if missing.size == 0:
+        return distances
+
+    lat1 = math.radians(center_lat)
+    lon1 = math.radians(center_lon)
+    lat2 = np.radians(lats[missing])
+    lon2 = np.radians(lons[missing])
+    with np.errstate(invalid="ignore"):
+        a = (
+            np.sin((lat2 - lat1) / 2) ** 2
+            + math.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+        )
+        miles = 2 * np.arcsin(np.sqrt(a)) * 3956
+    tenths = miles * 10
+    near_boundary = np.abs(tenths - np.floor(tenths) - 0.5) < 1e-6
+    exact = near_boundary | np.isnan(miles) | (a > 1.0)
+
+    filled = distances.copy()
+    filled[missing] = np.rint(tenths) / 10
+    for i in missing[exact].tolist():
+        try:
+            filled[i] = haversine_distance(
+                center_lat, center_lon, lats[i].item(), lons[i].item()
+            )
+        except ValueError:
+            filled[i] = np.nan
+    return filled
+
+
+def _columnar_pearson(rents: np.ndarray, distances: np.ndarray) -> Optional[float]:
+    if rents.size < 2:
+        return None
+    rent_dev = rents - exact_mean(rents)
+    distance_dev = distances - exact_mean(distances)
+    # Python's sum keeps the reference's left-to-right rounding, and squares
+    # go through float ** 2 (libm pow), which can differ from NumPy's x * x
+    numerator = sum((rent_dev * distance_dev).tolist())
+    rent_variance = sum(dev**2 for dev in rent_dev.tolist())
+    distance_variance = sum(dev**2 for dev in distance_dev.tolist())
+    denominator = math.sqrt(rent_variance * distance_variance)
+    if denominator == 0:
+        return None
+    return numerator / denominator
+
+
+def _columnar_weighted_median(
+    rents: np.ndarray, distances: np.ndarray
+) -> Optional[float]:
+    if rents.size == 0:
+        return None
+    weights = 1.0 / (np.abs(distances) + 0.1)
+    # cumsum accumulates sequentially, like the reference loop
+    total_weight = np.cumsum(weights)[-1]
+    if total_weight == 0:
+        return None
+
+    order = np.argsort(rents, kind="stable")
+    running = np.cumsum(weights[order])
+    reached = np.flatnonzero(running >= total_weight / 2.0)
+    if reached.size == 0:
+        return rents[-1].item()
+    return rents[order[reached[0]]].item()
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from app.domain.dto import NormalizedListing, RentEstimate
+
+FEATURES = ("beds", "baths", "sqft")
+
+# Smallest feature scale, so a uniform region (every rental 2 beds) does
+# not turn a one-bedroom difference into an infinite distance
+_MIN_SCALE = np.array([0.5, 0.5, 100.0])
+
+# Added to neighbor distances (in scaled units) before inverting, so an
+# exact feature match dominates without a division by zero
+_DISTANCE_OFFSET = 0.25
+
+# Sale listings scored per distance-matrix block (block x rentals floats)
+_CHUNK_ROWS = 256
+
+
+def _feature_matrix(listings: Sequence[NormalizedListing]) -> np.ndarray:
+    return np.array(
+        [
+            [listing.facts.beds, listing.facts.baths, listing.facts.sqft]
+            for listing in listings
+        ],
+        dtype=np.float64,
+    ).reshape(len(listings), len(FEATURES))
+
+
+@dataclass
+class KnnRentModel:
+    """
+    Distance-weighted k-nearest-neighbour rent model for one region.
+
+    Rentals are points in (beds, baths, sqft) space, each feature divided by
+    its spread in the region. A sale listing's rent is the inverse-distance
+    weighted mean of its k nearest rentals. Missing features are filled
+    with the region's median and lower the estimate's confidence.
+    """
+
+    features: np.ndarray  # (rentals, features), scaled
+    rents: np.ndarray
+    fill: np.ndarray  # per-feature median, unscaled
+    scale: np.ndarray
+    k: int
+
+    @classmethod
+    def fit(
+        cls, rentals: Sequence[NormalizedListing], k: int
+    ) -> Optional["KnnRentModel"]:
+        """None when no rental has a rent."""
+        rents = np.array(
+            [listing.pricing.list_price for listing in rentals], dtype=np.float64
+        )
+        usable = ~np.isnan(rents) & (rents > 0)
+        if not usable.any():
+            return None
+        raw = _feature_matrix(rentals)[usable]
+
+        with np.errstate(all="ignore"):
+            fill = np.nanmedian(raw, axis=0)
+            spread = np.nanstd(raw, axis=0)
+        # A feature no rental reports carries no signal; zero it everywhere
+        fill = np.where(np.isnan(fill), 0.0, fill)
+        scale = np.fmax(np.nan_to_num(spread), _MIN_SCALE)
+        raw = np.where(np.isnan(raw), fill, raw)
+        return cls(
+            features=raw / scale,
+            rents=rents[usable],
+            fill=fill,
+            scale=scale,
+            k=k,
+        )
+
+    def __post_init__(self) -> None:
+        self._norms = np.square(self.features).sum(axis=1)
+
+    def __len__(self) -> int:
+        return self.rents.size
+
+    def predict(self, listings: Sequence[NormalizedListing]) -> List[RentEstimate]:
+        if not listings:
+            return []
+        raw = _feature_matrix(listings)
+        completeness = 1.0 - np.isnan(raw).mean(axis=1)
+        query = np.where(np.isnan(raw), self.fill, raw) / self.scale
+
+        k = min(self.k, self.rents.size)
+        estimates: List[RentEstimate] = []
+        for start in range(0, query.shape[0], _CHUNK_ROWS):
+            block = query[start : start + _CHUNK_ROWS]
+            # |a - b|^2 = |a|^2 + |b|^2 - 2ab: one matrix product per block
+            squared = (
+                np.square(block).sum(axis=1)[:, None]
+                + self._norms[None, :]
+                - 2.0 * block @ self.features.T
+            )
+            distances = np.sqrt(np.maximum(squared, 0.0))
+            nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+            near_distances = np.take_along_axis(distances, nearest, axis=1)
+            near_rents = self.rents[nearest]
+
+            weights = 1.0 / (near_distances + _DISTANCE_OFFSET)
+            total = weights.sum(axis=1)
+            rent = (weights * near_rents).sum(axis=1) / total
+            spread = np.sqrt(
+                (weights * (near_rents - rent[:, None]) ** 2).sum(axis=1) / total
+            )
+            confidence = (
+                np.exp(-near_distances.mean(axis=1))  # how alike the comps are
+                / (1.0 + spread / rent)  # how much they agree
+                * (k / self.k)  # enough comps in the region
+                * completeness[start : start + block.shape[0]]
+            )
+            estimates.extend(
+                RentEstimate(
+                    rent=round(r, 2),
+                    rent_low=round(max(r - s, 0.0), 2),
+                    rent_high=round(r + s, 2),
+                    confidence=round(min(max(c, 0.0), 1.0), 3),
+                    comps_used=k,
+                )
+                for r, s, c in zip(rent.tolist(), spread.tolist(), confidence.tolist())
+            )
+        return estimates
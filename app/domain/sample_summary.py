@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import math
+from fractions import Fraction
+from typing import Dict, Iterable, Optional, Union
+
+import numpy as np
+
+# Mantissas are split into two halves so int64 sums of up to 2**36 values
+# cannot overflow
+_HALF_BITS = 26
+_HALF_MASK = (1 << _HALF_BITS) - 1
+
+
+def exact_mean(values: np.ndarray) -> Optional[float]:
+    """
+    statistics.mean, vectorized: the sum is exact (integer mantissas summed
+    per binary exponent) and only the final division rounds.
+    """
+    n = values.size
+    if n == 0:
+        return None
+    mantissas, exponents = np.frexp(values)
+    ints = (mantissas * 2.0**53).astype(np.int64)
+    low_exponent = int(exponents.min())
+    total = 0
+    for exponent in np.unique(exponents).tolist():
+        chunk = ints[exponents == exponent]
+        high = int((chunk >> _HALF_BITS).sum())
+        low = int((chunk & _HALF_MASK).sum())
+        total += ((high << _HALF_BITS) + low) << (exponent - low_exponent)
+    scale = low_exponent - 53
+    if scale >= 0:
+        return float(Fraction(total << scale, n))
+    return float(Fraction(total, n << -scale))
+
+
+class SampleSummary:
+    """
+    A numeric sample sorted once. Count, min, max, median and any
+    percentile are then index lookups; the mean is computed on first use
+    and cached. Missing values (None, NaN) are dropped.
+
+    Results match the statistics module: `median` is statistics.median and
+    `mean` is statistics.mean, exactly; `percentile` interpolates linearly
+    between closest ranks.
+    """
+
+    __slots__ = ("values", "_mean")
+
+    def __init__(self, sorted_values: np.ndarray) -> None:
+        self.values = sorted_values
+        self._mean: Optional[float] = None
+
+    @classmethod
+    def of(
+        cls, values: Union[np.ndarray, Iterable[Optional[float]]]
+    ) -> "SampleSummary":
+        if not isinstance(values, np.ndarray):
+            values = np.array(
+                [value for value in values if value is not None], dtype=np.float64
+            )
+        return cls(np.sort(values[~np.isnan(values)]))
+
+    @classmethod
+    def from_sorted(cls, sorted_values: np.ndarray) -> "SampleSummary":
+        """Wrap values already sorted ascending, with no NaN."""
+        return cls(sorted_values)
+
+    def __len__(self) -> int:
+        return self.values.size
+
+    @property
+    def count(self) -> int:
+        return self.values.size
+
+    @property
+    def min(self) -> Optional[float]:
+        return None if self.values.size == 0 else self.values[0].item()
+
+    @property
+    def max(self) -> Optional[float]:
+        return None if self.values.size == 0 else self.values[-1].item()
+
+    @property
+    def mean(self) -> Optional[float]:
+        if self._mean is None:
+            self._mean = exact_mean(self.values)
+        return self._mean
+
+    @property
+    def median(self) -> Optional[float]:
+        n = self.values.size
+        if n == 0:
+            return None
+        mid = n // 2
+        if n % 2:
+            return self.values[mid].item()
+        return ((self.values[mid - 1] + self.values[mid]) / 2).item()
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Linear interpolation between closest ranks, q in [0, 1]."""
+        n = self.values.size
+        if n == 0:
+            return None
+        if n == 1:
+            return self.values[0].item()
+        rank = (n - 1) * q
+        lower = math.floor(rank)
+        upper = math.ceil(rank)
+        if lower == upper:
+            return self.values[int(rank)].item()
+        lower_value = self.values[lower].item()
+        upper_value = self.values[upper].item()
+        return lower_value * (upper - rank) + upper_value * (rank - lower)
+
+    def describe(self) -> Dict[str, Optional[float]]:
+        return {
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean,
+            "median": self.median,
+            "p25": self.percentile(0.25),
+            "p75": self.percentile(0.75),
+        }
@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+import math
+import random
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from app.domain.dto import NormalizedListing
+from app.domain.regional_metrics import ListingColumns
+
+DEFAULT_K = 200
+
+# Compaction coin flips; any source of fair bits keeps the sketch unbiased
+_coin = random.Random()
+
+
+@dataclass
+class Moments:
+    """Count, sum, sum of squares, min and max; merging is addition."""
+
+    count: int = 0
+    total: float = 0.0
+    total_sq: float = 0.0
+    min: float = math.inf
+    max: float = -math.inf
+
+    def add(self, values: np.ndarray) -> None:
+        if values.size == 0:
+            return
+        self.count += values.size
+        self.total += float(values.sum())
+        self.total_sq += float(np.square(values).sum())
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+    def merge(self, other: "Moments") -> None:
+        self.count += other.count
+        self.total += other.total
+        self.total_sq += other.total_sq
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    @property
+    def std(self) -> Optional[float]:
+        """Population standard deviation."""
+        if not self.count:
+            return None
+        mean = self.total / self.count
+        return math.sqrt(max(self.total_sq / self.count - mean * mean, 0.0))
+
+
+class KllSketch:
+    """
+    KLL quantile sketch (Karnin, Lang, Liberty 2016).
+
+    Values are kept in levels of compactors; an item at level h stands for
+    2**h inputs. When the sketch exceeds its capacity, the lowest full level
+    is sorted and every other item (random offset) is promoted one level up.
+    Memory is O(k) regardless of how many values are added, rank error is
+    about 1.7/k, and two sketches merge by concatenating levels and
+    compacting, so merge order does not matter.
+    """
+
+    def __init__(
+        self,
+        k: int = DEFAULT_K,
+        levels: Optional[List[np.ndarray]] = None,
+        count: int = 0,
+    ) -> None:
+        self.k = k
+        self.levels: List[np.ndarray] = levels or [np.empty(0)]
+        self.count = count
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, values: np.ndarray) -> None:
+        if values.size == 0:
+            return
+        self.levels[0] = np.concatenate((self.levels[0], values.astype(np.float64)))
+        self.count += values.size
+        self._compress()
+
+    def merge(self, other: "KllSketch") -> None:
+        for level, items in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate((self.levels[level], items))
+        self.count += other.count
+        self._compress()
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Approximate value at rank q in [0, 1]."""
+        if self.count == 0:
+            return None
+        values = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [
+                np.full(items.size, 2.0**level)
+                for level, items in enumerate(self.levels)
+            ]
+        )
+        order = np.argsort(values, kind="stable")
+        cumulative = np.cumsum(weights[order])
+        index = np.searchsorted(cumulative, q * cumulative[-1], side="left")
+        return values[order[min(index, order.size - 1)]].item()
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, math.ceil(self.k * (2.0 / 3.0) ** depth))
+
+    def _compress(self) -> None:
+        while sum(items.size for items in self.levels) > sum(
+            self._capacity(level) for level in range(len(self.levels))
+        ):
+            for level, items in enumerate(self.levels):
+                if items.size < self._capacity(level):
+                    continue
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item out stays behind so weight is conserved
+                keep = items[-1:] if items.size % 2 else items[:0]
+                pairs = items[: items.size - keep.size]
+                promoted = pairs[_coin.getrandbits(1) :: 2]
+                self.levels[level + 1] = np.concatenate(
+                    (self.levels[level + 1], promoted)
+                )
+                self.levels[level] = keep
+                break
+
+
+@dataclass
+class MetricSketch:
+    """Moments plus a quantile sketch for one metric; mergeable."""
+
+    moments: Moments = field(default_factory=Moments)
+    quantiles: KllSketch = field(default_factory=KllSketch)
+
+    def add(self, values: np.ndarray) -> None:
+        values = values[~np.isnan(values)]
+        self.moments.add(values)
+        self.quantiles.add(values)
+
+    def merge(self, other: "MetricSketch") -> None:
+        self.moments.merge(other.moments)
+        self.quantiles.merge(other.quantiles)
+
+    def describe(self) -> Dict[str, Optional[float]]:
+        empty = self.moments.count == 0
+        return {
+            "count": self.moments.count,
+            "min": None if empty else self.moments.min,
+            "max": None if empty else self.moments.max,
+            "mean": self.moments.mean,
+            "std": self.moments.std,
+            "p25": self.quantiles.quantile(0.25),
+            "median": self.quantiles.quantile(0.5),
+            "p75": self.quantiles.quantile(0.75),
+        }
+
+
+METRICS = ("rent", "rent_per_sqft", "dom")
+
+
+@dataclass
+class ListingSketch:
+    """Rent, rent/sqft and days-on-market sketches for one group of listings."""
+
+    rent: MetricSketch = field(default_factory=MetricSketch)
+    rent_per_sqft: MetricSketch = field(default_factory=MetricSketch)
+    dom: MetricSketch = field(default_factory=MetricSketch)
+    listings: int = 0
+    # Epoch seconds of the newest observation merged in
+    updated_at: Optional[float] = None
+
+    def merge(self, other: "ListingSketch") -> None:
+        for name in METRICS:
+            getattr(self, name).merge(getattr(other, name))
+        self.listings += other.listings
+        if other.updated_at is not None:
+            self.updated_at = max(self.updated_at or 0.0, other.updated_at)
+
+    def describe(self) -> Dict[str, object]:
+        return {
+            "listings": self.listings,
+            "updated_at": self.updated_at,
+            **{name: getattr(self, name).describe() for name in METRICS},
+        }
+
+
+# Bedroom buckets per ZIP; larger homes share the last one
+MAX_BEDS_BUCKET = 6
+
+
+def beds_bucket(beds: Optional[float]) -> Optional[str]:
+    if beds is None or math.isnan(beds) or beds < 0:
+        return None
+    if beds >= MAX_BEDS_BUCKET:
+        return f"{MAX_BEDS_BUCKET}+"
+    return str(int(beds))
+
+
+def zip_key(zip_code: str, beds: Optional[str] = None) -> str:
+    return f"zip:{zip_code}" if beds is None else f"zip:{zip_code}:beds:{beds}"
+
+
+def sketch_listings(
+    rentals: Iterable[NormalizedListing],
+    k: int = DEFAULT_K,
+    observed_at: Optional[float] = None,
+) -> Dict[str, ListingSketch]:
+    """
+    Sketch a page of rentals per ZIP (`zip:<zip>`), per ZIP and bedroom
+    bucket (`zip:<zip>:beds:<0..5|6+>`) and per property type
+    (`type:<property_type>`), using the same fields and days-on-market rules
+    as regional metrics. Merge the result into stored sketches to grow
+    region-wide statistics across searches.
+    """
+    columns = ListingColumns.extract(list(rentals), None, None)
+    groups: Dict[str, np.ndarray] = {}
+    for code, name in enumerate(columns.zip_names):
+        # ZIP+4 listings count toward their five-digit ZIP
+        zip_code = _zip5(name)
+        in_zip = columns.zip_codes == code
+        _add_members(groups, zip_key(zip_code), in_zip)
+        for beds in np.unique(columns.beds[in_zip]).tolist():
+            bucket = beds_bucket(beds)
+            if bucket is not None:
+                members = in_zip & (columns.beds == beds)
+                _add_members(groups, zip_key(zip_code, bucket), members)
+    for code, name in enumerate(columns.property_names):
+        groups[f"type:{name}"] = columns.property_codes == code
+
+    return {
+        key: ListingSketch(
+            rent=_metric(columns.rent[members], k),
+            rent_per_sqft=_metric(columns.rent_per_sqft[members], k),
+            dom=_metric(columns.dom[members], k),
+            listings=int(members.sum()),
+            updated_at=observed_at,
+        )
+        for key, members in groups.items()
+    }
+
+
+def _add_members(groups: Dict[str, np.ndarray], key: str, members: np.ndarray) -> None:
+    groups[key] = groups[key] | members if key in groups else members
+
+
+def _zip5(zip_code: str) -> str:
+    """The five-digit ZIP of a ZIP or ZIP+4; anything else is kept as is."""
+    digits = zip_code.strip()[:5]
+    return digits if len(digits) == 5 and digits.isdigit() else zip_code
+
+
+def _metric(values: np.ndarray, k: int) -> MetricSketch:
+    sketch = MetricSketch(quantiles=KllSketch(k))
+    sketch.add(values)
+    return sketch
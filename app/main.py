@@ -1,14 +1,21 @@
 import logging
+from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.routes_comps import router as comps_router
+from app.api.routes_geocode import router as geocode_router
 from app.api.routes_rentals import router as rentals_router
 from app.api.routes_sales import router as sales_router
 from app.api.routes_utils import router as utils_router
+from app.api.routes_zips import router as zips_router
 from app.core.config import settings
+from app.providers.gazetteer.gazetteer import us_gazetteer
+from app.providers.redis.tiered_adapter import close_cache_invalidators
+from app.providers.shared.http_client import (close_http_clients,
+                                              init_http_clients)
 
 # Configure logging
 logging.basicConfig(
@@ -18,6 +25,22 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if settings.gazetteer_enabled and not us_gazetteer.available():
+        # Not fatal: ZIP and city geocodes fall back to the cache and OpenCage
+        logger.warning(
+            "GAZETTEER_ENABLED is set but no gazetteer is available; build it "
+            "with `python -m app.providers.gazetteer.build`"
+        )
+    # Provider HTTP clients are pooled for the lifetime of the app
+    await init_http_clients()
+    yield
+    await close_cache_invalidators()
+    await close_http_clients()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Rental Buddy API",
@@ -25,6 +48,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -40,6 +64,8 @@ app.add_middleware(
 app.include_router(rentals_router, prefix="/api/v1")
 app.include_router(sales_router, prefix="/api/v1")
 app.include_router(comps_router, prefix="/api/v1")
+app.include_router(geocode_router, prefix="/api/v1")
+app.include_router(zips_router, prefix="/api/v1")
 app.include_router(utils_router, prefix="/api/v1")
 
 
@@ -0,0 +1,109 @@
+"""
+Build the bundled gazetteer from the US Census Gazetteer files (ZCTAs and
+places, tab separated, public domain). Files not given are downloaded from
+the Census Bureau for --year.
+
+    python -m app.providers.gazetteer.build \
+        [--zcta 2023_Gaz_zcta_national.txt] \
+        [--places 2023_Gaz_place_national.txt] \
+        [--year 2023] \
+        [--output app/providers/gazetteer/data/us_centroids.bin]
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import re
+import tempfile
+import urllib.request
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterator, Tuple
+
+from app.providers.gazetteer.table import (DEFAULT_PATH, place_key,
+                                           write_gazetteer, zip_key)
+
+CENSUS_URL = (
+    "https://www2.census.gov/geo/docs/maps-data/data/gazetteer/"
+    "{year}_Gazetteer/{year}_Gaz_{layer}_national.zip"
+)
+DEFAULT_YEAR = 2023
+
+# Legal/statistical area suffixes in Census place names ("Austin city")
+_PLACE_SUFFIX = re.compile(
+    r"\s+(city and borough|consolidated government.*|metropolitan government.*|"
+    r"unified government.*|urban county|city|town|village|borough|"
+    r"municipality|comunidad|zona urbana|CDP)$"
+)
+
+
+def _rows(path: Path) -> Iterator[Dict[str, str]]:
+    with path.open(newline="", encoding="utf-8") as fh:
+        reader = csv.reader(fh, delimiter="\t")
+        header = [name.strip() for name in next(reader)]
+        for row in reader:
+            yield dict(zip(header, (value.strip() for value in row)))
+
+
+def read_zctas(path: Path) -> Dict[str, Tuple[float, float]]:
+    entries = {}
+    for row in _rows(path):
+        key = zip_key(row["GEOID"])
+        if key is not None:
+            entries[key] = (float(row["INTPTLAT"]), float(row["INTPTLONG"]))
+    return entries
+
+
+def read_places(path: Path) -> Dict[str, Tuple[float, float]]:
+    # Same name twice in a state (city and CDP): keep the larger land area
+    best: Dict[str, Tuple[int, float, float]] = {}
+    for row in _rows(path):
+        name = _PLACE_SUFFIX.sub("", row["NAME"])
+        key = place_key(name, row["USPS"])
+        if key is None:
+            continue
+        land = int(row.get("ALAND") or 0)
+        if key not in best or land > best[key][0]:
+            best[key] = (land, float(row["INTPTLAT"]), float(row["INTPTLONG"]))
+    return {key: (lat, lon) for key, (_, lat, lon) in best.items()}
+
+
+def download(layer: str, year: int, directory: Path) -> Path:
+    """Fetch one national Gazetteer file ("zcta" or "place") into directory."""
+    url = CENSUS_URL.format(year=year, layer=layer)
+    print(f"Downloading {url}")
+    with urllib.request.urlopen(url, timeout=120) as response:
+        archive = zipfile.ZipFile(io.BytesIO(response.read()))
+    (name,) = [name for name in archive.namelist() if name.endswith(".txt")]
+    return Path(archive.extract(name, directory))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--zcta", type=Path)
+    parser.add_argument("--places", type=Path)
+    parser.add_argument("--year", type=int, default=DEFAULT_YEAR)
+    parser.add_argument("--output", type=Path, default=DEFAULT_PATH)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as scratch:
+        zcta = args.zcta or download("zcta", args.year, Path(scratch))
+        places = args.places or download("place", args.year, Path(scratch))
+        entries = read_zctas(zcta)
+        zips = len(entries)
+        entries.update(read_places(places))
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    slots = write_gazetteer(args.output, entries)
+
+    size_kb = args.output.stat().st_size / 1024
+    print(
+        f"{zips} ZIPs, {len(entries) - zips} places, {slots} slots, "
+        f"{size_kb:.0f} KiB -> {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import logging
+import mmap
+from pathlib import Path
+from typing import Optional
+
+from app.core.config import settings
+from app.domain.dto import Center, ListingsRequest
+from app.domain.ports.gazetteer_port import GazetteerPort
+from app.providers.gazetteer.table import (DEFAULT_PATH, HEADER, MAGIC, SLOT,
+                                           key_hash, place_key, zip_key)
+
+logger = logging.getLogger(__name__)
+
+
+def centroid_key(request: ListingsRequest) -> Optional[str]:
+    """
+    Gazetteer key for city + state or ZIP requests, following the OpenCage
+    mapper's precedence; None when coordinates or a street address apply.
+    """
+    if request.latitude is not None and request.longitude is not None:
+        return None
+    if request.address and request.address.strip():
+        return None
+    if request.city and request.state:
+        return place_key(request.city, request.state)
+    if request.zip:
+        return zip_key(request.zip)
+    return None
+
+
+class MmapGazetteer(GazetteerPort):
+    """
+    Offline US ZIP and place centroids in a memory-mapped hash table.
+
+    The file is opened on first lookup; only the pages a lookup touches are
+    read from disk, and the mapping is shared by every worker on the host.
+    A missing or unreadable file disables the gazetteer (lookups return
+    None) so callers fall back to their cache and online geocoder;
+    `available` checks for that up front.
+    """
+
+    def __init__(self, path: Path | str = DEFAULT_PATH) -> None:
+        self.path = Path(path)
+        self._mm: Optional[mmap.mmap] = None
+        self._mask = 0
+        self._loaded = False
+
+    def lookup(self, request: ListingsRequest) -> Optional[Center]:
+        key = centroid_key(request)
+        if key is None:
+            return None
+        return self.get(key)
+
+    def get(self, key: str) -> Optional[Center]:
+        mm = self._open()
+        if mm is None:
+            return None
+        h = key_hash(key)
+        i = h & self._mask
+        while True:
+            slot_hash, lat, lon = SLOT.unpack_from(mm, HEADER.size + i * SLOT.size)
+            if slot_hash == 0:
+                return None
+            if slot_hash == h:
+                return Center(lat=lat / 1e6, lon=lon / 1e6)
+            i = (i + 1) & self._mask
+
+    def available(self) -> bool:
+        """Open the file now; False (and a logged warning) if it is unusable."""
+        return self._open() is not None
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+        self._mm = None
+        self._loaded = False
+
+    def _open(self) -> Optional[mmap.mmap]:
+        if self._loaded:
+            return self._mm
+        self._loaded = True
+        try:
+            with self.path.open("rb") as fh:
+                mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            logger.warning("Gazetteer unavailable at %s; using OpenCage", self.path)
+            return None
+
+        magic, capacity, count = (
+            HEADER.unpack_from(mm, 0) if len(mm) >= HEADER.size else (b"", 0, 0)
+        )
+        if magic != MAGIC or len(mm) != HEADER.size + capacity * SLOT.size:
+            logger.warning("Gazetteer at %s has an unknown format", self.path)
+            mm.close()
+            return None
+        self._mm = mm
+        self._mask = capacity - 1
+        logger.info("Gazetteer loaded: %s entries from %s", count, self.path)
+        return mm
+
+
+# Process-wide: one mapping per worker, opened on first use
+us_gazetteer = MmapGazetteer(settings.gazetteer_path or DEFAULT_PATH)
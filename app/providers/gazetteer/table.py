@@ -0,0 +1,138 @@
+"""
+Gazetteer file format and keys, shared by the reader and the build script.
+Nothing here loads app settings, so the file can be built without them.
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+import struct
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+DEFAULT_PATH = Path(__file__).parent / "data" / "us_centroids.bin"
+
+# File layout (little endian):
+#   header: magic, slot count (power of two), entry count
+#   slots:  open-addressing table of (64-bit key hash, lat, lon) where
+#           lat/lon are microdegrees and a zero hash marks an empty slot
+MAGIC = b"RBGAZ001"
+HEADER = struct.Struct("<8sII")
+SLOT = struct.Struct("<Qii")
+MAX_LOAD = 0.7
+
+US_STATES = {
+    "alabama": "al",
+    "alaska": "ak",
+    "arizona": "az",
+    "arkansas": "ar",
+    "california": "ca",
+    "colorado": "co",
+    "connecticut": "ct",
+    "delaware": "de",
+    "district of columbia": "dc",
+    "florida": "fl",
+    "georgia": "ga",
+    "hawaii": "hi",
+    "idaho": "id",
+    "illinois": "il",
+    "indiana": "in",
+    "iowa": "ia",
+    "kansas": "ks",
+    "kentucky": "ky",
+    "louisiana": "la",
+    "maine": "me",
+    "maryland": "md",
+    "massachusetts": "ma",
+    "michigan": "mi",
+    "minnesota": "mn",
+    "mississippi": "ms",
+    "missouri": "mo",
+    "montana": "mt",
+    "nebraska": "ne",
+    "nevada": "nv",
+    "new hampshire": "nh",
+    "new jersey": "nj",
+    "new mexico": "nm",
+    "new york": "ny",
+    "north carolina": "nc",
+    "north dakota": "nd",
+    "ohio": "oh",
+    "oklahoma": "ok",
+    "oregon": "or",
+    "pennsylvania": "pa",
+    "puerto rico": "pr",
+    "rhode island": "ri",
+    "south carolina": "sc",
+    "south dakota": "sd",
+    "tennessee": "tn",
+    "texas": "tx",
+    "utah": "ut",
+    "vermont": "vt",
+    "virginia": "va",
+    "washington": "wa",
+    "west virginia": "wv",
+    "wisconsin": "wi",
+    "wyoming": "wy",
+}
+_STATE_CODES = set(US_STATES.values())
+
+
+def _fold(text: str) -> str:
+    text = re.sub(r"[.,]", " ", text)
+    return re.sub(r"\s+", " ", text).strip().casefold()
+
+
+def normalize_state(state: str) -> Optional[str]:
+    """Two-letter lowercase code for a state code or name; None if unknown."""
+    folded = _fold(state)
+    if folded in _STATE_CODES:
+        return folded
+    return US_STATES.get(folded)
+
+
+def place_key(city: str, state: str) -> Optional[str]:
+    code = normalize_state(state)
+    name = _fold(city)
+    if code is None or not name:
+        return None
+    return f"place:{name}, {code}"
+
+
+def zip_key(zipcode: str) -> Optional[str]:
+    digits = zipcode.strip()[:5]
+    if len(digits) != 5 or not digits.isdigit():
+        return None
+    return f"zip:{digits}"
+
+
+def key_hash(key: str) -> int:
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    # Zero marks an empty slot
+    return int.from_bytes(digest, "little") or 1
+
+
+def write_gazetteer(path: Path | str, entries: Dict[str, Tuple[float, float]]) -> int:
+    """Write `{key: (lat, lon)}` as a gazetteer file; returns the slot count."""
+    capacity = 1
+    while capacity * MAX_LOAD < max(len(entries), 1):
+        capacity *= 2
+    mask = capacity - 1
+
+    table = bytearray(HEADER.size + capacity * SLOT.size)
+    HEADER.pack_into(table, 0, MAGIC, capacity, len(entries))
+    for key, (lat, lon) in entries.items():
+        h = key_hash(key)
+        i = h & mask
+        while SLOT.unpack_from(table, HEADER.size + i * SLOT.size)[0] != 0:
+            i = (i + 1) & mask
+        SLOT.pack_into(
+            table,
+            HEADER.size + i * SLOT.size,
+            h,
+            round(lat * 1e6),
+            round(lon * 1e6),
+        )
+
+    Path(path).write_bytes(bytes(table))
+    return capacity
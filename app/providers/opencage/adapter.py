@@ -1,13 +1,17 @@
+from typing import Optional
+
 from app.domain.dto import Center, ListingsRequest
 from app.domain.ports.geocoding_port import GeocodingPort
 from app.providers.opencage.client import OpenCageClient
-from app.providers.opencage.mapper import build_params
+from app.providers.opencage.mapper import build_params, normalize_query
 from app.providers.opencage.normalizer import normalize_response
+from app.providers.opencage.quota import RateWindow, opencage_rate
 
 
 class OpenCageAdapter(GeocodingPort):
-    def __init__(self, client: OpenCageClient):
+    def __init__(self, client: OpenCageClient, rate: Optional[RateWindow] = None):
         self.client = client
+        self.rate = rate if rate is not None else opencage_rate
 
     async def geocode(self, request: ListingsRequest) -> Center:
         """
@@ -25,4 +29,14 @@ class OpenCageAdapter(GeocodingPort):
         """
         params = build_params(request)
         response = await self.client.geocode(params)
+        if isinstance(response, dict) and isinstance(response.get("rate"), dict):
+            self.rate.update(response["rate"])
         return normalize_response(response)
+
+    def cache_key(self, request: ListingsRequest) -> str:
+        """Normalized OpenCage query for `request` (see `normalize_query`)."""
+        return normalize_query(build_params(request))
+
+    def call_budget(self) -> Optional[int]:
+        """Calls left in OpenCage's current rate window (None if unknown)."""
+        return self.rate.remaining()
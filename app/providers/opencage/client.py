@@ -3,6 +3,8 @@ from __future__ import annotations
 import logging
 from typing import Any, Dict
 
+import httpx
+
 from app.core.config import settings
 from app.domain.enums.context_request import OperationType
 from app.providers.enums.provider import Provider
@@ -28,10 +30,13 @@ class OpenCageClient:
         api_key: str | None = None,
         geocode_url: str | None = None,
         timeout_seconds: int | float | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ):
         self.api_key = api_key or settings.opencage_api_key
         self.geocode_url = geocode_url or settings.opencage_url
         self.timeout = timeout_seconds or settings.request_timeout_seconds
+        # None borrows the app-lifetime pooled client at call time
+        self.http_client = http_client
 
     async def geocode(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -50,4 +55,5 @@ class OpenCageClient:
             OperationType.GEOCODING,
             Provider.OPENCAGE,
             dict,
+            client=self.http_client,
         )
@@ -1,5 +1,6 @@
+import re
 from typing import Dict
-from urllib.parse import quote
+from urllib.parse import quote, unquote
 
 from app.domain.dto import ListingsRequest  # adjust import as needed
 
@@ -64,3 +65,17 @@ def build_params(req: ListingsRequest) -> Dict[str, str]:
     params["q"] = ""  # or raise an exception depending on your design
 
     return params
+
+
+def normalize_query(params: Dict[str, str]) -> str:
+    """
+    Cache key form of `build_params` output, so spellings that OpenCage
+    resolves identically share a key: "123 Main St.,Austin , TX" and
+    "123 main st, austin, tx" both become "123 main st, austin, tx".
+    """
+    q = unquote(params.get("q", ""))
+    # Abbreviation dots ("St.", "N.W."), not decimal points
+    q = re.sub(r"(?<=[^\W\d])\.", "", q)
+    q = re.sub(r"\s*,\s*", ", ", q)
+    q = re.sub(r"\s+", " ", q)
+    return q.strip(" ,").casefold()
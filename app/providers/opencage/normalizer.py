@@ -1,8 +1,21 @@
+from typing import Any, Dict, Union
+
+from pydantic import ValidationError
+
 from app.domain.dto import Center
+from app.domain.exceptions.provider_exceptions import (ProviderNoResultsError,
+                                                       ProviderParsingError)
 from app.providers.opencage.models import GeocodeResponse
 
 
-def normalize_response(response: GeocodeResponse) -> Center:
+def normalize_response(response: Union[GeocodeResponse, Dict[str, Any]]) -> Center:
+    if isinstance(response, dict):
+        try:
+            response = GeocodeResponse.model_validate(response)
+        except ValidationError as e:
+            raise ProviderParsingError("opencage unexpected payload") from e
+    if not response.results:
+        raise ProviderNoResultsError("opencage returned no results")
     return Center(
         lat=response.results[0].geometry.lat, lon=response.results[0].geometry.lng
     )
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, Optional
+
+
+class RateWindow:
+    """
+    Calls left in OpenCage's current rate window, from the `rate` block
+    (`limit`, `remaining`, `reset` epoch seconds) it returns with each
+    response. Accounts without a hard limit get no block, and the budget
+    stays unknown (None).
+    """
+
+    def __init__(self) -> None:
+        self.limit: Optional[int] = None
+        self._remaining: Optional[int] = None
+        self._reset_at: Optional[float] = None
+
+    def update(self, rate: Dict[str, Any]) -> None:
+        try:
+            remaining = int(rate["remaining"])
+            reset_at = float(rate["reset"])
+        except (KeyError, TypeError, ValueError):
+            return
+        self.limit = rate.get("limit", self.limit)
+        self._remaining = max(0, remaining)
+        self._reset_at = reset_at
+
+    def remaining(self, now: float | None = None) -> Optional[int]:
+        """Calls left before `reset`; None when unknown or the window reset."""
+        if self._remaining is None:
+            return None
+        now = time.time() if now is None else now
+        if self._reset_at is not None and now >= self._reset_at:
+            return None
+        return self._remaining
+
+    def snapshot(self) -> dict:
+        return {
+            "limit": self.limit,
+            "remaining": self._remaining,
+            "reset": self._reset_at,
+        }
+
+
+# Process-wide: shared by every OpenCageAdapter instance
+opencage_rate = RateWindow()
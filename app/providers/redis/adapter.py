@@ -1,26 +1,52 @@
 # app/providers/cache/redis_cache_adapter.py
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Callable, Generic, Optional, Type, TypeVar
+import math
+import random
+import time
+import uuid
+from typing import Callable, Generic, Optional, Tuple, Type, TypeVar
 
 from pydantic import BaseModel
 from redis.asyncio import Redis, RedisError
 
 from app.core.config import settings
 from app.domain.ports.caching_port import CachePort
+from app.providers.redis.codecs import CacheCodec
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
+# Compare-and-delete so a worker only releases the lease it still holds
+_RELEASE_LEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# Entry header carrying XFetch metadata: "xf1 <compute_seconds> <expiry>\n"
+_XFETCH_HEADER = b"xf1 "
+
 
 class RedisModelCacheAdapter(CachePort[T], Generic[T]):
     """
     Redis-backed cache for Pydantic models.
 
     - Keys: str, namespaced with a prefix
-    - Values: Pydantic models serialized as JSON
+    - Values: Pydantic models serialized as JSON, or with `codec` (a tagged
+      binary format); JSON entries stay readable after switching codecs
+    - Leases (optional): SET NX PX locks under `<prefix>:lease:<key>` so only
+      one worker refills a missing key while the others wait for the value
+    - XFetch (optional, xfetch_beta > 0): entries carry their compute cost
+      and expiry; a read may report a miss shortly before expiry, with a
+      probability that grows with the cost and as expiry nears, so refreshes
+      of a hot key spread out instead of stampeding at the TTL
+    - TTL jitter (optional): each TTL is shortened by up to
+      `ttl_jitter_ratio` so keys written together do not expire together
     """
 
     def __init__(
@@ -32,6 +58,11 @@ class RedisModelCacheAdapter(CachePort[T], Generic[T]):
         # Optional custom serializer/deserializer if you ever need them:
         serializer: Callable[[T], str] | None = None,
         deserializer: Callable[[str], T] | None = None,
+        codec: CacheCodec[T] | None = None,
+        lease_ttl_ms: int | None = None,
+        lease_poll_interval_ms: int = 50,
+        xfetch_beta: float = 0.0,
+        ttl_jitter_ratio: float = 0.0,
     ) -> None:
         self._redis = redis
         self._model_cls = model_cls
@@ -39,8 +70,20 @@ class RedisModelCacheAdapter(CachePort[T], Generic[T]):
         self._default_ttl = default_ttl or settings.cache_ttl_seconds
         self._serializer = serializer or self._default_serialize
         self._deserializer = deserializer or self._default_deserialize
+        self._codec = codec
+        self._lease_ttl_ms = lease_ttl_ms
+        self._lease_poll_interval = lease_poll_interval_ms / 1000
+        self._xfetch_beta = xfetch_beta
+        self._ttl_jitter_ratio = ttl_jitter_ratio
+
+    @property
+    def leases_enabled(self) -> bool:
+        return self._lease_ttl_ms is not None
+
+    async def get(self, key: str, early_expiry: bool = True) -> Optional[T]:
+        return await self._get(key, early_expiry=early_expiry)
 
-    async def get(self, key: str) -> Optional[T]:
+    async def _get(self, key: str, early_expiry: bool) -> Optional[T]:
         full_key = self._key(key)
 
         try:
@@ -54,11 +97,13 @@ class RedisModelCacheAdapter(CachePort[T], Generic[T]):
             return None
 
         try:
-            if isinstance(raw, bytes):
-                raw_str = raw.decode("utf-8")
-            else:
-                raw_str = raw  # decode_responses=False but just in case
-            value = self._deserializer(raw_str)
+            if isinstance(raw, str):
+                raw = raw.encode("utf-8")  # decode_responses=True clients
+            payload, compute_seconds, expiry = _split_header(raw)
+            if early_expiry and self._expire_early(compute_seconds, expiry):
+                logger.debug("Redis cache EARLY EXPIRY: %s", full_key)
+                return None
+            value = self._decode(payload)
             logger.debug("Redis cache HIT: %s", full_key)
             return value
         except Exception:
@@ -67,14 +112,47 @@ class RedisModelCacheAdapter(CachePort[T], Generic[T]):
             await self._redis.delete(full_key)
             return None
 
-    async def set(self, key: str, value: T, ttl_seconds: int | None = None) -> None:
+    async def set(
+        self,
+        key: str,
+        value: T,
+        ttl_seconds: int | None = None,
+        compute_seconds: float | None = None,
+    ) -> None:
         full_key = self._key(key)
-        raw = self._serializer(value)
-        ttl = ttl_seconds or self._default_ttl
+        raw = self._codec.encode(value) if self._codec else self._serializer(value)
+        ttl = self._jittered(ttl_seconds or self._default_ttl)
+
+        if self._xfetch_beta > 0:
+            expiry = time.time() + ttl
+            header = f"{compute_seconds or 0.0:.4f} {expiry:.3f}\n".encode("ascii")
+            if isinstance(raw, str):
+                raw = raw.encode("utf-8")
+            raw = _XFETCH_HEADER + header + raw
 
         await self._redis.set(full_key, raw, ex=ttl)
         logger.debug("Redis cache SET: %s (ttl=%s)", full_key, ttl)
 
+    def _decode(self, payload: bytes) -> T:
+        if self._codec is not None and payload.startswith(self._codec.tag):
+            return self._codec.decode(payload)
+        return self._deserializer(payload.decode("utf-8"))
+
+    def _jittered(self, ttl: int) -> int:
+        if self._ttl_jitter_ratio <= 0:
+            return ttl
+        return max(1, math.ceil(ttl * (1 - random.random() * self._ttl_jitter_ratio)))
+
+    def _expire_early(self, compute_seconds: float, expiry: Optional[float]) -> bool:
+        """
+        XFetch: recompute once now - delta * beta * ln(rand) >= expiry, where
+        delta is the time the value took to compute.
+        """
+        if self._xfetch_beta <= 0 or expiry is None or compute_seconds <= 0:
+            return False
+        gap = -compute_seconds * self._xfetch_beta * math.log(1.0 - random.random())
+        return time.time() + gap >= expiry
+
     async def delete(self, key: str) -> None:
         full_key = self._key(key)
         await self._redis.delete(full_key)
@@ -97,6 +175,67 @@ class RedisModelCacheAdapter(CachePort[T], Generic[T]):
                 break
         logger.info("Redis cache CLEARED for prefix: %s", self._prefix)
 
+    async def acquire_lease(self, key: str) -> Optional[str]:
+        """
+        Try to become the single worker allowed to fill `key`.
+
+        Returns a lease token on success, or None if another worker holds it.
+        If Redis is unavailable the caller is treated as the leaseholder.
+        """
+        lease_key = self._lease_key(key)
+        token = uuid.uuid4().hex
+        try:
+            acquired = await self._redis.set(
+                lease_key, token, nx=True, px=self._lease_ttl_ms
+            )
+        except RedisError:
+            logger.exception("Failed to acquire cache lease: %s", lease_key)
+            return token
+
+        if not acquired:
+            logger.debug("Redis cache lease BUSY: %s", lease_key)
+            return None
+        logger.debug("Redis cache lease ACQUIRED: %s", lease_key)
+        return token
+
+    async def release_lease(self, key: str, token: str) -> None:
+        lease_key = self._lease_key(key)
+        try:
+            await self._redis.eval(_RELEASE_LEASE_SCRIPT, 1, lease_key, token)
+        except RedisError:
+            # The lease still expires on its own after lease_ttl_ms
+            logger.exception("Failed to release cache lease: %s", lease_key)
+
+    async def wait_for_value(self, key: str, timeout_seconds: float) -> Optional[T]:
+        """
+        Poll for a value another worker is filling.
+
+        Returns None once the wait is exhausted, or early if the lease is
+        gone without a value (the leaseholder failed), so the caller can
+        fall back to fetching itself.
+        """
+        deadline = time.monotonic() + timeout_seconds
+        lease_key = self._lease_key(key)
+        while True:
+            # A peer is refilling; take whatever is there without XFetch
+            value = await self._get(key, early_expiry=False)
+            if value is not None:
+                return value
+            try:
+                if not await self._redis.exists(lease_key):
+                    return None
+            except RedisError:
+                logger.exception("Failed to check cache lease: %s", lease_key)
+                return None
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                logger.info("Redis cache lease wait TIMEOUT: %s", lease_key)
+                return None
+            await asyncio.sleep(min(self._lease_poll_interval, remaining))
+
+    def _lease_key(self, key: str) -> str:
+        return f"{self._prefix}:lease:{key}"
+
     def _key(self, key: str) -> str:
         return f"{self._prefix}:{key}"
 
@@ -111,3 +250,12 @@ class RedisModelCacheAdapter(CachePort[T], Generic[T]):
         if hasattr(self._model_cls, "model_validate_json"):
             return self._model_cls.model_validate_json(raw)
         return self._model_cls.parse_raw(raw)
+
+
+def _split_header(raw: bytes) -> Tuple[bytes, float, Optional[float]]:
+    """Return (payload, compute_seconds, expiry); plain entries have no header."""
+    if not raw.startswith(_XFETCH_HEADER):
+        return raw, 0.0, None
+    header, _, payload = raw.partition(b"\n")
+    compute_seconds, expiry = header[len(_XFETCH_HEADER) :].split()
+    return payload, float(compute_seconds), float(expiry)
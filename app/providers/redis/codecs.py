@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import json
+import math
+import struct
+import zlib
+from typing import (Any, Dict, Generic, List, Optional, Protocol, Tuple, Type,
+                    TypeVar)
+
+import numpy as np
+from pydantic import BaseModel
+
+from app.domain.dto import CachedListings, NormalizedListing
+from app.domain.sketches import (METRICS, KllSketch, ListingSketch,
+                                 MetricSketch, Moments)
+
+T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
+
+
+class CacheCodec(Protocol, Generic[T]):
+    """
+    Binary encoding for cached values.
+
+    `tag` prefixes every encoded value so readers can tell formats (and
+    versions) apart; bump it whenever the layout changes.
+    """
+
+    tag: bytes
+
+    def encode(self, value: T) -> bytes:
+        ...
+
+    def decode(self, data: bytes) -> T:
+        ...
+
+
+# (field name, nested model class or None, nested field names)
+_Layout = List[Tuple[str, Optional[Type[BaseModel]], List[str]]]
+
+
+def _layout_of(model_cls: Type[BaseModel]) -> _Layout:
+    layout: _Layout = []
+    for name, info in model_cls.model_fields.items():
+        annotation = info.annotation
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            layout.append((name, annotation, list(annotation.model_fields)))
+        else:
+            layout.append((name, None, []))
+    return layout
+
+
+class CachedListingsCodec:
+    """
+    Columnar, zlib-compressed encoding of CachedListings (format v1).
+
+    Each leaf field of NormalizedListing becomes one column, e.g.
+    "pricing.list_price": [2450, 1800, ...]. A column whose values are all
+    equal ("pricing.currency", "provider.name", ...) is stored once as
+    {"c": value}. Field names therefore appear once per entry rather than
+    once per listing, and the repetitive result compresses well.
+
+    Decoding rebuilds models directly, skipping validation: only values this
+    codec encoded from validated models are trusted. Columns missing from an
+    older entry fall back to field defaults.
+    """
+
+    tag = b"RBL1"
+
+    def __init__(self, compress_level: int = 6) -> None:
+        self.compress_level = compress_level
+        self._layout = _layout_of(NormalizedListing)
+
+    def encode(self, value: CachedListings) -> bytes:
+        items = value.items
+        columns: Dict[str, Any] = {}
+        for name, sub_cls, sub_fields in self._layout:
+            objs = [getattr(listing, name) for listing in items]
+            if sub_cls is None:
+                columns[name] = _fold(objs)
+                continue
+            for sub in sub_fields:
+                columns[f"{name}.{sub}"] = _fold([getattr(o, sub) for o in objs])
+
+        doc = {"n": len(items), "fetched_at": value.fetched_at, "cols": columns}
+        if value.error is not None:
+            doc["error"] = value.error
+        raw = json.dumps(doc, separators=(",", ":")).encode("utf-8")
+        return self.tag + zlib.compress(raw, self.compress_level)
+
+    def decode(self, data: bytes) -> CachedListings:
+        if not data.startswith(self.tag):
+            raise ValueError("Unknown cached listings format")
+        doc = json.loads(zlib.decompress(data[len(self.tag) :]))
+        count = doc["n"]
+        columns = doc["cols"]
+
+        def column(key: str) -> Optional[List[Any]]:
+            values = columns.get(key)
+            if isinstance(values, dict):
+                return [values["c"]] * count
+            return values
+
+        fields: Dict[str, List[Any]] = {}
+        for name, sub_cls, sub_fields in self._layout:
+            if sub_cls is None:
+                values = column(name)
+                if values is not None:
+                    fields[name] = values
+                continue
+            fields[name] = _construct_rows(
+                sub_cls, {sub: column(f"{name}.{sub}") for sub in sub_fields}, count
+            )
+
+        items = _construct_rows(NormalizedListing, fields, count)
+        return _construct(
+            CachedListings,
+            {
+                "items": items,
+                "fetched_at": doc.get("fetched_at"),
+                "error": doc.get("error"),
+            },
+        )
+
+
+class ListingSketchCodec:
+    """
+    Binary encoding of ListingSketch (format v2), little endian:
+
+        listing count (q), updated at (d, NaN when unknown)
+        per metric (rent, rent/sqft, dom):
+            moments: count (q), sum, sum of squares, min, max (d)
+            KLL: k (I), count (q), level count (I)
+            per level: item count (I), then the items as float64
+    """
+
+    tag = b"RBS2"
+
+    _HEADER = struct.Struct("<qd")
+    _MOMENTS = struct.Struct("<qdddd")
+    _KLL = struct.Struct("<IqI")
+    _LEVEL = struct.Struct("<I")
+
+    def encode(self, value: ListingSketch) -> bytes:
+        updated_at = math.nan if value.updated_at is None else value.updated_at
+        parts = [self.tag, self._HEADER.pack(value.listings, updated_at)]
+        for name in METRICS:
+            metric: MetricSketch = getattr(value, name)
+            m = metric.moments
+            parts.append(self._MOMENTS.pack(m.count, m.total, m.total_sq, m.min, m.max))
+            kll = metric.quantiles
+            parts.append(self._KLL.pack(kll.k, kll.count, len(kll.levels)))
+            for items in kll.levels:
+                parts.append(self._LEVEL.pack(items.size))
+                parts.append(items.astype("<f8").tobytes())
+        return b"".join(parts)
+
+    def decode(self, data: bytes) -> ListingSketch:
+        if not data.startswith(self.tag):
+            raise ValueError("Unknown listing sketch format")
+        offset = len(self.tag)
+        listings, updated_at = self._HEADER.unpack_from(data, offset)
+        offset += self._HEADER.size
+
+        metrics: Dict[str, MetricSketch] = {}
+        for name in METRICS:
+            moments = Moments(*self._MOMENTS.unpack_from(data, offset))
+            offset += self._MOMENTS.size
+            k, count, level_count = self._KLL.unpack_from(data, offset)
+            offset += self._KLL.size
+            levels = []
+            for _ in range(level_count):
+                (size,) = self._LEVEL.unpack_from(data, offset)
+                offset += self._LEVEL.size
+                levels.append(
+                    np.frombuffer(data, dtype="<f8", count=size, offset=offset).copy()
+                )
+                offset += size * 8
+            metrics[name] = MetricSketch(moments, KllSketch(k, levels, count))
+        if offset != len(data):
+            raise ValueError("Trailing bytes in listing sketch")
+        return ListingSketch(
+            **metrics,
+            listings=listings,
+            updated_at=None if math.isnan(updated_at) else updated_at,
+        )
+
+
+_new = object.__new__
+_setattr = object.__setattr__
+
+
+def _construct(model_cls: Type[M], values: Dict[str, Any]) -> M:
+    """
+    Trusted construct: like `model_construct` without its per-call default
+    and alias handling. `values` must hold every field of `model_cls`.
+    """
+    obj = _new(model_cls)
+    _setattr(obj, "__dict__", values)
+    _setattr(obj, "__pydantic_fields_set__", set(values))
+    _setattr(obj, "__pydantic_extra__", None)
+    _setattr(obj, "__pydantic_private__", None)
+    return obj
+
+
+def _construct_rows(
+    model_cls: Type[M], columns: Dict[str, Optional[List[Any]]], count: int
+) -> List[M]:
+    """Build `count` models from columns; missing columns use field defaults."""
+    present = [name for name, values in columns.items() if values is not None]
+    missing = [
+        (name, info)
+        for name, info in model_cls.model_fields.items()
+        if name not in present
+    ]
+    rows = zip(*(columns[name] for name in present)) if present else [()] * count
+
+    if not missing:
+        return [_construct(model_cls, dict(zip(present, row))) for row in rows]
+
+    result = []
+    for row in rows:
+        values = {
+            name: info.get_default(call_default_factory=True) for name, info in missing
+        }
+        values.update(zip(present, row))
+        result.append(_construct(model_cls, values))
+    return result
+
+
+def _fold(values: List[Any]) -> Any:
+    """Store a column once when every value is the same."""
+    if values and all(v == values[0] for v in values):
+        return {"c": values[0]}
+    return values
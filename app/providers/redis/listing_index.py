@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import logging
+import time
+from typing import List, Optional, Tuple
+
+from pydantic import TypeAdapter
+from redis.asyncio import Redis, RedisError
+
+from app.core.config import settings
+from app.domain.dto import NormalizedListing
+from app.domain.ports.listing_index_port import ListingIndexPort
+
+logger = logging.getLogger(__name__)
+
+_listings_adapter = TypeAdapter(List[NormalizedListing])
+
+# Keys per MGET inside a lookup pipeline
+MGET_BATCH_SIZE = 100
+
+# A provider id names a property, so its rental and sale listings share it
+CATEGORIES = ("rental", "sale")
+
+
+class RedisListingIndex(ListingIndexPort):
+    """
+    Shared listing-by-id index in Redis.
+
+    - `<prefix>:listing:<category>:<id>`: one NormalizedListing (JSON) with
+      a TTL that is refreshed every time the listing is registered again
+    - `<prefix>:listing-ids`: sorted set of `<category>:<id>` by last
+      registration time, used to keep at most `max_entries` bodies (oldest
+      are dropped first)
+
+    Listings without a provider id (the `unknown` placeholder) are never
+    stored; they would all share one key.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        prefix: str,
+        ttl_seconds: int | None = None,
+        max_entries: int | None = None,
+    ) -> None:
+        self._redis = redis
+        self._prefix = prefix.rstrip(":")
+        self.ttl_seconds = ttl_seconds or settings.cache_listing_ttl_seconds
+        self.max_entries = max_entries or settings.listing_index_max_entries
+
+    async def register(
+        self, listings: List[NormalizedListing], ttl_seconds: int | None = None
+    ) -> None:
+        listings = [listing for listing in listings if listing.has_id]
+        if not listings:
+            return
+        ttl = max(self.ttl_seconds, ttl_seconds or 0)
+        now = time.time()
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for listing in listings:
+                    pipe.set(
+                        self._listing_key(listing.category, listing.id),
+                        listing.model_dump_json(),
+                        ex=ttl,
+                    )
+                pipe.zadd(
+                    self._ids_key,
+                    {
+                        _member(listing.category, listing.id): now
+                        for listing in listings
+                    },
+                )
+                pipe.zremrangebyscore(self._ids_key, "-inf", now - ttl)
+                pipe.zcard(self._ids_key)
+                results = await pipe.execute()
+            await self._trim(results[-1])
+        except RedisError:
+            logger.exception("Failed to register %s listings", len(listings))
+
+    async def resolve(
+        self, ids: List[str], category: Optional[str] = None
+    ) -> Tuple[List[NormalizedListing], List[str]]:
+        """
+        Without a category, every category's listing under each id is
+        returned (rental before sale).
+        """
+        categories = [category] if category is not None else list(CATEGORIES)
+        keys = [self._listing_key(cat, id_) for id_ in ids for cat in categories]
+        bodies = await self._get_keys(keys)
+        found: List[NormalizedListing] = []
+        missing: List[str] = []
+        for position, id_ in enumerate(ids):
+            start = position * len(categories)
+            matches = [b for b in bodies[start : start + len(categories)] if b]
+            found.extend(matches)
+            if not matches:
+                missing.append(id_)
+        return found, missing
+
+    async def get_many(
+        self, ids: List[str], category: str
+    ) -> List[Optional[NormalizedListing]]:
+        """Look up listings in one pipelined round trip; None where missing."""
+        return await self._get_keys([self._listing_key(category, id_) for id_ in ids])
+
+    async def _get_keys(self, keys: List[str]) -> List[Optional[NormalizedListing]]:
+        if not keys:
+            return []
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for start in range(0, len(keys), MGET_BATCH_SIZE):
+                    pipe.mget(keys[start : start + MGET_BATCH_SIZE])
+                batches = await pipe.execute()
+        except RedisError:
+            logger.exception("Failed to look up %s listings", len(keys))
+            return [None] * len(keys)
+
+        bodies = [body for batch in batches for body in batch]
+        present = [body for body in bodies if body is not None]
+        if not present:
+            return [None] * len(keys)
+
+        raw = b"[" + b",".join(_as_bytes(body) for body in present) + b"]"
+        try:
+            decoded = iter(_listings_adapter.validate_json(raw))
+        except ValueError:
+            logger.exception("Failed to decode cached listing bodies")
+            return [None] * len(keys)
+        return [None if body is None else next(decoded) for body in bodies]
+
+    async def clear(self) -> None:
+        pattern = f"{self._prefix}:listing:*"
+        cursor: int | str = 0
+        while True:
+            cursor, keys = await self._redis.scan(
+                cursor=cursor, match=pattern, count=100
+            )
+            if keys:
+                await self._redis.delete(*keys)
+            if cursor == 0:
+                break
+        await self._redis.delete(self._ids_key)
+
+    async def _trim(self, size: int) -> None:
+        excess = size - self.max_entries
+        if excess <= 0:
+            return
+        evicted = await self._redis.zpopmin(self._ids_key, excess)
+        if evicted:
+            await self._redis.delete(
+                *(
+                    self._listing_key(*_as_str(member).split(":", 1))
+                    for member, _ in evicted
+                )
+            )
+            logger.info("Listing index trimmed %s entries", len(evicted))
+
+    @property
+    def _ids_key(self) -> str:
+        return f"{self._prefix}:listing-ids"
+
+    def _listing_key(self, category: str, listing_id: str) -> str:
+        return f"{self._prefix}:listing:{category}:{listing_id}"
+
+
+def _member(category: str, listing_id: str) -> str:
+    return f"{category}:{listing_id}"
+
+
+def _as_bytes(body: bytes | str) -> bytes:
+    return body.encode("utf-8") if isinstance(body, str) else body
+
+
+def _as_str(value: bytes | str) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import logging
+from typing import Optional
+
+from app.domain.dto import CachedListings, CachedSearchRefs, is_placeholder_id
+from app.domain.ports.caching_port import CachePort
+from app.providers.redis.adapter import RedisModelCacheAdapter
+from app.providers.redis.listing_index import RedisListingIndex
+
+logger = logging.getLogger(__name__)
+
+
+class NormalizedListingsCacheAdapter(CachePort[CachedListings]):
+    """
+    Listings cache that stores each listing body once.
+
+    - bodies: kept by the shared RedisListingIndex under
+      `<prefix>:listing:<category>:<id>` and re-registered with a fresh TTL
+      whenever any search returns them, so every search containing a
+      listing sees the latest copy
+    - searches: ordered id lists (CachedSearchRefs) kept by `searches`,
+      which brings its own leases, XFetch and TTL jitter. Listings without a
+      provider id cannot be shared, so their bodies stay in the search entry
+
+    A hit is rehydrated with one pipelined round of MGETs. If any body has
+    expired the search is reported as a miss rather than served short.
+    """
+
+    def __init__(
+        self,
+        searches: RedisModelCacheAdapter[CachedSearchRefs],
+        index: RedisListingIndex,
+    ) -> None:
+        self.searches = searches
+        self.index = index
+
+    @property
+    def leases_enabled(self) -> bool:
+        return self.searches.leases_enabled
+
+    async def get(
+        self, key: str, early_expiry: bool = True
+    ) -> Optional[CachedListings]:
+        refs = await self.searches.get(key, early_expiry=early_expiry)
+        if refs is None:
+            return None
+        return await self._rehydrate(key, refs)
+
+    async def set(
+        self,
+        key: str,
+        value: CachedListings,
+        ttl_seconds: int | None = None,
+        compute_seconds: float | None = None,
+    ) -> None:
+        # Bodies must outlive every search that references them
+        await self.index.register(value.items, ttl_seconds)
+        refs = CachedSearchRefs(
+            ids=[listing.id for listing in value.items],
+            category=value.items[0].category if value.items else None,
+            unkeyed=[listing for listing in value.items if not listing.has_id],
+            fetched_at=value.fetched_at,
+            provider=value.items[0].provider.name if value.items else None,
+            error=value.error,
+        )
+        await self.searches.set(key, refs, ttl_seconds, compute_seconds)
+
+    async def delete(self, key: str) -> None:
+        # Bodies are shared with other searches; they expire on their own
+        await self.searches.delete(key)
+
+    async def clear(self) -> None:
+        await self.searches.clear()
+        await self.index.clear()
+
+    async def acquire_lease(self, key: str) -> Optional[str]:
+        return await self.searches.acquire_lease(key)
+
+    async def release_lease(self, key: str, token: str) -> None:
+        await self.searches.release_lease(key, token)
+
+    async def wait_for_value(
+        self, key: str, timeout_seconds: float
+    ) -> Optional[CachedListings]:
+        refs = await self.searches.wait_for_value(key, timeout_seconds)
+        if refs is None:
+            return None
+        return await self._rehydrate(key, refs)
+
+    async def _rehydrate(
+        self, key: str, refs: CachedSearchRefs
+    ) -> Optional[CachedListings]:
+        keyed = [id_ for id_ in refs.ids if not is_placeholder_id(id_)]
+        if keyed and refs.category is None:
+            # Written before bodies were keyed by category
+            return None
+        bodies = iter(await self.index.get_many(keyed, refs.category))
+        unkeyed = iter(refs.unkeyed)
+        items = [
+            next(unkeyed) if is_placeholder_id(id_) else next(bodies)
+            for id_ in refs.ids
+        ]
+        if any(item is None for item in items):
+            logger.info("Listings cache body EXPIRED: %s", key)
+            return None
+        return CachedListings(items=items, fetched_at=refs.fetched_at, error=refs.error)
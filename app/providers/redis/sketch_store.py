@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import logging
+import struct
+from typing import Dict, List, Optional
+
+from redis.asyncio import Redis, RedisError
+from redis.exceptions import WatchError
+
+from app.core.config import settings
+from app.domain.ports.sketch_store_port import SketchStorePort
+from app.domain.sketches import ListingSketch
+from app.providers.redis.codecs import ListingSketchCodec
+
+logger = logging.getLogger(__name__)
+
+# Optimistic transaction attempts before a merge is dropped
+MAX_MERGE_ATTEMPTS = 5
+
+
+class RedisSketchStore(SketchStorePort):
+    """
+    Listing sketches in Redis under `<prefix>:sketch:<key>`.
+
+    Merges are read-modify-write inside WATCH/MULTI, so concurrent workers
+    folding in their own searches never lose each other's updates; a merge
+    that keeps conflicting is dropped after MAX_MERGE_ATTEMPTS (merge then
+    returns False). Every merge refreshes the key's TTL.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        prefix: str,
+        ttl_seconds: int | None = None,
+        codec: Optional[ListingSketchCodec] = None,
+    ) -> None:
+        self._redis = redis
+        self._prefix = prefix.rstrip(":")
+        self.ttl_seconds = ttl_seconds or settings.sketch_ttl_seconds
+        self.codec = codec or ListingSketchCodec()
+
+    async def merge(self, sketches: Dict[str, ListingSketch]) -> bool:
+        if not sketches:
+            return True
+        names = list(sketches)
+        keys = [self._key(name) for name in names]
+        try:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                for _ in range(MAX_MERGE_ATTEMPTS):
+                    try:
+                        await pipe.watch(*keys)
+                        stored = await pipe.mget(keys)
+                        pipe.multi()
+                        for name, key, raw in zip(names, keys, stored):
+                            # The first merge stores the incoming sketch as
+                            # is, keeping its k
+                            merged = self._decode(raw, key)
+                            if merged is None:
+                                merged = sketches[name]
+                            else:
+                                merged.merge(sketches[name])
+                            pipe.set(
+                                key, self.codec.encode(merged), ex=self.ttl_seconds
+                            )
+                        await pipe.execute()
+                        return True
+                    except WatchError:
+                        continue
+            logger.warning("Dropped sketch merge for %s after conflicts", names)
+        except RedisError:
+            logger.exception("Failed to merge sketches for %s", names)
+        return False
+
+    async def get_many(self, keys: List[str]) -> Dict[str, ListingSketch]:
+        if not keys:
+            return {}
+        try:
+            stored = await self._redis.mget([self._key(key) for key in keys])
+        except RedisError:
+            logger.exception("Failed to read sketches for %s", keys)
+            return {}
+        found = {}
+        for key, raw in zip(keys, stored):
+            sketch = self._decode(raw, key)
+            if sketch is not None:
+                found[key] = sketch
+        return found
+
+    def _decode(self, raw: Optional[bytes], key: str) -> Optional[ListingSketch]:
+        if raw is None:
+            return None
+        try:
+            return self.codec.decode(raw)
+        except (ValueError, struct.error):
+            logger.warning("Discarding undecodable sketch at %s", key)
+            return None
+
+    def _key(self, name: str) -> str:
+        return f"{self._prefix}:sketch:{name}"
@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import uuid
+from typing import Callable, Dict, Generic, Optional, TypeVar
+
+from redis.asyncio import Redis, RedisError
+
+from app.core.config import settings
+from app.domain.ports.caching_port import CachePort
+from app.providers.redis.adapter import RedisModelCacheAdapter
+from app.providers.shared.lru_cache import LruTtlCache
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CLEAR_ALL = "*"
+
+
+class CacheInvalidator:
+    """
+    Keeps one worker's L1 in step with the others over Redis pub/sub.
+
+    Writers publish "<node_id>|<key>" on the channel; every other node drops
+    that key from its L1 ("*" drops everything). A node ignores its own
+    messages. If the subscription breaks, messages may have been missed, so
+    the L1 is cleared before resubscribing.
+    """
+
+    def __init__(self, redis: Redis, channel: str, l1: LruTtlCache) -> None:
+        self._redis = redis
+        self.channel = channel
+        self.l1 = l1
+        self.node_id = uuid.uuid4().hex
+        self._task: Optional[asyncio.Task] = None
+        self._subscribed = asyncio.Event()
+        self._stopping = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._subscribed.clear()
+        self._stopping = False
+        self._task = asyncio.create_task(self._listen())
+        try:
+            await asyncio.wait_for(self._subscribed.wait(), timeout=1.0)
+        except asyncio.TimeoutError:
+            logger.warning("L1 invalidation subscribe slow: %s", self.channel)
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        # redis-py may swallow a cancel that lands inside get_message, so
+        # the loop also checks a flag that it sees on its next poll.
+        self._stopping = True
+        self._task.cancel()
+        await asyncio.wait({self._task}, timeout=2.0)
+        self._task = None
+
+    async def publish(self, key: str) -> None:
+        try:
+            await self._redis.publish(self.channel, f"{self.node_id}|{key}")
+        except RedisError:
+            logger.exception("Failed to publish L1 invalidation: %s", key)
+
+    def handle(self, message: bytes | str) -> None:
+        if isinstance(message, bytes):
+            message = message.decode("utf-8")
+        node_id, _, key = message.partition("|")
+        if node_id == self.node_id:
+            return
+        if key == CLEAR_ALL:
+            self.l1.clear()
+        else:
+            self.l1.delete(key)
+
+    async def _listen(self) -> None:
+        while not self._stopping:
+            pubsub = self._redis.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                self._subscribed.set()
+                while not self._stopping:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=0.5
+                    )
+                    if message is not None and message["type"] == "message":
+                        self.handle(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("L1 invalidation listener failed: %s", self.channel)
+                self.l1.clear()
+                await asyncio.sleep(1.0)
+            finally:
+                try:
+                    await pubsub.close()
+                except Exception:
+                    pass
+
+
+class TieredCacheAdapter(CachePort[T], Generic[T]):
+    """
+    In-process L1 (decoded objects, short TTL) in front of a Redis L2.
+
+    Reads try L1 first and fill it from L2; writes go to both and tell the
+    other workers to drop their L1 copy. Lease calls are delegated to L2.
+    """
+
+    def __init__(
+        self,
+        l1: LruTtlCache[T],
+        l2: RedisModelCacheAdapter[T],
+        invalidator: CacheInvalidator | None = None,
+    ) -> None:
+        self.l1 = l1
+        self.l2 = l2
+        self._invalidator = invalidator
+
+    @property
+    def leases_enabled(self) -> bool:
+        return self.l2.leases_enabled
+
+    async def get(self, key: str, early_expiry: bool = True) -> Optional[T]:
+        value = self.l1.get(key)
+        if value is not None:
+            logger.debug("L1 cache HIT: %s", key)
+            return value
+        value = await self.l2.get(key, early_expiry=early_expiry)
+        if value is not None:
+            self.l1.set(key, value)
+        return value
+
+    async def set(
+        self,
+        key: str,
+        value: T,
+        ttl_seconds: int | None = None,
+        compute_seconds: float | None = None,
+    ) -> None:
+        await self.l2.set(key, value, ttl_seconds, compute_seconds)
+        self.l1.set(key, value, ttl_seconds)
+        await self._publish(key)
+
+    async def delete(self, key: str) -> None:
+        self.l1.delete(key)
+        await self.l2.delete(key)
+        await self._publish(key)
+
+    async def clear(self) -> None:
+        self.l1.clear()
+        await self.l2.clear()
+        await self._publish(CLEAR_ALL)
+
+    async def acquire_lease(self, key: str) -> Optional[str]:
+        return await self.l2.acquire_lease(key)
+
+    async def release_lease(self, key: str, token: str) -> None:
+        await self.l2.release_lease(key, token)
+
+    async def wait_for_value(self, key: str, timeout_seconds: float) -> Optional[T]:
+        value = await self.l2.wait_for_value(key, timeout_seconds)
+        if value is not None:
+            self.l1.set(key, value)
+        return value
+
+    async def _publish(self, key: str) -> None:
+        if self._invalidator is not None:
+            await self._invalidator.publish(key)
+
+
+class LocalCacheAdapter(CachePort[T], Generic[T]):
+    """
+    A process-wide L1 on its own, for when Redis is unavailable. Nothing is
+    shared with other workers and no invalidations are sent or received.
+    """
+
+    def __init__(self, l1: LruTtlCache[T]) -> None:
+        self.l1 = l1
+
+    async def get(self, key: str, early_expiry: bool = True) -> Optional[T]:
+        return self.l1.get(key)
+
+    async def set(
+        self,
+        key: str,
+        value: T,
+        ttl_seconds: int | None = None,
+        compute_seconds: float | None = None,
+    ) -> None:
+        self.l1.set(key, value, ttl_seconds)
+
+    async def delete(self, key: str) -> None:
+        self.l1.delete(key)
+
+    async def clear(self) -> None:
+        self.l1.clear()
+
+
+_l1_caches: Dict[str, LruTtlCache] = {}
+_invalidators: Dict[str, CacheInvalidator] = {}
+
+
+def get_l1_cache(
+    prefix: str,
+    weigher: Callable[[T], int] | None = None,
+    max_weight: int | None = None,
+    ttl_seconds: float | None = None,
+) -> LruTtlCache[T]:
+    """
+    The process-wide L1 for `prefix`, created on first use. `max_weight`
+    and `ttl_seconds` default to the CACHE_L1_* settings.
+    """
+    l1 = _l1_caches.get(prefix)
+    if l1 is None:
+        l1 = LruTtlCache(
+            max_weight=max_weight or settings.cache_l1_max_weight,
+            ttl_seconds=ttl_seconds or settings.cache_l1_ttl_seconds,
+            weigher=weigher,
+        )
+        _l1_caches[prefix] = l1
+    return l1
+
+
+async def get_tiered_cache(
+    l2: RedisModelCacheAdapter[T],
+    redis: Redis,
+    prefix: str,
+    weigher: Callable[[T], int] | None = None,
+    max_weight: int | None = None,
+    ttl_seconds: float | None = None,
+) -> TieredCacheAdapter[T]:
+    """
+    Wrap `l2` with the process-wide L1 for `prefix` (see get_l1_cache),
+    starting its pub/sub invalidation listener on first use.
+    """
+    l1 = get_l1_cache(prefix, weigher, max_weight, ttl_seconds)
+
+    invalidator = _invalidators.get(prefix)
+    if invalidator is None:
+        invalidator = CacheInvalidator(redis, f"{prefix}:invalidate", l1)
+        _invalidators[prefix] = invalidator
+    if not invalidator.running:
+        await invalidator.start()
+
+    return TieredCacheAdapter(l1=l1, l2=l2, invalidator=invalidator)
+
+
+async def close_cache_invalidators() -> None:
+    for invalidator in _invalidators.values():
+        await invalidator.stop()
+    _invalidators.clear()
+
+
+def l1_cache_snapshot() -> Dict[str, dict]:
+    return {prefix: l1.stats() for prefix, l1 in _l1_caches.items()}
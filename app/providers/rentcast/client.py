@@ -1,9 +1,12 @@
 import logging
 from typing import Any, Dict, List
 
+import httpx
+
 from app.core.config import settings
 from app.domain.enums.context_request import OperationType
 from app.providers.enums.provider import Provider
+from app.providers.shared.hedging import get_hedger
 from app.providers.shared.http import http_get_json
 
 logger = logging.getLogger(__name__)
@@ -22,32 +25,39 @@ class RentCastClient:
       - domain models
     """
 
-    def __init__(self):
+    def __init__(self, http_client: httpx.AsyncClient | None = None):
         self.api_key = settings.rentcast_api_key
         self.timeout = settings.request_timeout_seconds
         self.sale_endpoint = settings.rentcast_sale_url
         self.rental_endpoint = settings.rentcast_rental_url
+        # None borrows the app-lifetime pooled client at call time
+        self.http_client = http_client
 
     async def get_sales(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
-        headers = {"X-Api-Key": self.api_key, "accept": "application/json"}
-        return await http_get_json(
-            self.sale_endpoint,
-            params,
-            headers,
-            self.timeout,
-            OperationType.SALES,
-            Provider.RENTCAST,
-            list,
-        )
+        return await self._get(self.sale_endpoint, params, OperationType.SALES)
 
     async def get_rentals(self, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return await self._get(self.rental_endpoint, params, OperationType.RENTALS)
+
+    async def _get(
+        self, url: str, params: Dict[str, Any], operation: OperationType
+    ) -> List[Dict[str, Any]]:
         headers = {"X-Api-Key": self.api_key, "accept": "application/json"}
-        return await http_get_json(
-            self.rental_endpoint,
-            params,
-            headers,
-            self.timeout,
-            OperationType.RENTALS,
-            Provider.RENTCAST,
-            list,
-        )
+
+        def call():
+            return http_get_json(
+                url,
+                params,
+                headers,
+                self.timeout,
+                operation,
+                Provider.RENTCAST,
+                list,
+                client=self.http_client,
+            )
+
+        # Opt-in: a slow call gets a second identical request (within budget)
+        hedger = get_hedger(Provider.RENTCAST, operation)
+        if hedger is None:
+            return await call()
+        return await hedger.run(call)
@@ -60,7 +60,9 @@ def build_params(request: ListingsRequest) -> dict:
         # default days_old if not explicitly provided
         params["daysOld"] = settings.rentcast_days_old_default
 
-    # --- 3. Limit (offset RentCast may or may not support directly) ---
-    params["limit"] = min(request.limit, settings.rentcast_request_cap, 100)
+    # --- 3. Limit ---
+    # Always fetch the capped superset; the service pages and sorts it, so one
+    # provider call (and one cache entry) serves every page and sort order.
+    params["limit"] = min(settings.rentcast_request_cap, 100)
 
     return params
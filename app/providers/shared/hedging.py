@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+from app.core.config import settings
+from app.domain.enums.context_request import OperationType
+from app.providers.enums.provider import Provider
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """Rolling window of recent successful call latencies (seconds)."""
+
+    def __init__(self, window: int = 200) -> None:
+        self._samples: Deque[float] = deque(maxlen=window)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))
+        return ordered[index]
+
+
+class HedgeBudget:
+    """
+    Caps hedges to a fraction of recent calls, e.g. ratio=0.05 allows at
+    most one extra provider call per twenty primary calls.
+    """
+
+    def __init__(self, ratio: float, window: int = 200) -> None:
+        self.ratio = ratio
+        self._recent: Deque[bool] = deque(maxlen=window)
+
+    def record_call(self, hedged: bool) -> None:
+        self._recent.append(hedged)
+
+    def allows_hedge(self) -> bool:
+        calls = len(self._recent)
+        if calls == 0:
+            return False
+        return (sum(self._recent) + 1) / calls <= self.ratio
+
+
+class Hedger:
+    """
+    Issues a second identical request when the first has not finished by the
+    configured latency percentile; whichever completes first wins and the
+    other is cancelled.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        percentile: float,
+        budget_ratio: float,
+        min_samples: int,
+        min_delay_seconds: float,
+    ) -> None:
+        self.name = name
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay_seconds = min_delay_seconds
+        self.latency = LatencyTracker()
+        self.budget = HedgeBudget(budget_ratio)
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    def hedge_delay(self) -> Optional[float]:
+        if len(self.latency) < self.min_samples:
+            return None
+        observed = self.latency.percentile(self.percentile)
+        return max(self.min_delay_seconds, observed)
+
+    async def run(self, fn: Callable[[], Awaitable[T]]) -> T:
+        start = time.monotonic()
+        primary = asyncio.ensure_future(fn())
+        delay = self.hedge_delay()
+
+        hedged = False
+        tasks = {primary}
+        try:
+            if delay is not None:
+                done, _ = await asyncio.wait(tasks, timeout=delay)
+                if not done and self.budget.allows_hedge():
+                    hedged = True
+                    self.hedges += 1
+                    logger.info("%s hedging after %.3fs", self.name, delay)
+                    tasks.add(asyncio.ensure_future(fn()))
+            self.budget.record_call(hedged)
+            winner, result = await self._first_success(tasks)
+        finally:
+            # Also reached when the caller is cancelled mid-wait, so no
+            # attempt outlives the request
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        if winner is not primary:
+            self.hedge_wins += 1
+        self.latency.record(time.monotonic() - start)
+        return result
+
+    async def _first_success(self, tasks: set) -> Tuple[asyncio.Future, T]:
+        """Return the first task to succeed; raise the last error if all fail."""
+        pending = set(tasks)
+        error: BaseException | None = None
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task, task.result()
+                error = task.exception()
+        raise error
+
+    def stats(self) -> dict:
+        return {
+            "samples": len(self.latency),
+            "hedge_delay_seconds": self.hedge_delay(),
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+        }
+
+
+_hedgers: Dict[Tuple[Provider, OperationType], Hedger] = {}
+
+
+def get_hedger(provider: Provider, operation: OperationType) -> Optional[Hedger]:
+    """
+    Return the shared hedger for a provider operation (None when disabled).
+    """
+    if not settings.hedge_enabled:
+        return None
+    key = (provider, operation)
+    hedger = _hedgers.get(key)
+    if hedger is None:
+        hedger = Hedger(
+            name=f"{provider.value} {operation.value}",
+            percentile=settings.hedge_percentile,
+            budget_ratio=settings.hedge_budget_ratio,
+            min_samples=settings.hedge_min_samples,
+            min_delay_seconds=settings.hedge_min_delay_ms / 1000,
+        )
+        _hedgers[key] = hedger
+    return hedger
+
+
+def hedger_snapshot() -> Dict[str, dict]:
+    return {hedger.name: hedger.stats() for hedger in _hedgers.values()}
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from typing import Any, Dict, Union
 
 import httpx
@@ -8,6 +10,7 @@ import httpx
 from app.domain.enums.context_request import OperationType
 from app.domain.exceptions.provider_exceptions import (ProviderAuthError,
                                                        ProviderClientError,
+                                                       ProviderError,
                                                        ProviderNetworkError,
                                                        ProviderParsingError,
                                                        ProviderRateLimitError,
@@ -15,6 +18,11 @@ from app.domain.exceptions.provider_exceptions import (ProviderAuthError,
                                                        ProviderTimeoutError,
                                                        ProviderUnexpectedError)
 from app.providers.enums.provider import Provider
+from app.providers.shared.http_client import get_http_client
+from app.providers.shared.rate_limit import get_rate_limiter
+from app.providers.shared.resilience import (TRANSIENT_ERRORS,
+                                             get_circuit_breaker,
+                                             get_retry_policy)
 
 logger = logging.getLogger(__name__)
 
@@ -27,14 +35,94 @@ async def http_get_json(
     operation: OperationType,
     provider: Provider,
     expected_type: type[dict] | type[list] = dict,
+    client: httpx.AsyncClient | None = None,
 ) -> Union[dict, list]:
-    try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            logger.info(
-                "%s %s request: %s %s", provider.value, operation.value, url, params
+    """
+    GET a JSON payload over the provider's pooled client and map failures
+    to provider exceptions. Pass `client` to override the shared pool.
+
+    Each attempt is paced by the provider's token bucket and guarded by its
+    circuit breaker. Transient failures (timeout, 5xx, network) are retried
+    with decorrelated-jitter backoff per the provider/operation RetryPolicy,
+    never past the policy's total deadline.
+    """
+    policy = get_retry_policy(provider, operation)
+    breaker = get_circuit_breaker(provider)
+    deadline = time.monotonic() + policy.deadline_seconds
+    delay = policy.base_delay_seconds
+    attempt = 0
+
+    while True:
+        attempt += 1
+        # An open circuit fails fast, before spending (or waiting for) a
+        # token that a healthy caller could use
+        breaker.before_call()
+        limiter = await get_rate_limiter(provider)
+        if limiter is not None:
+            try:
+                await limiter.acquire()
+            except BaseException:
+                breaker.release_probe()
+                raise
+
+        attempt_timeout = max(0.0, min(timeout, deadline - time.monotonic()))
+        try:
+            payload = await _get_json_once(
+                url,
+                params,
+                headers,
+                attempt_timeout,
+                operation,
+                provider,
+                expected_type,
+                client,
+            )
+        except TRANSIENT_ERRORS as e:
+            breaker.record_failure()
+            delay = policy.next_delay(delay)
+            if attempt >= policy.max_attempts or time.monotonic() + delay >= deadline:
+                raise
+            logger.warning(
+                "%s %s attempt %s failed (%s); retrying in %.2fs",
+                provider.value,
+                operation.value,
+                attempt,
+                e.error_code,
+                delay,
             )
-            response = await client.get(url, params=params, headers=headers)
-            response.raise_for_status()
+            await asyncio.sleep(delay)
+            continue
+        except ProviderError:
+            # The provider answered (4xx, bad payload); it is not down.
+            breaker.record_success()
+            raise
+        except BaseException:
+            breaker.release_probe()
+            raise
+
+        breaker.record_success()
+        return payload
+
+
+async def _get_json_once(
+    url: str,
+    params: Dict[str, Any],
+    headers: Dict[str, str] | None,
+    timeout: float,
+    operation: OperationType,
+    provider: Provider,
+    expected_type: type[dict] | type[list],
+    client: httpx.AsyncClient | None,
+) -> Union[dict, list]:
+    try:
+        client = client or get_http_client(provider)
+        logger.info(
+            "%s %s request: %s %s", provider.value, operation.value, url, params
+        )
+        response = await client.get(
+            url, params=params, headers=headers, timeout=timeout
+        )
+        response.raise_for_status()
     except httpx.TimeoutException as e:
         raise ProviderTimeoutError(f"{provider.value} timeout") from e
     except httpx.HTTPStatusError as e:
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import importlib.util
+import logging
+from typing import Dict, Optional
+
+import httpx
+
+from app.core.config import settings
+from app.providers.enums.provider import Provider
+
+logger = logging.getLogger(__name__)
+
+_http_clients: Dict[Provider, httpx.AsyncClient] = {}
+
+
+def _base_url(provider: Provider) -> Optional[str]:
+    base_urls = {
+        Provider.RENTCAST: settings.rentcast_base_url,
+        Provider.OPENCAGE: settings.opencage_base_url,
+    }
+    return base_urls.get(provider) or None
+
+
+def _http2_enabled() -> bool:
+    if not settings.http2_enabled:
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.warning("HTTP/2 requested but 'h2' is not installed; using HTTP/1.1")
+        return False
+    return True
+
+
+def _build_client(provider: Provider) -> httpx.AsyncClient:
+    limits = httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry_seconds,
+    )
+    kwargs = {
+        "timeout": settings.request_timeout_seconds,
+        "limits": limits,
+        "http2": _http2_enabled(),
+    }
+    base_url = _base_url(provider)
+    if base_url:
+        kwargs["base_url"] = base_url
+    return httpx.AsyncClient(**kwargs)
+
+
+def get_http_client(provider: Provider) -> httpx.AsyncClient:
+    """
+    Lazily create a pooled, app-lifetime httpx client for the given provider.
+    """
+    client = _http_clients.get(provider)
+    if client is None or client.is_closed:
+        logger.info("Initializing pooled HTTP client: %s", provider.value)
+        client = _build_client(provider)
+        _http_clients[provider] = client
+    return client
+
+
+async def init_http_clients() -> None:
+    """
+    Eagerly create one pooled client per provider (app startup).
+    """
+    for provider in Provider:
+        get_http_client(provider)
+
+
+async def close_http_clients() -> None:
+    """
+    Close every pooled client (app shutdown / test teardown).
+    """
+    clients = list(_http_clients.values())
+    _http_clients.clear()
+    for client in clients:
+        await client.aclose()
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import time
+from typing import Callable, Generic, Optional, Tuple, TypeVar
+
+from cachetools import TTLCache
+
+T = TypeVar("T")
+
+
+class _CountingTTLCache(TTLCache):
+    """TTLCache that counts capacity evictions (expiries are not counted)."""
+
+    evictions = 0
+
+    def popitem(self):
+        item = super().popitem()
+        self.evictions += 1
+        return item
+
+
+class LruTtlCache(Generic[T]):
+    """
+    Bounded in-process LRU of decoded values with a TTL, on cachetools'
+    TTLCache.
+
+    Capacity is a total weight (TTLCache's maxsize, measured through
+    getsizeof) rather than an entry count, so one search holding 100
+    listings costs more than one holding 3. An entry may be given a TTL
+    shorter than the cache's. Values are shared with callers as-is and must
+    be treated as read-only.
+    """
+
+    def __init__(
+        self,
+        max_weight: int,
+        ttl_seconds: float,
+        weigher: Callable[[T], int] | None = None,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        weigh = weigher or (lambda value: 1)
+        # Stored as (value, expires_at, weight); TTLCache enforces the cache
+        # TTL, expires_at a shorter per-entry one
+        self._entries: TTLCache = _CountingTTLCache(
+            maxsize=max_weight,
+            ttl=ttl_seconds,
+            timer=timer,
+            getsizeof=lambda entry: entry[2],
+        )
+        self._weigh = lambda value: max(1, weigh(value))
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_weight(self) -> int:
+        return self._entries.maxsize
+
+    @property
+    def ttl_seconds(self) -> float:
+        return self._entries.ttl
+
+    @property
+    def evictions(self) -> int:
+        return self._entries.evictions
+
+    def __len__(self) -> int:
+        self._entries.expire()
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[T]:
+        entry: Optional[Tuple[T, float, int]] = self._entries.get(key)
+        if entry is not None and entry[1] <= self._entries.timer():
+            self.delete(key)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[0]
+
+    def set(self, key: str, value: T, ttl_seconds: float | None = None) -> None:
+        weight = self._weigh(value)
+        self.delete(key)
+        if weight > self.max_weight:
+            return
+        ttl = min(ttl_seconds or self.ttl_seconds, self.ttl_seconds)
+        self._entries[key] = (value, self._entries.timer() + ttl, weight)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self),
+            "weight": self._entries.currsize,
+            "max_weight": self.max_weight,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Dict, Optional
+
+from redis.asyncio import Redis, RedisError
+
+from app.core.config import settings
+from app.domain.exceptions.provider_exceptions import ProviderRateLimitError
+from app.providers.enums.provider import Provider
+from app.providers.redis.client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+# Atomically refill the bucket and reserve one token.
+# Returns the seconds the caller must wait, or -1 if that exceeds max_wait.
+_RESERVE_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local capacity = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local max_wait = tonumber(ARGV[4])
+local state = redis.call("HMGET", KEYS[1], "tokens", "ts")
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+local wait = 0
+if tokens < 1 then
+    wait = (1 - tokens) / rate
+end
+if wait > max_wait then
+    return "-1"
+end
+tokens = tokens - 1
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "ts", tostring(now))
+redis.call("PEXPIRE", KEYS[1], math.ceil((capacity / rate + max_wait) * 1000) + 1000)
+return tostring(wait)
+"""
+
+
+class TokenBucket:
+    """
+    Async token bucket for one provider within one process.
+
+    Callers reserve a token up front and sleep until it is due, so waiters
+    are served in arrival order. Calls are rejected with
+    ProviderRateLimitError when the wait queue is full or the wait would
+    exceed `max_wait_seconds`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float,
+        capacity: int,
+        max_waiters: int,
+        max_wait_seconds: float,
+    ) -> None:
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+        self.max_waiters = max_waiters
+        self.max_wait_seconds = max_wait_seconds
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._waiters = 0
+
+    @property
+    def waiters(self) -> int:
+        return self._waiters
+
+    async def acquire(self) -> None:
+        # Waiters only exist while the bucket is empty, so a full queue
+        # means this call would have to wait as well.
+        if self._waiters >= self.max_waiters:
+            raise ProviderRateLimitError(f"{self.name} rate limit queue full")
+
+        wait = await self._reserve()
+        if wait <= 0:
+            return
+
+        self._waiters += 1
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            await self._cancel_reservation()
+            raise
+        finally:
+            self._waiters -= 1
+
+    async def _reserve(self) -> float:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+        wait = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+        if wait > self.max_wait_seconds:
+            raise ProviderRateLimitError(f"{self.name} rate limit wait exceeded")
+        self._tokens -= 1
+        return wait
+
+    async def _cancel_reservation(self) -> None:
+        self._tokens = min(self.capacity, self._tokens + 1)
+
+
+class RedisTokenBucket(TokenBucket):
+    """
+    Token bucket whose state lives in Redis so every worker shares one budget.
+    Falls back to the in-process bucket if Redis is unavailable.
+    """
+
+    def __init__(self, redis: Redis, key: str, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._redis = redis
+        self._key = key
+
+    async def _reserve(self) -> float:
+        try:
+            raw = await self._redis.eval(
+                _RESERVE_SCRIPT,
+                1,
+                self._key,
+                self.rate,
+                self.capacity,
+                f"{time.time():.3f}",
+                self.max_wait_seconds,
+            )
+        except RedisError:
+            logger.exception("Shared rate limiter unavailable: %s", self._key)
+            return await super()._reserve()
+
+        wait = float(raw.decode() if isinstance(raw, bytes) else raw)
+        if wait < 0:
+            raise ProviderRateLimitError(f"{self.name} rate limit wait exceeded")
+        return wait
+
+    async def _cancel_reservation(self) -> None:
+        # A shared reservation is not refunded; it expires with the bucket.
+        return None
+
+
+_rate_limiters: Dict[Provider, TokenBucket] = {}
+
+
+def _provider_rps(provider: Provider) -> float:
+    overrides = {
+        Provider.RENTCAST: settings.rentcast_rate_limit_rps,
+        Provider.OPENCAGE: settings.opencage_rate_limit_rps,
+    }
+    override = overrides.get(provider)
+    return settings.rate_limit_rps if override is None else override
+
+
+async def get_rate_limiter(provider: Provider) -> Optional[TokenBucket]:
+    """
+    Lazily create the token bucket for a provider (None when disabled).
+    """
+    rps = _provider_rps(provider)
+    if rps <= 0:
+        return None
+
+    limiter = _rate_limiters.get(provider)
+    if limiter is None:
+        kwargs = {
+            "name": provider.value,
+            "rate": rps,
+            "capacity": settings.rate_limit_burst or max(1, int(rps)),
+            "max_waiters": settings.rate_limit_max_waiters,
+            "max_wait_seconds": settings.rate_limit_max_wait_seconds,
+        }
+        if settings.rate_limit_shared:
+            redis = await get_redis_client()
+            key = f"{settings.redis_cache_prefix}:ratelimit:{provider.value}"
+            limiter = RedisTokenBucket(redis=redis, key=key, **kwargs)
+        else:
+            limiter = TokenBucket(**kwargs)
+        _rate_limiters[provider] = limiter
+    return limiter
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import logging
+import random
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict
+
+from app.core.config import settings
+from app.domain.enums.context_request import OperationType
+from app.domain.exceptions.provider_exceptions import (
+    ProviderCircuitOpenError, ProviderNetworkError, ProviderServerError,
+    ProviderTimeoutError)
+from app.providers.enums.provider import Provider
+
+logger = logging.getLogger(__name__)
+
+# Failures worth retrying and counting against the breaker; 4xx are not.
+TRANSIENT_ERRORS = (ProviderTimeoutError, ProviderServerError, ProviderNetworkError)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 3
+    base_delay_seconds: float = 0.2
+    max_delay_seconds: float = 2.0
+    deadline_seconds: float = 20.0
+
+    def next_delay(self, previous: float) -> float:
+        """Decorrelated jitter: uniform(base, 3 * previous), capped."""
+        upper = max(self.base_delay_seconds, previous * 3)
+        return min(
+            self.max_delay_seconds, random.uniform(self.base_delay_seconds, upper)
+        )
+
+
+def get_retry_policy(provider: Provider, operation: OperationType) -> RetryPolicy:
+    """
+    Resolve the retry policy for a provider call.
+
+    Overrides in `settings.retry_policies` are keyed by "<provider>:<operation>"
+    (e.g. "RentCast:rental") or "<provider>"; the most specific one wins.
+    """
+    fields = {
+        "max_attempts": settings.retry_max_attempts,
+        "base_delay_seconds": settings.retry_base_delay_seconds,
+        "max_delay_seconds": settings.retry_max_delay_seconds,
+        "deadline_seconds": settings.retry_deadline_seconds,
+    }
+    overrides = settings.retry_policies or {}
+    for key in (provider.value, f"{provider.value}:{operation.value}"):
+        fields.update(overrides.get(key, {}))
+    return RetryPolicy(**fields)
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    - closed: calls flow; `failure_threshold` transient failures in a row open it
+    - open: calls fail fast with ProviderCircuitOpenError for `reset_seconds`
+    - half_open: a single probe call is let through; success closes the
+      breaker, failure re-opens it
+    """
+
+    def __init__(self, name: str, failure_threshold: int, reset_seconds: float) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.reset_seconds
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    def before_call(self) -> None:
+        state = self.state
+        if state == CircuitState.OPEN:
+            raise ProviderCircuitOpenError(f"{self.name} circuit open")
+        if state == CircuitState.HALF_OPEN:
+            if self._probe_in_flight:
+                raise ProviderCircuitOpenError(f"{self.name} circuit half-open")
+            self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        if self._state != CircuitState.CLOSED:
+            logger.info("Circuit CLOSED: %s", self.name)
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+        if (
+            self._state == CircuitState.HALF_OPEN
+            or self._failures >= self.failure_threshold
+        ):
+            if self._state != CircuitState.OPEN:
+                logger.warning("Circuit OPEN: %s", self.name)
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def release_probe(self) -> None:
+        """Free the half-open slot after a call that was neither pass nor fail."""
+        self._probe_in_flight = False
+
+    def snapshot(self) -> dict:
+        state = self.state
+        retry_in = None
+        if state == CircuitState.OPEN:
+            retry_in = max(
+                0.0, self.reset_seconds - (time.monotonic() - self._opened_at)
+            )
+        return {
+            "state": state.value,
+            "consecutive_failures": self._failures,
+            "retry_in_seconds": retry_in,
+        }
+
+
+_breakers: Dict[Provider, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(provider: Provider) -> CircuitBreaker:
+    breaker = _breakers.get(provider)
+    if breaker is None:
+        breaker = CircuitBreaker(
+            name=provider.value,
+            failure_threshold=settings.circuit_failure_threshold,
+            reset_seconds=settings.circuit_reset_seconds,
+        )
+        _breakers[provider] = breaker
+    return breaker
+
+
+def circuit_breaker_snapshot() -> Dict[str, dict]:
+    return {p.value: get_circuit_breaker(p).snapshot() for p in Provider}
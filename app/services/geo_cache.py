@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core.config import settings
+from app.domain.dto import ListingsRequest, NormalizedListing
+from app.domain.enums.context_request import OperationType
+from app.domain.range_types import Range
+from app.services.query_key import canonical_query
+from app.utils.distance import great_circle_miles
+
+LOCATION_FIELDS = ("lat", "lon", "radius", "address", "city", "state", "zip")
+
+# Provider range filters and the listing value each one constrains.
+RANGE_FIELDS: Dict[str, Callable[[NormalizedListing], Any]] = {
+    "beds": lambda listing: listing.facts.beds,
+    "baths": lambda listing: listing.facts.baths,
+    "price": lambda listing: listing.pricing.list_price,
+    "sqft": lambda listing: listing.facts.sqft,
+    "year_built": lambda listing: listing.facts.year_built,
+}
+
+
+@dataclass
+class CoveredSearch:
+    """A cached search that may answer narrower searches."""
+
+    key: str
+    category: OperationType
+    location: Dict[str, Any]
+    ranges: Dict[str, Range]
+    days_old: Range
+    truncated: bool
+    lat: Optional[float] = None
+    lon: Optional[float] = None
+    radius_miles: Optional[float] = None
+    expires_at: float = field(default=0.0)
+
+    @property
+    def is_circle(self) -> bool:
+        return self.lat is not None and self.lon is not None
+
+
+def search_location(request: ListingsRequest) -> Dict[str, Any]:
+    """Location fields of the canonical query (mapper precedence applied)."""
+    query = canonical_query(request)
+    return {k: v for k, v in query.items() if k in LOCATION_FIELDS}
+
+
+def search_ranges(request: ListingsRequest) -> Dict[str, Range]:
+    """Bounded range filters of the request; absent means unbounded."""
+    ranges: Dict[str, Range] = {}
+    for name in RANGE_FIELDS:
+        value = getattr(request, name)
+        if value is not None and (value.min is not None or value.max is not None):
+            ranges[name] = value
+    return ranges
+
+
+def effective_days_old(request: ListingsRequest) -> Range:
+    if request.days_old is not None:
+        return request.days_old
+    return Range.from_provider(settings.rentcast_days_old_default)
+
+
+def ranges_cover(cached: Dict[str, Range], requested: Dict[str, Range]) -> bool:
+    """True if every cached range filter admits all of the requested range."""
+    return all(
+        cached_range.covers(requested.get(name))
+        for name, cached_range in cached.items()
+    )
+
+
+class GeoContainmentIndex:
+    """
+    Bounded in-process index of cached searches.
+
+    A request is covered by a cached search when the category matches, the
+    cached result was not cut short by the provider cap, its daysOld window
+    and every range filter (beds, baths, price, sqft, year_built) contain the
+    requested ones, and its location contains the requested location: for
+    lat/lon searches distance(center, center') + r <= R, otherwise the same
+    address, city/state or zip.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, CoveredSearch]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def register(self, entry: CoveredSearch, ttl_seconds: float) -> None:
+        entry.expires_at = time.monotonic() + ttl_seconds
+        self._entries.pop(entry.key, None)
+        self._entries[entry.key] = entry
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def find_covering(
+        self,
+        request: ListingsRequest,
+        category: OperationType,
+        exclude_key: Optional[str] = None,
+    ) -> Optional[CoveredSearch]:
+        """
+        Return the tightest live cached search covering the request, other
+        than exclude_key (the request's own entry: a miss on it must refetch,
+        not be answered from itself).
+        """
+        now = time.monotonic()
+        location = search_location(request)
+        ranges = search_ranges(request)
+        days_old = effective_days_old(request)
+        circle = request.latitude is not None and request.longitude is not None
+        best: Optional[CoveredSearch] = None
+
+        for key, entry in list(self._entries.items()):
+            if entry.expires_at <= now:
+                del self._entries[key]
+                continue
+            if (
+                key == exclude_key
+                or entry.category != category
+                or entry.truncated
+                or not entry.days_old.covers(days_old)
+                or not ranges_cover(entry.ranges, ranges)
+            ):
+                continue
+            if circle:
+                if not entry.is_circle:
+                    continue
+                gap = great_circle_miles(
+                    request.latitude, request.longitude, entry.lat, entry.lon
+                )
+                if gap + request.radius_miles > entry.radius_miles:
+                    continue
+            elif entry.location != location:
+                continue
+            if best is None or _tightness(entry) < _tightness(best):
+                best = entry
+        return best
+
+
+def _tightness(entry: CoveredSearch) -> tuple:
+    """Smaller radius first, then more bounded filters (fewer rows to scan)."""
+    return (entry.radius_miles or 0.0, -len(entry.ranges))
+
+
+def covered_search_for(
+    key: str,
+    request: ListingsRequest,
+    category: OperationType,
+    listings: List[NormalizedListing],
+) -> CoveredSearch:
+    """Describe a freshly fetched search for the index."""
+    cap = min(settings.rentcast_request_cap, 100, settings.max_results)
+    entry = CoveredSearch(
+        key=key,
+        category=category,
+        location=search_location(request),
+        ranges=search_ranges(request),
+        days_old=effective_days_old(request),
+        truncated=len(listings) >= cap,
+    )
+    if request.latitude is not None and request.longitude is not None:
+        entry.lat = request.latitude
+        entry.lon = request.longitude
+        entry.radius_miles = request.radius_miles
+    return entry
+
+
+def filter_to_request(
+    listings: List[NormalizedListing],
+    request: ListingsRequest,
+    covering: Optional[CoveredSearch],
+) -> List[NormalizedListing]:
+    """
+    Narrow a covering search's listings to the request: the requested circle
+    (haversine) for lat/lon searches, and every range or daysOld window that
+    is tighter than the cached one.
+
+    With no covering search, the listings are already inside the requested
+    area (a spatial index query) but may come from any search, so every
+    range filter is applied, and the daysOld window to listings whose age
+    is known (the provider admitted the rest under its own window).
+    """
+    days_old = effective_days_old(request)
+    requested = search_ranges(request)
+    if covering is None:
+        check_age = True
+        checks = [(RANGE_FIELDS[name], wanted) for name, wanted in requested.items()]
+        circle = False
+    else:
+        check_age = not days_old.covers(covering.days_old)
+        checks = [
+            (RANGE_FIELDS[name], wanted)
+            for name, wanted in requested.items()
+            if not wanted.covers(covering.ranges.get(name))
+        ]
+        circle = covering.is_circle and request.latitude is not None
+    now = datetime.now(timezone.utc)
+
+    result: List[NormalizedListing] = []
+    for listing in listings:
+        if circle:
+            lat, lon = listing.address.lat, listing.address.lon
+            if lat is None or lon is None:
+                continue
+            distance = great_circle_miles(request.latitude, request.longitude, lat, lon)
+            if distance > request.radius_miles:
+                continue
+        if any(not wanted.contains(value(listing)) for value, wanted in checks):
+            continue
+        if check_age:
+            age = _days_since(listing.dates.listed, now)
+            if (age is not None or covering is not None) and not days_old.contains(age):
+                continue
+        result.append(listing)
+    return result
+
+
+def _days_since(value: Optional[str], now: datetime) -> Optional[int]:
+    if not value:
+        return None
+    try:
+        listed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if listed.tzinfo is None:
+        listed = listed.replace(tzinfo=timezone.utc)
+    return max(0, (now - listed).days)
+
+
+# Shared singleton for app modules
+listings_geo_index = GeoContainmentIndex()
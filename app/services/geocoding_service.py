@@ -1,22 +1,188 @@
+import asyncio
 import logging
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple, Type
 
 from app.core.config import settings
 from app.domain.dto import Center, ListingsRequest
+from app.domain.exceptions.provider_exceptions import (ProviderClientError,
+                                                       ProviderError,
+                                                       ProviderNoResultsError,
+                                                       ProviderRateLimitError,
+                                                       ProviderUnexpectedError)
+from app.domain.ports.caching_port import CachePort
+from app.domain.ports.gazetteer_port import GazetteerPort
 from app.domain.ports.geocoding_port import GeocodingPort
+from app.providers.shared.lru_cache import LruTtlCache
 
 logger = logging.getLogger(__name__)
 
+# (exception type, message) of a lookup the provider could not resolve
+GeocodeFailure = Tuple[Type[ProviderClientError], str]
+
+
+@dataclass
+class BatchGeocodeResult:
+    """Outcome for one distinct location of a batch, at every input index."""
+
+    indexes: List[int]
+    center: Optional[Center] = None
+    error: Optional[ProviderError] = None
+    cached: bool = False
+
 
 class GeocodingService:
-    def __init__(self, geocoding_port: GeocodingPort):
+    def __init__(
+        self,
+        geocoding_port: GeocodingPort,
+        cache_port: Optional[CachePort[Center]] = None,
+        negative_cache: Optional[LruTtlCache[GeocodeFailure]] = None,
+        gazetteer: Optional[GazetteerPort] = None,
+    ):
         self.geocoding_port = geocoding_port
+        self.cache = cache_port
+        self.gazetteer = gazetteer
         self.api_key = settings.opencage_api_key
         self.base_url = settings.opencage_url
         self.timeout = settings.request_timeout_seconds
+        self.negative_cache = (
+            negative_cache if negative_cache is not None else geocode_failures
+        )
 
     async def geocode(self, request: ListingsRequest) -> Center:
         """
         Geocode the provided search request using the configured port.
+
+        Latitude + longitude is returned as-is, and ZIP or city + state is
+        answered from the offline gazetteer when it has the centroid. Other
+        locations are cached under the port's normalized key; those the
+        provider could not resolve (no results or a 4xx) are remembered
+        briefly and re-raised without another provider call.
         """
-        center: Center = await self.geocoding_port.geocode(request)
+        center = await self._resolve_locally(request)
+        if center is not None:
+            return center
+        return await self._fetch(request)
+
+    async def geocode_batch(
+        self, requests: Sequence[ListingsRequest], max_concurrency: int
+    ) -> AsyncIterator[BatchGeocodeResult]:
+        """
+        Geocode many requests, yielding results as they resolve.
+
+        Inputs are deduplicated by the port's cache key, and everything that
+        needs no provider call (coordinates, gazetteer, caches) is yielded
+        first. The rest fans out over at most `max_concurrency` workers,
+        never more than the provider's remaining call budget. Once that
+        budget is spent, the remaining locations fail with
+        ProviderRateLimitError instead of being sent.
+        """
+        groups: Dict[str, List[int]] = {}
+        firsts: Dict[str, ListingsRequest] = {}
+        for index, request in enumerate(requests):
+            key = self.geocoding_port.cache_key(request)
+            groups.setdefault(key, []).append(index)
+            firsts.setdefault(key, request)
+
+        pending: List[str] = []
+        for key, request in firsts.items():
+            try:
+                center = await self._resolve_locally(request)
+            except ProviderError as exc:
+                yield BatchGeocodeResult(groups[key], error=exc, cached=True)
+                continue
+            if center is None:
+                pending.append(key)
+            else:
+                yield BatchGeocodeResult(groups[key], center=center, cached=True)
+        if not pending:
+            return
+
+        results: "asyncio.Queue[BatchGeocodeResult]" = asyncio.Queue()
+        queue = list(reversed(pending))
+        in_flight = 0
+
+        async def worker() -> None:
+            nonlocal in_flight
+            while queue:
+                key = queue.pop()
+                budget = self.geocoding_port.call_budget()
+                if budget is not None and budget <= in_flight:
+                    error = ProviderRateLimitError("geocoding call budget exhausted")
+                    await results.put(BatchGeocodeResult(groups[key], error=error))
+                    continue
+                in_flight += 1
+                try:
+                    center = await self._fetch(firsts[key])
+                    outcome = BatchGeocodeResult(groups[key], center=center)
+                except ProviderError as exc:
+                    outcome = BatchGeocodeResult(groups[key], error=exc)
+                except Exception as exc:
+                    logger.exception("Batch geocode failed: %s", key)
+                    outcome = BatchGeocodeResult(
+                        groups[key], error=ProviderUnexpectedError(str(exc))
+                    )
+                finally:
+                    in_flight -= 1
+                await results.put(outcome)
+
+        budget = self.geocoding_port.call_budget()
+        workers = min(max_concurrency, len(pending))
+        if budget is not None:
+            workers = max(1, min(workers, budget))
+        tasks = [asyncio.ensure_future(worker()) for _ in range(workers)]
+        try:
+            for _ in pending:
+                yield await results.get()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _resolve_locally(self, request: ListingsRequest) -> Optional[Center]:
+        """Answer without calling the provider, or None if it must be called."""
+        if request.latitude is not None and request.longitude is not None:
+            return Center(lat=request.latitude, lon=request.longitude)
+        if self.gazetteer is not None:
+            centroid = self.gazetteer.lookup(request)
+            if centroid is not None:
+                return centroid
+
+        key = self.geocoding_port.cache_key(request)
+        if self.cache:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                logger.info("Geocode cache HIT: %s", key)
+                return cached
+
+        failure = self.negative_cache.get(key)
+        if failure is not None:
+            logger.info("Geocode NEGATIVE hit: %s", key)
+            error_cls, message = failure
+            raise error_cls(message)
+        return None
+
+    async def _fetch(self, request: ListingsRequest) -> Center:
+        key = self.geocoding_port.cache_key(request)
+        try:
+            center: Center = await self.geocoding_port.geocode(request)
+        except ProviderClientError as exc:
+            ttl = (
+                settings.cache_empty_ttl_seconds
+                if isinstance(exc, ProviderNoResultsError)
+                else settings.cache_error_ttl_seconds
+            )
+            self.negative_cache.set(key, (type(exc), str(exc)), ttl)
+            raise
+
+        if self.cache:
+            await self.cache.set(key, center)
+            logger.info("Geocode cache SET: %s", key)
         return center
+
+
+# Process-wide, so per-request GeocodingService instances share it
+geocode_failures: LruTtlCache[GeocodeFailure] = LruTtlCache(
+    max_weight=1024,
+    ttl_seconds=max(settings.cache_empty_ttl_seconds, settings.cache_error_ttl_seconds),
+)
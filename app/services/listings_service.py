@@ -1,17 +1,27 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
-from typing import List, Optional
+import time
+from typing import Dict, List, Optional
 
 from app.core.config import settings
-from app.domain.dto import (CachedListings, ListingsRequest, NormalizedListing,
+from app.domain.dto import (CachedListings, ListingsRequest,
+                            ListingsSearchResult, NormalizedListing,
                             RegionalMetrics, SortSpec)
 from app.domain.enums.context_request import OperationType
-from app.domain.ports.caching_port import CachePort
+from app.domain.exceptions.provider_exceptions import ProviderClientError
+from app.domain.ports.caching_port import CacheLeasePort, CachePort
+from app.domain.ports.listing_index_port import ListingIndexPort
 from app.domain.ports.listings_port import ListingsPort
 from app.domain.regional_metrics import compute_regional_metrics
 from app.models.schemas import PropertyListing
+from app.services.geo_cache import (CoveredSearch, GeoContainmentIndex,
+                                    covered_search_for, filter_to_request)
+from app.services.query_key import build_query_key
+from app.services.rent_index_service import RentIndexService
+from app.services.single_flight import SingleFlight
+from app.services.spatial_index import ListingSpatialIndex
 
 logger = logging.getLogger(__name__)
 
@@ -21,9 +31,20 @@ class ListingsService:
         self,
         listings_port: ListingsPort,
         cache_port: Optional[CachePort[CachedListings]] = None,
+        single_flight: Optional[SingleFlight[List[NormalizedListing]]] = None,
+        geo_index: Optional[GeoContainmentIndex] = None,
+        listing_index: Optional[ListingIndexPort] = None,
+        rent_index: Optional[RentIndexService] = None,
+        spatial_index: Optional[ListingSpatialIndex] = None,
     ):
         self.listings_port = listings_port
         self.cache = cache_port
+        self.single_flight = single_flight or SingleFlight()
+        self.geo_index = geo_index if geo_index is not None else GeoContainmentIndex()
+        self.listing_index = listing_index
+        self.rent_index = rent_index
+        self.spatial_index = spatial_index
+        self.lease_wait_seconds = settings.cache_lease_wait_seconds
 
     async def get_sale_data(self, request: ListingsRequest) -> List[NormalizedListing]:
         """
@@ -32,22 +53,8 @@ class ListingsService:
         Returns:
             List of PropertyListing objects, sorted by distance then price then sqft
         """
-        cache_key = self._build_cache_key(request, OperationType.SALES)
-
-        if self.cache:
-            cached = await self.cache.get(cache_key)
-            if cached is not None:
-                logger.info("Listings cache HIT (sales): %s", cache_key)
-                return cached.items
-
-        listings = await self.listings_port.fetch_sales(request)
-        listings = sort_listings(listings, request.sort)
-
-        if self.cache:
-            await self.cache.set(cache_key, CachedListings(items=listings))
-            logger.info("Listings cache SET (sales): %s", cache_key)
-
-        return listings
+        result = await self.search_sales(request)
+        return result.listings
 
     async def get_rental_data(
         self, request: ListingsRequest
@@ -58,22 +65,115 @@ class ListingsService:
         Returns:
             List of PropertyListing objects, sorted by distance then price then sqft
         """
-        cache_key = self._build_cache_key(request, OperationType.RENTALS)
+        result = await self.search_rentals(request)
+        return result.listings
+
+    async def search_sales(self, request: ListingsRequest) -> ListingsSearchResult:
+        """
+        Sale listings plus how they were served (cache status, provider calls).
+        """
+        return await self._search(request, OperationType.SALES)
+
+    async def search_rentals(self, request: ListingsRequest) -> ListingsSearchResult:
+        """
+        Rental listings plus how they were served (cache status, provider calls).
+        """
+        return await self._search(request, OperationType.RENTALS)
+
+    async def _search(
+        self, request: ListingsRequest, op: OperationType
+    ) -> ListingsSearchResult:
+        cache_key = self._build_cache_key(request, op)
 
         if self.cache:
             cached = await self.cache.get(cache_key)
+            if cached is not None and cached.error is not None:
+                logger.info("Listings cache NEGATIVE (%s): %s", op.value, cache_key)
+                raise ProviderClientError(cached.error)
             if cached is not None:
-                logger.info("Listings cache HIT (rentals): %s", cache_key)
-                return cached.items
+                stale = self._is_stale(cached)
+                if stale:
+                    logger.info("Listings cache STALE (%s): %s", op.value, cache_key)
+                    self._schedule_refresh(request, op, cache_key)
+                else:
+                    logger.info("Listings cache HIT (%s): %s", op.value, cache_key)
+                return ListingsSearchResult(
+                    listings=sort_listings(cached.items, request.sort),
+                    cache="hit",
+                    provider_calls=0,
+                    stale=stale,
+                )
 
-        listings = await self.listings_port.fetch_rentals(request)
-        listings = sort_listings(listings, request.sort)
+            covered = await self._from_covering_search(request, op, cache_key)
+            if covered is not None:
+                return ListingsSearchResult(
+                    listings=sort_listings(covered, request.sort),
+                    cache="partial",
+                    provider_calls=0,
+                )
 
-        if self.cache:
-            await self.cache.set(cache_key, CachedListings(items=listings))
-            logger.info("Listings cache SET (rentals): %s", cache_key)
+        listings = await self.single_flight.do(
+            cache_key,
+            lambda: self._fetch_and_cache(request, op, cache_key),
+        )
+        return ListingsSearchResult(listings=sort_listings(listings, request.sort))
 
-        return listings
+    async def _from_covering_search(
+        self, request: ListingsRequest, op: OperationType, cache_key: str
+    ) -> Optional[List[NormalizedListing]]:
+        """
+        Answer a search from a cached wider one (larger circle, looser range
+        filters) that contains it, filtering the cached listings locally.
+        The search's own entry never counts: its miss may be an XFetch early
+        expiry that must reach the provider.
+        """
+        covering = self.geo_index.find_covering(request, op, exclude_key=cache_key)
+        if covering is None:
+            return None
+        nearby = self._from_spatial_index(request, op, covering)
+        if nearby is not None:
+            return nearby
+
+        # An early-expiry roll is meant for the key's own readers; here a miss
+        # must mean the entry is gone before it is dropped from the index
+        cached = await self.cache.get(covering.key, early_expiry=False)
+        if cached is None or cached.error is not None:
+            # Evicted or expired in the shared cache
+            self.geo_index.discard(covering.key)
+            return None
+        if self._is_stale(cached):
+            # Only exact hits revalidate; a fresh fetch of this narrower
+            # search is cheaper than serving stale data indefinitely.
+            return None
+
+        logger.info("Listings cache CONTAINED (%s): %s", op.value, covering.key)
+        return filter_to_request(cached.items, request, covering)
+
+    def _from_spatial_index(
+        self, request: ListingsRequest, op: OperationType, covering: CoveredSearch
+    ) -> Optional[List[NormalizedListing]]:
+        """
+        Answer a radius search from the in-process spatial index when the
+        covering search's listings are still held there and fresh, without
+        reading the listings cache. The index may also hold listings from
+        other recent searches in the circle; they pass the same filters.
+        """
+        if (
+            self.spatial_index is None
+            or not covering.is_circle
+            or request.latitude is None
+            or request.longitude is None
+            or not self.spatial_index.is_fresh(
+                covering.key, settings.cache_soft_ttl_seconds
+            )
+        ):
+            return None
+
+        nearby = self.spatial_index.radius(
+            op, request.latitude, request.longitude, request.radius_miles
+        )
+        logger.info("Listings SPATIAL (%s): %s", op.value, covering.key)
+        return filter_to_request(nearby, request, None)
 
     async def get_regional_metrics(self, request: ListingsRequest) -> RegionalMetrics:
         rentals = await self.get_rental_data(request)
@@ -135,16 +235,174 @@ class ListingsService:
 
         return [PropertyListing(**listing) for listing in mock_listings]
 
+    async def _fetch_and_cache(
+        self,
+        request: ListingsRequest,
+        op: OperationType,
+        cache_key: str,
+    ) -> List[NormalizedListing]:
+        """
+        Fetch from the provider and fill the cache. Runs once per in-flight
+        cache key; concurrent identical requests share the result. Listings
+        are cached in provider order; callers apply their own sort.
+
+        When the cache supports leases, only the leaseholder across workers
+        calls the provider; the rest wait for its value and fall back to
+        fetching themselves if the wait runs out.
+        """
+        token = None
+        if isinstance(self.cache, CacheLeasePort) and self.cache.leases_enabled:
+            token = await self.cache.acquire_lease(cache_key)
+            if token is None:
+                cached = await self.cache.wait_for_value(
+                    cache_key, self.lease_wait_seconds
+                )
+                if cached is not None:
+                    logger.info(
+                        "Listings cache FILLED by peer (%s): %s", op.value, cache_key
+                    )
+                    if cached.error is not None:
+                        raise ProviderClientError(cached.error)
+                    return cached.items
+
+        try:
+            return await self._fetch_and_store(request, op, cache_key)
+        finally:
+            if token is not None:
+                await self.cache.release_lease(cache_key, token)
+
+    async def _fetch_and_store(
+        self,
+        request: ListingsRequest,
+        op: OperationType,
+        cache_key: str,
+        store_errors: bool = True,
+    ) -> List[NormalizedListing]:
+        """
+        Fetch and cache the listings. With store_errors off (background
+        refreshes), a client error is only raised, so it cannot replace the
+        stale entry still being served.
+        """
+        start = time.perf_counter()
+        try:
+            if op == OperationType.SALES:
+                listings = await self.listings_port.fetch_sales(request)
+            else:
+                listings = await self.listings_port.fetch_rentals(request)
+        except ProviderClientError as exc:
+            # Deterministic for this request; retrying only spends quota.
+            # Server errors and timeouts are transient and never cached.
+            if store_errors:
+                await self._store_error(op, cache_key, exc)
+            raise
+
+        if self.listing_index is not None:
+            # Lets POST /comps resolve these ids on any worker
+            await self.listing_index.register(listings)
+        if self.rent_index is not None and op == OperationType.RENTALS:
+            # Folded into the per-ZIP rent index in the background
+            self.rent_index.record(listings)
+        if self.cache:
+            # An empty result may be a listing-free area or a transient gap
+            # in the provider's data, so it is kept only briefly
+            ttl = settings.cache_empty_ttl_seconds if not listings else None
+            await self.cache.set(
+                cache_key,
+                CachedListings(items=listings, fetched_at=time.time()),
+                ttl_seconds=ttl,
+                compute_seconds=time.perf_counter() - start,
+            )
+            logger.info("Listings cache SET (%s): %s", op.value, cache_key)
+            self.geo_index.register(
+                covered_search_for(cache_key, request, op, listings),
+                ttl or settings.cache_ttl_seconds,
+            )
+            if self.spatial_index is not None:
+                self.spatial_index.add(
+                    cache_key, op, listings, ttl or settings.cache_ttl_seconds
+                )
+        return listings
+
+    async def _store_error(
+        self, op: OperationType, cache_key: str, exc: ProviderClientError
+    ) -> None:
+        if not self.cache:
+            return
+        await self.cache.set(
+            cache_key,
+            CachedListings(items=[], fetched_at=time.time(), error=str(exc)),
+            ttl_seconds=settings.cache_error_ttl_seconds,
+        )
+        logger.info("Listings cache SET negative (%s): %s", op.value, cache_key)
+
+    def _is_stale(self, cached: CachedListings) -> bool:
+        soft_ttl = settings.cache_soft_ttl_seconds
+        if soft_ttl is None or cached.fetched_at is None:
+            return False
+        return time.time() - cached.fetched_at >= soft_ttl
+
+    def _schedule_refresh(
+        self,
+        request: ListingsRequest,
+        op: OperationType,
+        cache_key: str,
+    ) -> None:
+        """
+        Start one background refresh per stale key in this process. With
+        leases, a worker that cannot take the lease leaves it to the holder.
+        """
+        if cache_key in _background_refreshes:
+            return
+        task = asyncio.ensure_future(self._revalidate(request, op, cache_key))
+        _background_refreshes[cache_key] = task
+        task.add_done_callback(lambda t: _refresh_done(cache_key, t))
+
+    async def _revalidate(
+        self,
+        request: ListingsRequest,
+        op: OperationType,
+        cache_key: str,
+    ) -> None:
+        token = None
+        if isinstance(self.cache, CacheLeasePort) and self.cache.leases_enabled:
+            token = await self.cache.acquire_lease(cache_key)
+            if token is None:
+                logger.debug("Listings refresh owned by peer: %s", cache_key)
+                return
+        try:
+            # A failed refresh is logged by _refresh_done; the stale entry
+            # keeps being served until its hard TTL
+            await self._fetch_and_store(request, op, cache_key, store_errors=False)
+            logger.info("Listings cache REFRESHED (%s): %s", op.value, cache_key)
+        finally:
+            if token is not None:
+                await self.cache.release_lease(cache_key, token)
+
     def _build_cache_key(
         self,
         request: ListingsRequest,
         op: OperationType,
     ) -> str:
         """
-        Build a stable cache key from the request.
+        Build a stable cache key from the provider-relevant request fields.
         """
-        payload = json.dumps(request.model_dump(), sort_keys=True)
-        return f"{op.value}:{payload}"
+        return build_query_key(request, op)
+
+
+# In-flight stale-while-revalidate refreshes by cache key (process-wide, so
+# requests handled by different ListingsService instances share them)
+_background_refreshes: Dict[str, asyncio.Task] = {}
+
+
+def _refresh_done(cache_key: str, task: asyncio.Task) -> None:
+    if _background_refreshes.get(cache_key) is task:
+        del _background_refreshes[cache_key]
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(
+            "Listings background refresh failed: %s (%s)",
+            cache_key,
+            task.exception(),
+        )
 
 
 def sort_listings(
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+from app.domain.dto import ListingsRequest
+from app.domain.enums.context_request import OperationType
+
+# ~11 m at the equator; nearby centers share one provider fetch.
+COORDINATE_PRECISION = 4
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(value: Optional[str]) -> Optional[str]:
+    """Collapse whitespace and lower-case free-text location input."""
+    if value is None:
+        return None
+    cleaned = _WHITESPACE.sub(" ", value).strip().lower()
+    return cleaned or None
+
+
+def canonical_query(request: ListingsRequest) -> Dict[str, Any]:
+    """
+    Reduce a request to the fields that change the provider result.
+
+    Mirrors the location precedence of the RentCast mapper (lat/lon, address,
+    city + state, zip), so unused location fields do not split the key.
+    Pagination (`limit`, `offset`) and `sort` are excluded: they are applied
+    by the service over the cached superset.
+    """
+    query: Dict[str, Any] = {}
+
+    radius = request.radius_miles or settings.rentcast_radius_miles_default
+    address = normalize_text(request.address)
+    city = normalize_text(request.city)
+    state = normalize_text(request.state)
+    zipcode = normalize_text(request.zip)
+
+    if request.latitude is not None and request.longitude is not None:
+        query["lat"] = round(request.latitude, COORDINATE_PRECISION)
+        query["lon"] = round(request.longitude, COORDINATE_PRECISION)
+        query["radius"] = float(radius)
+    elif address:
+        query["address"] = address
+        query["radius"] = float(radius)
+    elif city and state:
+        query["city"] = city
+        query["state"] = state
+    elif zipcode:
+        query["zip"] = zipcode
+
+    for name in ("beds", "baths", "price", "sqft", "year_built"):
+        value = getattr(request, name)
+        if value is not None and (value.min is not None or value.max is not None):
+            query[name] = value.to_provider()
+
+    query["days_old"] = (
+        request.days_old.to_provider()
+        if request.days_old is not None
+        else settings.rentcast_days_old_default
+    )
+    return query
+
+
+def build_query_key(request: ListingsRequest, op: OperationType) -> str:
+    """
+    Stable cache key for a listings search, e.g.
+    `rental:{"days_old":"*:270","lat":30.2672,"lon":-97.7431,"radius":5.0}`.
+    """
+    payload = json.dumps(
+        canonical_query(request), sort_keys=True, separators=(",", ":")
+    )
+    return f"{op.value}:{payload}"
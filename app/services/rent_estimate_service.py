@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import List, Optional
+
+from app.core.config import settings
+from app.core.pagination import slice_page
+from app.domain.dto import EstimatedListing, ListingsRequest, SortSpec
+from app.domain.enums.context_request import OperationType
+from app.domain.rent_estimator import KnnRentModel
+from app.providers.shared.lru_cache import LruTtlCache
+from app.services.listings_service import ListingsService
+from app.services.query_key import build_query_key
+
+logger = logging.getLogger(__name__)
+
+
+class RentalSearchError(Exception):
+    """The rental search behind an estimate failed; `error` is its cause."""
+
+    def __init__(self, error: BaseException) -> None:
+        super().__init__(str(error))
+        self.error = error
+
+
+@dataclass
+class RentEstimatesResult:
+    """One page of sale listings with rent estimates."""
+
+    listings: List[EstimatedListing]
+    total: int
+    region_key: str
+    rentals_used: int
+    estimator_cached: bool
+    provider_calls: int
+
+
+def rental_search_for(request: ListingsRequest) -> ListingsRequest:
+    """
+    The rental search matching a sale search: same location and property
+    filters, without the (sale) price range or paging.
+    """
+    return request.model_copy(update={"price": None, "offset": 0, "sort": SortSpec()})
+
+
+class RentEstimateService:
+    """
+    Estimates rent for sale listings from rentals in the same region.
+
+    The region is the matching rental search (see `rental_search_for`);
+    its kNN model is fitted once and cached by that search's query key, so
+    later pages and repeat searches only run the sale search. On a miss
+    the sale and rental searches run concurrently; a failed rental search
+    is raised as RentalSearchError so it is reported as such.
+    """
+
+    def __init__(
+        self,
+        listings_service: ListingsService,
+        models: Optional[LruTtlCache[KnnRentModel]] = None,
+    ) -> None:
+        self.listings_service = listings_service
+        self.models = models if models is not None else rent_models
+
+    async def estimate_sales(self, request: ListingsRequest) -> RentEstimatesResult:
+        rental_request = rental_search_for(request)
+        region_key = build_query_key(rental_request, OperationType.RENTALS)
+
+        model = self.models.get(region_key)
+        estimator_cached = model is not None
+        if model is None:
+            sales, rentals = await asyncio.gather(
+                self.listings_service.search_sales(request),
+                self.listings_service.search_rentals(rental_request),
+                return_exceptions=True,
+            )
+            if isinstance(sales, BaseException):
+                if isinstance(rentals, BaseException):
+                    logger.warning(
+                        "Rental search for %s also failed: %r", region_key, rentals
+                    )
+                raise sales
+            if isinstance(rentals, BaseException):
+                raise RentalSearchError(rentals) from rentals
+            provider_calls = sales.provider_calls + rentals.provider_calls
+            model = KnnRentModel.fit(rentals.listings, k=settings.rent_estimate_k)
+            if model is not None:
+                self.models.set(region_key, model)
+            else:
+                logger.info("No rentals to estimate from: %s", region_key)
+        else:
+            sales = await self.listings_service.search_sales(request)
+            provider_calls = sales.provider_calls
+
+        page = slice_page(sales.listings, request.limit, request.offset)
+        estimates = model.predict(page) if model is not None else [None] * len(page)
+        return RentEstimatesResult(
+            listings=[
+                EstimatedListing(**dict(listing), rent_estimate=estimate)
+                for listing, estimate in zip(page, estimates)
+            ],
+            total=len(sales.listings),
+            region_key=region_key,
+            rentals_used=0 if model is None else len(model),
+            estimator_cached=estimator_cached,
+            provider_calls=provider_calls,
+        )
+
+
+# Process-wide, so per-request services reuse fitted region models
+rent_models: LruTtlCache[KnnRentModel] = LruTtlCache(
+    max_weight=settings.rent_model_cache_entries,
+    ttl_seconds=settings.rent_model_ttl_seconds,
+)
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import List, Optional, Set
+
+from app.core.config import settings
+from app.domain.dto import (NormalizedListing, RentIndexBucket, SketchStats,
+                            ZipRentIndex)
+from app.domain.ports.sketch_store_port import SketchStorePort
+from app.domain.sketches import (MAX_BEDS_BUCKET, ListingSketch,
+                                 sketch_listings, zip_key)
+from app.providers.shared.lru_cache import LruTtlCache
+
+logger = logging.getLogger(__name__)
+
+BEDS_BUCKETS = [str(beds) for beds in range(MAX_BEDS_BUCKET)] + [f"{MAX_BEDS_BUCKET}+"]
+
+
+class RentIndexService:
+    """
+    Materialized rent index per ZIP and per (ZIP, bedroom bucket).
+
+    `record` folds freshly fetched rentals into the shared sketches in the
+    background, so searches never wait on it. A listing seen again at the
+    same price within the dedup window is skipped, which keeps overlapping
+    searches and refreshes on this worker from counting it twice (other
+    workers may still count it once each); a merge that fails or is dropped
+    releases its listings so a later search records them. Listings without
+    a provider id cannot be told apart, so they are left out.
+    `get_zip_index` reads one ZIP's sketches in a single round trip,
+    independent of how many listings they summarize.
+    """
+
+    def __init__(
+        self,
+        store: SketchStorePort,
+        seen: Optional[LruTtlCache[bool]] = None,
+        max_pending: int | None = None,
+    ) -> None:
+        self.store = store
+        self.seen = seen if seen is not None else recorded_listings
+        self.max_pending = max_pending or settings.rent_index_max_pending
+
+    def record(self, rentals: List[NormalizedListing]) -> None:
+        if len(_pending_merges) >= self.max_pending:
+            logger.warning("Rent index backlog full; skipped %s rentals", len(rentals))
+            return
+        fresh = []
+        keys = []
+        for listing in rentals:
+            if not listing.has_id:
+                continue
+            key = f"{listing.id}:{listing.pricing.list_price}"
+            if self.seen.get(key) is None:
+                # Marked now so overlapping searches skip it while the merge
+                # is in flight
+                self.seen.set(key, True)
+                fresh.append(listing)
+                keys.append(key)
+        if not fresh:
+            return
+        task = asyncio.ensure_future(self._merge(fresh, keys))
+        _pending_merges.add(task)
+        task.add_done_callback(_merge_done)
+
+    async def get_zip_index(self, zip_code: str) -> Optional[ZipRentIndex]:
+        """The ZIP's rent index, or None if no rentals there were recorded."""
+        keys = [zip_key(zip_code)] + [
+            zip_key(zip_code, bucket) for bucket in BEDS_BUCKETS
+        ]
+        found = await self.store.get_many(keys)
+        overall = found.get(keys[0])
+        if overall is None:
+            return None
+        now = time.time()
+        return ZipRentIndex(
+            zip=zip_code,
+            overall=_bucket(overall, None, now),
+            by_beds=[
+                _bucket(found[key], bucket, now)
+                for key, bucket in zip(keys[1:], BEDS_BUCKETS)
+                if key in found
+            ],
+        )
+
+    async def _merge(self, rentals: List[NormalizedListing], keys: List[str]) -> None:
+        stored = False
+        try:
+            sketches = sketch_listings(
+                rentals, k=settings.sketch_kll_k, observed_at=time.time()
+            )
+            stored = await self.store.merge(sketches)
+        finally:
+            if not stored:
+                for key in keys:
+                    self.seen.delete(key)
+
+
+def _bucket(sketch: ListingSketch, beds: Optional[str], now: float) -> RentIndexBucket:
+    updated_at = sketch.updated_at
+    return RentIndexBucket(
+        beds=beds,
+        listings=sketch.listings,
+        updated_at=updated_at,
+        age_seconds=None if updated_at is None else max(0.0, now - updated_at),
+        rent=SketchStats(**sketch.rent.describe()),
+        rent_per_sqft=SketchStats(**sketch.rent_per_sqft.describe()),
+        days_on_market=SketchStats(**sketch.dom.describe()),
+    )
+
+
+# Process-wide, so per-request service instances share the backlog and the
+# dedup window
+_pending_merges: Set[asyncio.Task] = set()
+recorded_listings: LruTtlCache[bool] = LruTtlCache(
+    max_weight=100_000, ttl_seconds=settings.rent_index_dedup_seconds
+)
+
+
+def _merge_done(task: asyncio.Task) -> None:
+    _pending_merges.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Rent index merge failed: %s", task.exception())
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Generic, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """
+    In-process request coalescing.
+
+    Concurrent calls sharing a key wait on one shared task and receive its
+    result (or its exception). The work runs in its own task, so a caller
+    that is cancelled does not cancel the flight for the others.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self.executions = 0
+        self.joins = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+            self.executions += 1
+        else:
+            self.joins += 1
+            logger.debug("Single-flight JOIN: %s", key)
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": len(self._in_flight),
+            "executions": self.executions,
+            "joins": self.joins,
+        }
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the exception retrieved even if every waiter went away
+        if not task.cancelled():
+            task.exception()
+
+
+# Shared singleton for app modules
+listings_single_flight: SingleFlight = SingleFlight()
@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.domain.dto import NormalizedListing
+from app.domain.enums.context_request import OperationType
+from app.utils.distance import bounding_box, great_circle_miles
+
+Cell = Tuple[int, int]
+
+# Slack on the box edges, so a point exactly on the circle survives the
+# prefilter despite float rounding in the box corners
+_EDGE_DEGREES = 1e-9
+
+
+@dataclass
+class _Point:
+    listing: NormalizedListing
+    lat: float
+    lon: float
+    cell: Cell
+    # Live batches holding this listing
+    refs: int = 0
+
+
+@dataclass
+class _Batch:
+    category: OperationType
+    ids: List[str]
+    fetched_at: float
+    expires_at: float
+    seq: int
+
+
+@dataclass
+class _Grid:
+    points: Dict[str, _Point] = field(default_factory=dict)
+    cells: Dict[Cell, Dict[str, _Point]] = field(default_factory=dict)
+
+
+class ListingSpatialIndex:
+    """
+    In-process grid index of recently fetched listings, per category.
+
+    Listings are bucketed into lat/lon cells of `cell_degrees` and arrive in
+    batches, one per provider search (keyed by its cache key). A batch lives
+    for its TTL; a listing lives while any live batch holds it and keeps the
+    newest body seen. Past `max_listings`, whole batches are evicted oldest
+    first, so a batch still held is always complete and can stand in for
+    its search.
+
+    Queries visit only the cells overlapping the bounding box, check the box
+    exactly, and (for radius queries) run haversine on the survivors.
+    """
+
+    def __init__(
+        self,
+        cell_degrees: float = 0.05,
+        ttl_seconds: float = 3600,
+        max_listings: int = 100000,
+    ) -> None:
+        self.cell_degrees = cell_degrees
+        self.ttl_seconds = ttl_seconds
+        self.max_listings = max_listings
+        self._grids: Dict[OperationType, _Grid] = {}
+        self._batches: "OrderedDict[str, _Batch]" = OrderedDict()
+        # (expires_at, key, seq) min-heap; entries of replaced batches are
+        # skipped when popped
+        self._expiry: List[Tuple[float, str, int]] = []
+        self._seq = itertools.count()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return sum(len(grid.points) for grid in self._grids.values())
+
+    def add(
+        self,
+        key: str,
+        category: OperationType,
+        listings: List[NormalizedListing],
+        ttl_seconds: Optional[float] = None,
+        fetched_at: Optional[float] = None,
+    ) -> None:
+        """
+        Index one search's listings under its key, replacing an earlier
+        batch with the same key. Listings without coordinates are skipped.
+        """
+        self.evict_expired()
+        self.discard(key)
+        grid = self._grids.setdefault(category, _Grid())
+        ids: List[str] = []
+        seen: Set[str] = set()
+        for i, listing in enumerate(listings):
+            lat, lon = listing.address.lat, listing.address.lon
+            # Listings without a provider id all share `prov:<name>:unknown`;
+            # key them by their place in this batch so none collapse
+            point_id = listing.id if listing.has_id else f"{key}#{i}"
+            if lat is None or lon is None or point_id in seen:
+                continue
+            seen.add(point_id)
+            point = grid.points.get(point_id)
+            if point is not None:
+                self._unlink(grid, point)
+            refs = point.refs if point is not None else 0
+            point = _Point(listing, lat, lon, self._cell(lat, lon), refs + 1)
+            grid.points[point_id] = point
+            grid.cells.setdefault(point.cell, {})[point_id] = point
+            ids.append(point_id)
+
+        ttl = min(ttl_seconds or self.ttl_seconds, self.ttl_seconds)
+        batch = _Batch(
+            category=category,
+            ids=ids,
+            fetched_at=fetched_at if fetched_at is not None else time.time(),
+            expires_at=time.monotonic() + ttl,
+            seq=next(self._seq),
+        )
+        self._batches[key] = batch
+        heapq.heappush(self._expiry, (batch.expires_at, key, batch.seq))
+        while len(self) > self.max_listings and self._batches:
+            _, oldest = self._batches.popitem(last=False)
+            self._release(oldest)
+            self.evictions += 1
+
+    def discard(self, key: str) -> None:
+        batch = self._batches.pop(key, None)
+        if batch is not None:
+            self._release(batch)
+
+    def is_fresh(self, key: str, max_age_seconds: Optional[float] = None) -> bool:
+        """
+        True if the search's batch is still held and, when max_age_seconds
+        is set, was fetched less than that long ago.
+        """
+        batch = self._batches.get(key)
+        if batch is None or batch.expires_at <= time.monotonic():
+            return False
+        if max_age_seconds is None:
+            return True
+        return time.time() - batch.fetched_at < max_age_seconds
+
+    def bbox(
+        self,
+        category: OperationType,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+    ) -> List[NormalizedListing]:
+        """
+        Listings inside the box, edges included. min_lon > max_lon means
+        the box crosses the antimeridian.
+        """
+        return [
+            point.listing
+            for point in self._in_box(category, min_lat, min_lon, max_lat, max_lon)
+        ]
+
+    def radius(
+        self,
+        category: OperationType,
+        lat: float,
+        lon: float,
+        radius_miles: float,
+    ) -> List[NormalizedListing]:
+        """
+        Listings within radius_miles of (lat, lon), nearest first.
+        """
+        min_lat, min_lon, max_lat, max_lon = bounding_box(lat, lon, radius_miles)
+        found: List[Tuple[float, NormalizedListing]] = []
+        for point in self._in_box(category, min_lat, min_lon, max_lat, max_lon):
+            distance = great_circle_miles(lat, lon, point.lat, point.lon)
+            if distance <= radius_miles:
+                found.append((distance, point.listing))
+        found.sort(key=lambda item: item[0])
+        return [listing for _, listing in found]
+
+    def evict_expired(self) -> None:
+        now = time.monotonic()
+        while self._expiry and self._expiry[0][0] <= now:
+            _, key, seq = heapq.heappop(self._expiry)
+            batch = self._batches.get(key)
+            if batch is not None and batch.seq == seq:
+                del self._batches[key]
+                self._release(batch)
+
+    def clear(self) -> None:
+        self._grids.clear()
+        self._batches.clear()
+        self._expiry.clear()
+
+    def _in_box(
+        self,
+        category: OperationType,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+    ) -> Iterator[_Point]:
+        self.evict_expired()
+        grid = self._grids.get(category)
+        if grid is None:
+            return
+        min_lat -= _EDGE_DEGREES
+        max_lat += _EDGE_DEGREES
+        if min_lon > max_lon:
+            spans = [
+                (min_lon - _EDGE_DEGREES, 180.0),
+                (-180.0, max_lon + _EDGE_DEGREES),
+            ]
+        else:
+            spans = [(min_lon - _EDGE_DEGREES, max_lon + _EDGE_DEGREES)]
+
+        for west, east in spans:
+            for cell in self._cells_in(grid, min_lat, west, max_lat, east):
+                for point in grid.cells[cell].values():
+                    if min_lat <= point.lat <= max_lat and west <= point.lon <= east:
+                        yield point
+
+    def _cells_in(
+        self,
+        grid: _Grid,
+        min_lat: float,
+        min_lon: float,
+        max_lat: float,
+        max_lon: float,
+    ) -> List[Cell]:
+        low_row, low_col = self._cell(min_lat, min_lon)
+        high_row, high_col = self._cell(max_lat, max_lon)
+        rows = range(low_row, high_row + 1)
+        cols = range(low_col, high_col + 1)
+        if len(rows) * len(cols) > len(grid.cells):
+            # A box wider than the occupied grid: scan the occupied cells
+            return [cell for cell in grid.cells if cell[0] in rows and cell[1] in cols]
+        return [(row, col) for row in rows for col in cols if (row, col) in grid.cells]
+
+    def _cell(self, lat: float, lon: float) -> Cell:
+        return (
+            math.floor(lat / self.cell_degrees),
+            math.floor(lon / self.cell_degrees),
+        )
+
+    def _release(self, batch: _Batch) -> None:
+        grid = self._grids.get(batch.category)
+        if grid is None:
+            return
+        for listing_id in batch.ids:
+            point = grid.points.get(listing_id)
+            if point is None:
+                continue
+            point.refs -= 1
+            if point.refs <= 0:
+                del grid.points[listing_id]
+                self._unlink(grid, point)
+
+    def _unlink(self, grid: _Grid, point: _Point) -> None:
+        cell = grid.cells.get(point.cell)
+        if cell is None:
+            return
+        cell.pop(point.listing.id, None)
+        if not cell:
+            del grid.cells[point.cell]
+
+
+# Process-wide, so per-request ListingsService instances share it
+listings_spatial_index = ListingSpatialIndex(
+    cell_degrees=settings.spatial_index_cell_degrees,
+    ttl_seconds=settings.spatial_index_ttl_seconds,
+    max_listings=settings.spatial_index_max_listings,
+)
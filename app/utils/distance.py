@@ -1,6 +1,9 @@
 import math
 from typing import Tuple
 
+# Radius of earth in miles
+EARTH_RADIUS_MILES = 3956
+
 
 # TODO: Consider using 2 Center objects instead of lat/lon
 # TODO: Consider renaming Center
@@ -11,6 +14,14 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
 
     Returns distance in miles, rounded to 1 decimal place
     """
+    return round(great_circle_miles(lat1, lon1, lat2, lon2), 1)
+
+
+def great_circle_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Unrounded haversine distance in miles, for containment checks where
+    rounding would let a point slip outside a radius.
+    """
     # Convert decimal degrees to radians
     lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
 
@@ -23,12 +34,35 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     )
     c = 2 * math.asin(math.sqrt(a))
 
-    # Radius of earth in miles
-    r = 3956
+    return c * EARTH_RADIUS_MILES
+
+
+def bounding_box(
+    lat: float, lon: float, radius_miles: float
+) -> Tuple[float, float, float, float]:
+    """
+    Smallest (min_lat, min_lon, max_lat, max_lon) box holding every point
+    within radius_miles of (lat, lon). The longitude span is widest above
+    or below the center, not at its latitude, so it uses the tangent
+    meridians rather than the center's parallel. min_lon > max_lon when the
+    box crosses the antimeridian; a circle reaching a pole spans all
+    longitudes.
+    """
+    angular = radius_miles / EARTH_RADIUS_MILES
+    min_lat = lat - math.degrees(angular)
+    max_lat = lat + math.degrees(angular)
+    if min_lat <= -90.0 or max_lat >= 90.0 or angular >= math.pi / 2:
+        return max(min_lat, -90.0), -180.0, min(max_lat, 90.0), 180.0
+
+    span = math.sin(angular) / math.cos(math.radians(lat))
+    if span >= 1.0:
+        return min_lat, -180.0, max_lat, 180.0
+    delta = math.degrees(math.asin(span))
+    return min_lat, _wrap(lon - delta), max_lat, _wrap(lon + delta)
+
 
-    # Calculate the result and round to 1 decimal place
-    distance = c * r
-    return round(distance, 1)
+def _wrap(lon: float) -> float:
+    return (lon + 180.0) % 360.0 - 180.0
 
 
 #   # calculate distance for each listing
@@ -0,0 +1,94 @@
+"""
+Compare cached listings encodings: bytes per entry and decode time.
+
+    python -m benchmarks.bench_cache_codec [--listings 100] [--rounds 200]
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import timeit
+
+from app.domain.dto import (HOA, Address, CachedListings, Dates, Facts,
+                            NormalizedListing, Pricing)
+from app.providers.redis.codecs import CachedListingsCodec
+
+
+def sample_entry(count: int, seed: int = 7) -> CachedListings:
+    rng = random.Random(seed)
+    items = []
+    for i in range(count):
+        items.append(
+            NormalizedListing(
+                id=f"prov:rentcast:{rng.randrange(10**9)}",
+                category="rental",
+                status="Active",
+                address=Address(
+                    formatted=f"{rng.randrange(9999)} Oak St, Austin, TX 787{i % 50:02d}",
+                    line1=f"{rng.randrange(9999)} Oak St",
+                    city="Austin",
+                    state="TX",
+                    zip=f"787{i % 50:02d}",
+                    county="Travis",
+                    lat=30.2 + rng.random() / 10,
+                    lon=-97.8 + rng.random() / 10,
+                ),
+                facts=Facts(
+                    beds=rng.randint(1, 4),
+                    baths=rng.choice([1.0, 1.5, 2.0, 2.5]),
+                    sqft=rng.randint(600, 2400),
+                    year_built=rng.randint(1960, 2023),
+                    property_type="Apartment",
+                ),
+                pricing=Pricing(
+                    list_price=float(rng.randint(1200, 3500)), period="monthly"
+                ),
+                dates=Dates(
+                    listed="2025-10-01T00:00:00.000Z",
+                    last_seen="2025-11-01T00:00:00.000Z",
+                ),
+                hoa=HOA(),
+            )
+        )
+    return CachedListings(items=items, fetched_at=1_700_000_000.0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--listings", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    entry = sample_entry(args.listings)
+    codec = CachedListingsCodec()
+    json_raw = entry.model_dump_json()
+    codec_raw = codec.encode(entry)
+    assert codec.decode(codec_raw) == entry
+
+    json_us = (
+        timeit.timeit(
+            lambda: CachedListings.model_validate_json(json_raw), number=args.rounds
+        )
+        / args.rounds
+        * 1e6
+    )
+    codec_us = (
+        timeit.timeit(lambda: codec.decode(codec_raw), number=args.rounds)
+        / args.rounds
+        * 1e6
+    )
+    encode_us = (
+        timeit.timeit(lambda: codec.encode(entry), number=args.rounds)
+        / args.rounds
+        * 1e6
+    )
+
+    print(f"{args.listings} listings per entry, {args.rounds} rounds")
+    print(f"{'format':<12}{'bytes':>10}{'decode µs':>12}")
+    print(f"{'json':<12}{len(json_raw.encode()):>10}{json_us:>12.0f}")
+    print(f"{'columnar':<12}{len(codec_raw):>10}{codec_us:>12.0f}")
+    print(f"columnar encode: {encode_us:.0f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Compare the scalar and columnar regional metrics engines.
+
+    python -m benchmarks.bench_regional_metrics [--sizes 1000,100000,1000000]
+        [--scalar-max 100000]
+
+Listings are drawn from a pool of distinct synthetic listings and repeated
+to reach each size, so building the input stays cheap at 1M. The scalar
+reference is skipped above --scalar-max; where both run, their output is
+checked for equality.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from typing import Callable, List
+
+from app.domain.dto import (Address, Dates, Facts, NormalizedListing, Pricing,
+                            RegionalMetrics)
+from app.domain.regional_metrics import (compute_regional_metrics,
+                                         compute_regional_metrics_scalar)
+
+CENTER = (30.27, -97.74)
+POOL_SIZE = 20_000
+
+
+def sample_pool(count: int, seed: int = 7) -> List[NormalizedListing]:
+    rng = random.Random(seed)
+    types = ["Apartment", "Condo", "Single Family", "Townhouse", None]
+    pool = []
+    for i in range(count):
+        pool.append(
+            NormalizedListing(
+                id=f"prov:rentcast:{i}",
+                category="rental",
+                address=Address(
+                    zip=f"787{rng.randrange(60):02d}",
+                    lat=30.1 + rng.random() / 3,
+                    lon=-97.9 + rng.random() / 3,
+                ),
+                facts=Facts(
+                    sqft=rng.choice([None, rng.randint(450, 3200)]),
+                    property_type=rng.choice(types),
+                ),
+                pricing=Pricing(list_price=float(rng.randint(900, 5200))),
+                dates=Dates(
+                    listed=f"2025-{rng.randint(1, 9):02d}-{rng.randint(1, 28):02d}",
+                    last_seen="2025-10-15",
+                ),
+            )
+        )
+    return pool
+
+
+def listings(size: int, pool: List[NormalizedListing]) -> List[NormalizedListing]:
+    return (pool * (size // len(pool) + 1))[:size]
+
+
+def timed(fn: Callable[[], RegionalMetrics]) -> tuple[float, RegionalMetrics]:
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="1000,100000,1000000")
+    parser.add_argument("--scalar-max", type=int, default=100_000)
+    args = parser.parse_args()
+
+    pool = sample_pool(POOL_SIZE)
+    print(f"{'listings':>10}{'scalar s':>12}{'columnar s':>12}{'speedup':>10}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        rentals = listings(size, pool)
+        columnar_s, columnar = timed(lambda: compute_regional_metrics(rentals, *CENTER))
+        if size > args.scalar_max:
+            print(f"{size:>10}{'-':>12}{columnar_s:>12.3f}{'-':>10}")
+            continue
+        scalar_s, scalar = timed(
+            lambda: compute_regional_metrics_scalar(rentals, *CENTER)
+        )
+        assert columnar == scalar, f"engines disagree at {size} listings"
+        print(
+            f"{size:>10}{scalar_s:>12.3f}{columnar_s:>12.3f}"
+            f"{scalar_s / columnar_s:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Time the summary statistics of one column (min, max, mean, median, p25,
+p75): the former per-statistic helpers, which sorted the list again for the
+median and for each percentile, against a SampleSummary that sorts once.
+
+    python -m benchmarks.bench_sample_summary [--sizes 100,10000,1000000]
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import random
+import timeit
+from statistics import mean, median
+from typing import Dict, List, Optional
+
+from app.domain.sample_summary import SampleSummary
+
+
+def _percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q
+    lower, upper = math.floor(rank), math.ceil(rank)
+    if lower == upper:
+        return ordered[int(rank)]
+    return ordered[lower] * (upper - rank) + ordered[upper] * (rank - lower)
+
+
+def per_statistic(values: List[float]) -> Dict[str, Optional[float]]:
+    return {
+        "count": len(values),
+        "min": min(values),
+        "max": max(values),
+        "mean": mean(values),
+        "median": median(values),
+        "p25": _percentile(values, 0.25),
+        "p75": _percentile(values, 0.75),
+    }
+
+
+def single_sort(values: List[float]) -> Dict[str, Optional[float]]:
+    return SampleSummary.of(values).describe()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", default="100,10000,1000000")
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    print(f"{'values':>10}{'per-stat ms':>14}{'summary ms':>14}{'speedup':>10}")
+    for size in (int(value) for value in args.sizes.split(",")):
+        values = [float(rng.randint(900, 5200)) for _ in range(size)]
+        assert per_statistic(values) == single_sort(values)
+        rounds = max(1, 200_000 // size)
+        before = timeit.timeit(lambda: per_statistic(values), number=rounds)
+        after = timeit.timeit(lambda: single_sort(values), number=rounds)
+        print(
+            f"{size:>10}{before / rounds * 1e3:>14.3f}{after / rounds * 1e3:>14.3f}"
+            f"{before / after:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from typing import List, Literal, Optional
+from typing import Dict, List, Literal, Optional
 
-from app.domain.dto import (HOA, Address, Dates, Facts, ListingsRequest,
+from app.domain.dto import (HOA, Address, Center, Dates, Facts,
+                            ListingsRequest, ListingsSearchResult,
                             NormalizedListing, Pricing, ProviderInfo)
+from app.domain.exceptions.provider_exceptions import ProviderNoResultsError
+from app.domain.sketches import ListingSketch
 
 
 def make_listing(
@@ -35,9 +38,14 @@ class StubListingsService:
         self,
         listings: Optional[List[NormalizedListing]] = None,
         error: Exception | None = None,
+        rentals: Optional[List[NormalizedListing]] = None,
+        rental_error: Exception | None = None,
     ):
         self.listings = listings or []
         self.error = error
+        self.rental_error = rental_error
+        # Rental searches return `rentals` when given, else `listings`
+        self.rentals = rentals
         self.requests: List[ListingsRequest] = []
 
     async def get_sale_data(self, request: ListingsRequest) -> List[NormalizedListing]:
@@ -50,6 +58,72 @@ class StubListingsService:
         self, request: ListingsRequest
     ) -> List[NormalizedListing]:
         self.requests.append(request)
-        if self.error:
-            raise self.error
-        return self.listings
+        if self.error or self.rental_error:
+            raise self.error or self.rental_error
+        return self.listings if self.rentals is None else self.rentals
+
+    async def search_sales(self, request: ListingsRequest) -> ListingsSearchResult:
+        return ListingsSearchResult(listings=await self.get_sale_data(request))
+
+    async def search_rentals(self, request: ListingsRequest) -> ListingsSearchResult:
+        return ListingsSearchResult(listings=await self.get_rental_data(request))
+
+
+class StubListingIndex:
+    def __init__(self, listings: Optional[List[NormalizedListing]] = None):
+        self.by_key = {
+            (listing.category, listing.id): listing for listing in listings or []
+        }
+        self.requests: List[List[str]] = []
+
+    async def register(self, listings: List[NormalizedListing]) -> None:
+        self.by_key.update(
+            {(listing.category, listing.id): listing for listing in listings}
+        )
+
+    async def resolve(self, ids: List[str], category: Optional[str] = None):
+        self.requests.append(list(ids))
+        categories = [category] if category else ["rental", "sale"]
+        found, missing = [], []
+        for id_ in ids:
+            matches = [
+                self.by_key[(cat, id_)]
+                for cat in categories
+                if (cat, id_) in self.by_key
+            ]
+            found.extend(matches)
+            if not matches:
+                missing.append(id_)
+        return found, missing
+
+
+class StubGeocodingPort:
+    def __init__(self, centers: Optional[dict] = None):
+        self.centers = centers or {}
+        self.calls: List[str] = []
+
+    def cache_key(self, request: ListingsRequest) -> str:
+        return (request.address or "").lower()
+
+    def call_budget(self) -> Optional[int]:
+        return None
+
+    async def geocode(self, request: ListingsRequest) -> Center:
+        self.calls.append(request.address)
+        center = self.centers.get(request.address)
+        if center is None:
+            raise ProviderNoResultsError("no results")
+        return center
+
+
+class StubSketchStore:
+    def __init__(self):
+        self.sketches: Dict[str, ListingSketch] = {}
+
+    async def merge(self, sketches: Dict[str, ListingSketch]) -> bool:
+        for key, sketch in sketches.items():
+            self.sketches.setdefault(key, ListingSketch()).merge(sketch)
+        return True
+
+    async def get_many(self, keys: List[str]) -> Dict[str, ListingSketch]:
+        return {key: self.sketches[key] for key in keys if key in self.sketches}
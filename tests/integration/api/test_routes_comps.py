@@ -1,2 +1,84 @@
-def test_comps_success():
-    pass
+from __future__ import annotations
+
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_listing_index
+from app.main import app
+from tests.integration.api.helpers import StubListingIndex, make_listing
+
+client = TestClient(app)
+
+
+def test_comps_by_ids_resolves_from_listing_index():
+    index = StubListingIndex(
+        [
+            make_listing("a", 300000, 3, 2.0, 1500, 30.0, -97.0, "1 Main St", "sale"),
+            make_listing("b", 350000, 4, 2.5, 1900, 30.0, -97.0, "2 Main St", "sale"),
+        ]
+    )
+    app.dependency_overrides[get_listing_index] = lambda: index
+
+    try:
+        resp = client.post(
+            "/api/v1/comps", json={"ids": ["b", "gone", "a"], "metrics": []}
+        )
+    finally:
+        app.dependency_overrides.pop(get_listing_index, None)
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [row["id"] for row in body["rows"]] == ["b", "a"]
+    assert body["meta"]["source"] == "cache"
+    assert body["meta"]["missing_ids"] == ["gone"]
+    assert index.requests == [["b", "gone", "a"]]
+
+
+def test_comps_by_ids_resolves_only_the_requested_category():
+    index = StubListingIndex(
+        [
+            make_listing("a", 2100, 3, 2.0, 1500, 30.0, -97.0, "1 Main St", "rental"),
+            make_listing("a", 300000, 3, 2.0, 1500, 30.0, -97.0, "1 Main St", "sale"),
+        ]
+    )
+    app.dependency_overrides[get_listing_index] = lambda: index
+
+    try:
+        both = client.post("/api/v1/comps", json={"ids": ["a"], "metrics": []})
+        sale = client.post(
+            "/api/v1/comps",
+            json={"ids": ["a"], "category": "sale", "metrics": []},
+        )
+    finally:
+        app.dependency_overrides.pop(get_listing_index, None)
+
+    assert [row["base"]["category"] for row in both.json()["rows"]] == [
+        "rental",
+        "sale",
+    ]
+    assert [row["base"]["list_price"] for row in sale.json()["rows"]] == [300000]
+
+
+def test_comps_by_ids_without_index_reports_all_missing():
+    app.dependency_overrides[get_listing_index] = lambda: None
+
+    try:
+        resp = client.post("/api/v1/comps", json={"ids": ["a"], "metrics": []})
+    finally:
+        app.dependency_overrides.pop(get_listing_index, None)
+
+    assert resp.status_code == 200
+    assert resp.json()["rows"] == []
+    assert resp.json()["meta"]["missing_ids"] == ["a"]
+
+
+def test_comps_inline_does_not_touch_index():
+    listing = make_listing("a", 2000, 2, 1.0, 900, 30.0, -97.0, "1 Main St")
+
+    resp = client.post(
+        "/api/v1/comps",
+        json={"listings": [listing.model_dump()], "metrics": []},
+    )
+
+    assert resp.status_code == 200
+    assert resp.json()["meta"]["source"] == "inline"
+    assert resp.json()["meta"]["missing_ids"] == []
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_geocoding_service
+from app.core.config import settings
+from app.domain.dto import Center
+from app.main import app
+from app.providers.shared.lru_cache import LruTtlCache
+from app.services.geocoding_service import GeocodingService
+from tests.integration.api.helpers import StubGeocodingPort
+
+client = TestClient(app)
+
+
+def override_geocoding_service(port: StubGeocodingPort):
+    service = GeocodingService(
+        geocoding_port=port,
+        negative_cache=LruTtlCache(max_weight=10, ttl_seconds=60),
+    )
+    app.dependency_overrides[get_geocoding_service] = lambda: service
+
+
+def clear_overrides():
+    app.dependency_overrides.pop(get_geocoding_service, None)
+
+
+def test_batch_streams_one_line_per_input():
+    port = StubGeocodingPort({"1 Main St": Center(lat=30.0, lon=-97.0)})
+    override_geocoding_service(port)
+
+    try:
+        resp = client.post(
+            "/api/v1/geocode/batch",
+            json={
+                "locations": [
+                    {"address": "1 Main St"},
+                    {"latitude": 29.5, "longitude": -98.5},
+                    {"address": "1 main st"},
+                    {"address": "nowhere"},
+                    {"state": "TX"},
+                ]
+            },
+        )
+    finally:
+        clear_overrides()
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = {
+        row["index"]: row for row in map(json.loads, resp.text.strip().split("\n"))
+    }
+    assert sorted(lines) == [0, 1, 2, 3, 4]
+    assert lines[0]["center"] == {"lat": 30.0, "lon": -97.0}
+    assert lines[2]["center"] == lines[0]["center"]
+    assert lines[1] == {
+        "index": 1,
+        "input": {"latitude": 29.5, "longitude": -98.5},
+        "center": {"lat": 29.5, "lon": -98.5},
+        "cached": True,
+    }
+    assert lines[3]["error"] == "provider_no_results"
+    assert lines[4]["error"] == "invalid_location"
+    assert sorted(port.calls) == ["1 Main St", "nowhere"]
+
+
+def test_batch_rejects_oversized_input(monkeypatch):
+    monkeypatch.setattr(settings, "geocode_batch_max_items", 2)
+    override_geocoding_service(StubGeocodingPort())
+
+    try:
+        resp = client.post(
+            "/api/v1/geocode/batch",
+            json={"locations": [{"zip": "78701"}] * 3},
+        )
+    finally:
+        clear_overrides()
+
+    assert resp.status_code == 422
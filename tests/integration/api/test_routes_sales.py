@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import logging
+
 from fastapi.testclient import TestClient
 
-from app.api.deps import get_listings_service
-from app.domain.exceptions.provider_exceptions import ProviderTimeoutError
+from app.api.deps import get_listings_service, get_rent_estimate_service
+from app.domain.exceptions.provider_exceptions import (ProviderNoResultsError,
+                                                       ProviderTimeoutError)
 from app.main import app
+from app.providers.shared.lru_cache import LruTtlCache
+from app.services.rent_estimate_service import RentEstimateService
 from tests.integration.api.helpers import StubListingsService
 
 client = TestClient(app)
@@ -72,3 +77,82 @@ def test_sales_returns_provider_error_when_upstream_fails(
     body = resp.json()
     assert body["detail"]["error"] == "provider_timeout"
     assert body["detail"]["request_id"]
+
+
+def test_sales_rent_estimates_enrich_each_sale(make_listing):
+    sales = [
+        make_listing("s1", 300000, 2, 1.0, 900, 30.0, -97.0, "A", category="sale"),
+        make_listing("s2", 450000, 3, 2.0, 1500, 30.0, -97.0, "B", category="sale"),
+    ]
+    rentals = [
+        make_listing("r1", 1800, 2, 1.0, 900, 30.0, -97.0, "C"),
+        make_listing("r2", 2600, 3, 2.0, 1500, 30.0, -97.0, "D"),
+    ]
+    listings_service = StubListingsService(listings=sales, rentals=rentals)
+    estimates = RentEstimateService(
+        listings_service, models=LruTtlCache(max_weight=10, ttl_seconds=60)
+    )
+    app.dependency_overrides[get_rent_estimate_service] = lambda: estimates
+
+    try:
+        resp = client.post(
+            "/api/v1/sales/rent-estimates",
+            json={"zip": "78701", "price": {"max": 500000}, "limit": 1},
+        )
+    finally:
+        app.dependency_overrides.pop(get_rent_estimate_service, None)
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [listing["id"] for listing in body["listings"]] == ["s1"]
+    estimate = body["listings"][0]["rent_estimate"]
+    assert 1800 <= estimate["rent"] < 2200
+    assert 0 < estimate["confidence"] <= 1
+    assert body["summary"]["page"]["next_offset"] == 1
+    assert body["meta"]["rentals_used"] == 2
+    assert body["meta"]["estimator_cached"] is False
+    # The rental search drops the sale price filter
+    assert [r.price for r in listings_service.requests] == [
+        listings_service.requests[0].price,
+        None,
+    ]
+
+
+def test_sales_rent_estimates_map_provider_errors():
+    listings_service = StubListingsService(error=ProviderTimeoutError("slow"))
+    estimates = RentEstimateService(
+        listings_service, models=LruTtlCache(max_weight=10, ttl_seconds=60)
+    )
+    app.dependency_overrides[get_rent_estimate_service] = lambda: estimates
+
+    try:
+        resp = client.post("/api/v1/sales/rent-estimates", json={"zip": "78701"})
+    finally:
+        app.dependency_overrides.pop(get_rent_estimate_service, None)
+
+    assert resp.status_code == 504
+
+
+def test_sales_rent_estimates_attribute_rental_search_errors(caplog, make_listing):
+    sales = [
+        make_listing("s1", 300000, 2, 1.0, 900, 30.0, -97.0, "A", category="sale"),
+    ]
+    listings_service = StubListingsService(
+        listings=sales, rental_error=ProviderNoResultsError("no rentals")
+    )
+    estimates = RentEstimateService(
+        listings_service, models=LruTtlCache(max_weight=10, ttl_seconds=60)
+    )
+    app.dependency_overrides[get_rent_estimate_service] = lambda: estimates
+
+    try:
+        with caplog.at_level(logging.WARNING, logger="app.api.errors"):
+            resp = client.post("/api/v1/sales/rent-estimates", json={"zip": "78701"})
+    finally:
+        app.dependency_overrides.pop(get_rent_estimate_service, None)
+
+    assert resp.status_code == 404
+    assert resp.json()["detail"]["error"] == "provider_no_results"
+    assert [record.getMessage() for record in caplog.records] == [
+        "rental: provider_no_results"
+    ]
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_rent_index_service
+from app.main import app
+from app.providers.shared.lru_cache import LruTtlCache
+from app.services.rent_index_service import RentIndexService
+from tests.integration.api.helpers import StubSketchStore, make_listing
+
+client = TestClient(app)
+
+
+def _rent_index_with(*listings) -> RentIndexService:
+    service = RentIndexService(
+        StubSketchStore(), seen=LruTtlCache(max_weight=100, ttl_seconds=60)
+    )
+
+    async def record():
+        service.record(list(listings))
+        await asyncio.gather(*asyncio.all_tasks() - {asyncio.current_task()})
+
+    asyncio.run(record())
+    return service
+
+
+def _rental(listing_id: str, price: float, beds: int):
+    listing = make_listing(listing_id, price, beds, 1.0, 1000, 30.0, -97.0)
+    listing.address.zip = "78701"
+    return listing
+
+
+def test_rent_index_returns_zip_and_bedroom_stats():
+    service = _rent_index_with(_rental("a", 2000, 2), _rental("b", 3000, 3))
+    app.dependency_overrides[get_rent_index_service] = lambda: service
+
+    try:
+        resp = client.get("/api/v1/zips/78701/rent-index")
+    finally:
+        app.dependency_overrides.pop(get_rent_index_service, None)
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["zip"] == "78701"
+    assert body["overall"]["listings"] == 2
+    assert body["overall"]["rent"]["mean"] == 2500.0
+    assert body["overall"]["updated_at"] is not None
+    assert [bucket["beds"] for bucket in body["by_beds"]] == ["2", "3"]
+
+
+def test_rent_index_unknown_zip_is_404():
+    service = _rent_index_with()
+    app.dependency_overrides[get_rent_index_service] = lambda: service
+
+    try:
+        resp = client.get("/api/v1/zips/99999/rent-index")
+    finally:
+        app.dependency_overrides.pop(get_rent_index_service, None)
+
+    assert resp.status_code == 404
+
+
+def test_rent_index_rejects_malformed_zip():
+    app.dependency_overrides[get_rent_index_service] = lambda: None
+
+    try:
+        resp = client.get("/api/v1/zips/787/rent-index")
+    finally:
+        app.dependency_overrides.pop(get_rent_index_service, None)
+
+    assert resp.status_code == 422
+
+
+def test_rent_index_without_redis_is_503():
+    app.dependency_overrides[get_rent_index_service] = lambda: None
+
+    try:
+        resp = client.get("/api/v1/zips/78701/rent-index")
+    finally:
+        app.dependency_overrides.pop(get_rent_index_service, None)
+
+    assert resp.status_code == 503
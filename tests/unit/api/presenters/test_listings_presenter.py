@@ -64,3 +64,23 @@ def test_create_response_handles_optional_request_fields():
     assert result.input.filters.baths == 1.5
     assert result.input.filters.days_old == "1"
     assert result.meta.category == "rental"
+
+
+def test_create_response_reports_cache_meta():
+    req = ListingsRequest(latitude=30.0, longitude=-97.0)
+    start = time.perf_counter()
+
+    result = create_response(
+        [_listing("1", 100)],
+        req,
+        OperationType.SALES,
+        "rid",
+        start,
+        cache="hit",
+        provider_calls=0,
+        stale=True,
+    )
+
+    assert result.meta.cache == "hit"
+    assert result.meta.provider_calls == 0
+    assert result.meta.stale is True
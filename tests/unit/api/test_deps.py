@@ -5,10 +5,20 @@ from unittest.mock import ANY, MagicMock, patch
 import pytest
 
 from app.api import deps
-from app.api.deps import get_listings_cache, get_listings_service
-from app.domain.dto import CachedListings
+from app.api.deps import (get_geocode_cache, get_geocoding_service,
+                          get_listing_index, get_listings_cache,
+                          get_listings_service, get_rent_estimate_service,
+                          get_rent_index_service)
+from app.domain.dto import CachedListings, CachedSearchRefs, Center
+from app.providers.opencage.adapter import OpenCageAdapter
+from app.providers.redis import tiered_adapter
 from app.providers.redis.adapter import RedisModelCacheAdapter
+from app.providers.redis.listing_index import RedisListingIndex
+from app.providers.redis.listings_store import NormalizedListingsCacheAdapter
+from app.providers.redis.tiered_adapter import LocalCacheAdapter
 from app.services.listings_service import ListingsService
+from app.services.rent_estimate_service import RentEstimateService, rent_models
+from app.services.rent_index_service import RentIndexService
 
 
 @pytest.mark.asyncio
@@ -30,9 +40,48 @@ async def test_get_listings_cache_builds_adapter(
         model_cls=CachedListings,
         prefix=ANY,
         default_ttl=ANY,
+        lease_ttl_ms=ANY,
+        xfetch_beta=ANY,
+        ttl_jitter_ratio=ANY,
+        codec=ANY,
     )
 
 
+@pytest.mark.asyncio
+@patch("app.api.deps.get_redis_client")
+@patch("app.api.deps.is_redis_connected")
+async def test_get_listings_cache_builds_normalized_store(
+    mock_is_redis_connected, mock_get_redis_client
+):
+    mock_get_redis_client.return_value = MagicMock()
+    mock_is_redis_connected.return_value = True
+
+    with patch.object(deps.settings, "cache_layout", "normalized"):
+        cache = await get_listings_cache()
+
+    assert isinstance(cache, NormalizedListingsCacheAdapter)
+    assert cache.searches._model_cls is CachedSearchRefs
+
+
+@pytest.mark.asyncio
+@patch("app.api.deps.get_tiered_cache")
+@patch("app.api.deps.get_redis_client")
+@patch("app.api.deps.is_redis_connected")
+@patch("app.api.deps.RedisModelCacheAdapter")
+async def test_get_listings_cache_wraps_adapter_with_l1_when_enabled(
+    mock_adapter_cls, mock_is_redis_connected, mock_get_redis_client, mock_tiered
+):
+    mock_get_redis_client.return_value = MagicMock()
+    mock_is_redis_connected.return_value = True
+    mock_tiered.return_value = MagicMock()
+
+    with patch.object(deps.settings, "cache_l1_enabled", True):
+        cache = await get_listings_cache()
+
+    assert cache is mock_tiered.return_value
+    assert mock_tiered.call_args.args[0] is mock_adapter_cls.return_value
+
+
 @pytest.mark.asyncio
 @patch("app.api.deps.get_redis_client")
 @patch("app.api.deps.is_redis_connected")
@@ -50,17 +99,131 @@ async def test_get_listings_cache_returns_none_when_redis_is_not_connected(
 
 
 @pytest.mark.asyncio
-@patch("app.api.deps.get_listings_cache")
+@patch("app.api.deps.get_redis_client")
+@patch("app.api.deps.is_redis_connected")
+@patch("app.api.deps._listings_cache")
 @patch("app.api.deps.RentCastAdapter")
 @patch("app.api.deps.RentCastClient")
 async def test_get_listings_service_returns_args(
-    mock_rentcast_client, mock_rentcast_adapter, mock_get_listings_cache
+    mock_rentcast_client,
+    mock_rentcast_adapter,
+    mock_listings_cache,
+    mock_is_redis_connected,
+    mock_get_redis_client,
 ):
     mock_rentcast_client.return_value = MagicMock()
     mock_rentcast_adapter.return_value = MagicMock()
-    mock_get_listings_cache.return_value = MagicMock()
+    mock_listings_cache.return_value = MagicMock()
+    mock_get_redis_client.return_value = MagicMock()
+    mock_is_redis_connected.return_value = True
 
     service = await get_listings_service()
 
-    assert service.cache is mock_get_listings_cache.return_value
+    # Cache, listing index and rent index share one PING
+    mock_is_redis_connected.assert_awaited_once()
+    assert isinstance(service.rent_index, RentIndexService)
+    assert service.cache is mock_listings_cache.return_value
     assert service.listings_port is mock_rentcast_adapter.return_value
+    assert service.single_flight is deps.listings_single_flight
+    assert service.geo_index is deps.listings_geo_index
+    assert service.spatial_index is deps.listings_spatial_index
+    assert isinstance(service.listing_index, RedisListingIndex)
+
+
+@pytest.mark.asyncio
+@patch("app.api.deps.get_redis_client")
+@patch("app.api.deps.is_redis_connected")
+async def test_get_listing_index_requires_redis(
+    mock_is_redis_connected, mock_get_redis_client
+):
+    mock_get_redis_client.return_value = MagicMock()
+
+    mock_is_redis_connected.return_value = True
+    assert isinstance(await get_listing_index(), RedisListingIndex)
+
+    mock_is_redis_connected.return_value = False
+    assert await get_listing_index() is None
+
+
+@pytest.mark.asyncio
+@patch("app.api.deps.get_redis_client")
+@patch("app.api.deps.is_redis_connected")
+async def test_get_rent_index_service_requires_redis_and_setting(
+    mock_is_redis_connected, mock_get_redis_client
+):
+    mock_get_redis_client.return_value = MagicMock()
+    mock_is_redis_connected.return_value = True
+
+    assert isinstance(await get_rent_index_service(), RentIndexService)
+    with patch.object(deps.settings, "rent_index_enabled", False):
+        assert await get_rent_index_service() is None
+
+    mock_is_redis_connected.return_value = False
+    assert await get_rent_index_service() is None
+
+
+@pytest.mark.asyncio
+@patch("app.api.deps.get_tiered_cache")
+@patch("app.api.deps.get_redis_client")
+@patch("app.api.deps.is_redis_connected")
+async def test_get_geocode_cache_wraps_redis_with_l1(
+    mock_is_redis_connected, mock_get_redis_client, mock_get_tiered_cache
+):
+    redis = MagicMock()
+    mock_get_redis_client.return_value = redis
+    mock_is_redis_connected.return_value = True
+    mock_get_tiered_cache.return_value = MagicMock()
+
+    cache = await get_geocode_cache()
+
+    assert cache is mock_get_tiered_cache.return_value
+    l2 = mock_get_tiered_cache.call_args.args[0]
+    assert isinstance(l2, RedisModelCacheAdapter)
+    assert l2._model_cls is Center
+    assert mock_get_tiered_cache.call_args.kwargs["ttl_seconds"] == (
+        deps.settings.geocode_cache_ttl_seconds
+    )
+
+
+@pytest.mark.asyncio
+@patch("app.api.deps.get_redis_client")
+@patch("app.api.deps.is_redis_connected")
+async def test_get_geocode_cache_keeps_l1_without_redis(
+    mock_is_redis_connected, mock_get_redis_client
+):
+    mock_get_redis_client.return_value = MagicMock()
+    mock_is_redis_connected.return_value = False
+    center = Center(lat=30.27, lon=-97.74)
+
+    with patch.dict(tiered_adapter._l1_caches, clear=True):
+        cache = await get_geocode_cache()
+        await cache.set("austin", center)
+
+        assert isinstance(cache, LocalCacheAdapter)
+        # Later requests share the process-wide L1
+        assert await (await get_geocode_cache()).get("austin") == center
+
+
+@pytest.mark.asyncio
+@patch("app.api.deps.get_geocode_cache")
+async def test_get_geocoding_service_uses_opencage_and_cache(mock_get_geocode_cache):
+    mock_get_geocode_cache.return_value = MagicMock()
+
+    service = await get_geocoding_service()
+
+    assert isinstance(service.geocoding_port, OpenCageAdapter)
+    assert service.cache is mock_get_geocode_cache.return_value
+
+
+@pytest.mark.asyncio
+@patch("app.api.deps.get_listings_service")
+async def test_get_rent_estimate_service_wraps_listings_service(
+    mock_get_listings_service,
+):
+    mock_get_listings_service.return_value = MagicMock()
+
+    service = await get_rent_estimate_service()
+
+    assert isinstance(service, RentEstimateService)
+    assert service.listings_service is mock_get_listings_service.return_value
+    assert service.models is rent_models
@@ -38,3 +38,32 @@ def test_get_cache_stats():
             "used_memory_human": "1.5M",
         }
         mock_get_redis_stats.assert_called_once()
+
+
+def test_get_l1_cache_stats():
+    with patch(
+        "app.api.routes_utils.l1_cache_snapshot",
+        return_value={"rb:listings": {"hits": 3}},
+    ):
+        resp = client.get("/api/v1/cache/l1")
+
+    assert resp.status_code == 200
+    assert resp.json() == {"rb:listings": {"hits": 3}}
+
+
+def test_get_single_flight_stats():
+    resp = client.get("/api/v1/cache/single-flight")
+
+    assert resp.status_code == 200
+    assert set(resp.json()) == {"in_flight", "executions", "joins"}
+
+
+def test_get_provider_diagnostics():
+    resp = client.get("/api/v1/diagnostics/providers")
+
+    assert resp.status_code == 200
+    assert resp.json()["circuit_breakers"]["RentCast"]["state"] in {
+        "closed",
+        "open",
+        "half_open",
+    }
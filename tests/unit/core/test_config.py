@@ -0,0 +1,18 @@
+from app.core.config import LEASE_MARGIN_SECONDS, settings
+
+
+def test_lease_ttl_defaults_past_retry_deadline(monkeypatch):
+    monkeypatch.setattr(settings, "cache_lease_ttl_ms", None)
+    monkeypatch.setattr(settings, "retry_deadline_seconds", 20.0)
+
+    assert settings.lease_ttl_ms == (20.0 + LEASE_MARGIN_SECONDS) * 1000
+
+
+def test_lease_ttl_is_never_shorter_than_retry_deadline(monkeypatch):
+    monkeypatch.setattr(settings, "retry_deadline_seconds", 20.0)
+
+    monkeypatch.setattr(settings, "cache_lease_ttl_ms", 15000)
+    assert settings.lease_ttl_ms > 20000
+
+    monkeypatch.setattr(settings, "cache_lease_ttl_ms", 60000)
+    assert settings.lease_ttl_ms == 60000
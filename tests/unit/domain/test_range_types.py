@@ -90,3 +90,23 @@ def test_equality():
     assert r1 == r2
     assert r1 != r3
     assert r1 != "not a range"  # type: ignore[comparison-overlap]
+
+
+def test_from_provider_round_trips():
+    assert Range.from_provider("*:270").max == 270
+    assert Range.from_provider("*:270").min is None
+    r = Range.from_provider("1:3")
+    assert (r.min, r.max) == (1, 3)
+
+
+def test_covers_and_contains():
+    wide = Range[int](min=1, max=5)
+    assert wide.covers(Range[int](min=2, max=4))
+    assert not wide.covers(Range[int](min=0, max=4))
+    assert not wide.covers(Range[int](min=2))
+    assert not wide.covers(None)
+    assert Range[int]().covers(None)
+
+    assert wide.contains(5)
+    assert not wide.contains(6)
+    assert not wide.contains(None)
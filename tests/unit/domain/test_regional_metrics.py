@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import random
+
+import numpy as np
 from pytest import approx
 
 from app.domain.dto import Address, Dates, Facts, NormalizedListing, Pricing
-from app.domain.regional_metrics import compute_regional_metrics
+from app.domain.regional_metrics import (_columnar_pearson,
+                                         _pearson_correlation,
+                                         compute_regional_metrics,
+                                         compute_regional_metrics_scalar)
 
 
 def _make_listing(
@@ -129,3 +135,65 @@ def test_compute_regional_metrics_handles_empty_input() -> None:
     assert metrics.distance.median_distance_miles is None
     assert metrics.property_type_metrics == []
     assert metrics.clusters_by_zip == []
+
+
+def _random_listings(count: int, seed: int) -> list[NormalizedListing]:
+    rng = random.Random(seed)
+    listings = []
+    for i in range(count):
+        listed = f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+        listings.append(
+            _make_listing(
+                listing_id=f"l{i}",
+                # Few distinct rents so ties (and weighted-median ordering) matter
+                rent=rng.choice(
+                    [None, 1450.0, 1999.99, 2100.0, rng.uniform(900, 4000)]
+                ),
+                sqft=rng.choice([None, 0, -5, 700, rng.randint(400, 3000)]),
+                property_type=rng.choice([None, "condo", "single_family", "apt"]),
+                zip_code=rng.choice([None, "78701", "78702", "10001"]),
+                distance=rng.choice([None, 0.0, round(rng.uniform(0, 25), 1)]),
+                lat=rng.choice([None, 30.2 + rng.random() / 10]),
+                lon=-97.7 + rng.random() / 10,
+                listed=rng.choice([None, "not-a-date", listed]),
+                removed=rng.choice([None, "2024-01-01", "2024-12-31T00:00:00"]),
+                last_seen=rng.choice([None, "2025-01-15"]),
+            )
+        )
+    return listings
+
+
+def test_columnar_engine_matches_scalar_reference() -> None:
+    for seed, count in [(1, 1), (2, 2), (3, 7), (4, 250), (5, 1000)]:
+        rentals = _random_listings(count, seed)
+        for center in [(None, None), (30.25, -97.75)]:
+            expected = compute_regional_metrics_scalar(rentals, *center)
+            actual = compute_regional_metrics(rentals, *center)
+            assert actual.model_dump_json() == expected.model_dump_json()
+
+
+def test_columnar_engine_matches_scalar_on_empty_input() -> None:
+    assert compute_regional_metrics([], None, None) == (
+        compute_regional_metrics_scalar([], None, None)
+    )
+
+
+def test_columnar_pearson_matches_scalar_bit_for_bit() -> None:
+    rng = random.Random(20)
+    for _ in range(2000):
+
+        def value() -> float:
+            return rng.choice(
+                [
+                    rng.uniform(-1e6, 1e6),
+                    rng.random() * 1e-3,
+                    round(rng.uniform(0, 25), 1),
+                    rng.randint(0, 5000) * 1.1,
+                ]
+            )
+
+        pairs = [(value(), value()) for _ in range(rng.randint(2, 200))]
+        rents = np.array([rent for rent, _ in pairs])
+        distances = np.array([distance for _, distance in pairs])
+
+        assert _columnar_pearson(rents, distances) == _pearson_correlation(pairs)
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from app.domain import rent_estimator
+from app.domain.dto import Address, Facts, NormalizedListing, Pricing
+from app.domain.rent_estimator import KnnRentModel
+
+
+def _listing(
+    listing_id: str,
+    price: float | None,
+    beds: int | None,
+    baths: float | None,
+    sqft: int | None,
+    category: str = "rental",
+) -> NormalizedListing:
+    return NormalizedListing(
+        id=listing_id,
+        category=category,
+        address=Address(),
+        facts=Facts(beds=beds, baths=baths, sqft=sqft),
+        pricing=Pricing(list_price=price),
+    )
+
+
+RENTALS = [
+    _listing("r1", 1200, 1, 1.0, 600),
+    _listing("r2", 1300, 1, 1.0, 700),
+    _listing("r3", 1900, 2, 2.0, 1000),
+    _listing("r4", 2000, 2, 2.0, 1100),
+    _listing("r5", 2800, 3, 2.5, 1600),
+    _listing("r6", 3000, 3, 2.5, 1700),
+    _listing("r7", 4200, 4, 3.5, 2600),
+    _listing("r8", None, 2, 2.0, 1000),
+]
+
+
+def test_fit_needs_at_least_one_rent():
+    assert KnnRentModel.fit([_listing("r", None, 2, 1.0, 900)], k=3) is None
+    assert len(KnnRentModel.fit(RENTALS, k=3)) == 7
+
+
+def test_estimates_follow_the_nearest_comps():
+    model = KnnRentModel.fit(RENTALS, k=2)
+    small, mid, large = model.predict(
+        [
+            _listing("s1", 250000, 1, 1.0, 650, "sale"),
+            _listing("s2", 400000, 2, 2.0, 1050, "sale"),
+            _listing("s3", 650000, 3, 2.5, 1650, "sale"),
+        ]
+    )
+
+    assert small.rent == pytest.approx(1250, abs=1)
+    assert mid.rent == pytest.approx(1950, abs=1)
+    assert large.rent == pytest.approx(2900, abs=1)
+    assert small.rent_low < small.rent < small.rent_high
+    assert small.comps_used == 2
+    assert 0 < large.confidence <= 1
+
+
+def test_missing_features_lower_confidence():
+    model = KnnRentModel.fit(RENTALS, k=2)
+    full, partial = model.predict(
+        [
+            _listing("s1", None, 2, 2.0, 1050, "sale"),
+            _listing("s2", None, 2, None, None, "sale"),
+        ]
+    )
+
+    assert partial.confidence < full.confidence
+
+
+def test_small_regions_use_every_rental_with_lower_confidence():
+    sale = _listing("s", None, 2, 2.0, 1050, "sale")
+    few = KnnRentModel.fit(RENTALS[2:4], k=8).predict([sale])[0]
+    many = KnnRentModel.fit(RENTALS[2:4] * 4, k=8).predict([sale])[0]
+
+    assert few.comps_used == 2
+    assert few.rent == pytest.approx(many.rent)
+    assert few.confidence < many.confidence
+
+
+def test_chunked_scoring_matches_one_by_one(monkeypatch):
+    rng = np.random.default_rng(5)
+    sales = [
+        _listing(f"s{i}", None, int(b), float(b), int(s), "sale")
+        for i, (b, s) in enumerate(
+            zip(rng.integers(1, 5, 40), rng.integers(500, 2500, 40))
+        )
+    ]
+    model = KnnRentModel.fit(RENTALS, k=3)
+    monkeypatch.setattr(rent_estimator, "_CHUNK_ROWS", 16)
+
+    batch = model.predict(sales)
+
+    assert batch == [model.predict([sale])[0] for sale in sales]
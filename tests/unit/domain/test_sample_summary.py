@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import random
+from statistics import mean, median
+
+import numpy as np
+
+from app.domain.sample_summary import SampleSummary, exact_mean
+
+
+def test_summary_answers_order_statistics():
+    summary = SampleSummary.of([4.0, None, 1.0, 3.0, 2.0])
+
+    assert summary.count == len(summary) == 4
+    assert summary.min == 1.0
+    assert summary.max == 4.0
+    assert summary.mean == 2.5
+    assert summary.median == 2.5
+    assert summary.percentile(0.25) == 1.75
+    assert summary.percentile(0.75) == 3.25
+    assert summary.percentile(1.0) == 4.0
+
+
+def test_summary_drops_nan_from_arrays():
+    summary = SampleSummary.of(np.array([np.nan, 5.0, 1.0]))
+
+    assert summary.values.tolist() == [1.0, 5.0]
+    assert summary.median == 3.0
+
+
+def test_empty_summary_returns_none():
+    summary = SampleSummary.of([])
+
+    assert summary.describe() == {
+        "count": 0,
+        "min": None,
+        "max": None,
+        "mean": None,
+        "median": None,
+        "p25": None,
+        "p75": None,
+    }
+
+
+def test_summary_matches_statistics_module():
+    rng = random.Random(3)
+    for size in [1, 2, 3, 10, 101]:
+        values = [round(rng.uniform(500, 5000), 2) for _ in range(size)]
+        summary = SampleSummary.of(values)
+
+        assert summary.median == median(values)
+        assert summary.mean == mean(values)
+        assert summary.percentile(0.5) == summary.median
+
+
+def test_exact_mean_matches_statistics_mean():
+    rng = random.Random(11)
+    samples = [
+        [0.1] * 10,
+        [1e16, 1.0, -1e16],
+        [rng.uniform(-1e6, 1e6) for _ in range(5000)],
+        [rng.uniform(0, 1e-3) for _ in range(300)] + [1e9],
+    ]
+    for values in samples:
+        assert exact_mean(np.array(values)) == mean(values)
+    assert exact_mean(np.array([])) is None
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import numpy as np
+
+from app.domain.dto import Address, Dates, Facts, NormalizedListing, Pricing
+from app.domain.sketches import (KllSketch, MetricSketch, Moments,
+                                 sketch_listings)
+
+
+def _rank_error(sketch: KllSketch, data: np.ndarray, q: float) -> float:
+    value = sketch.quantile(q)
+    return abs(np.searchsorted(np.sort(data), value) / data.size - q)
+
+
+def test_moments_merge_equals_moments_of_union():
+    rng = np.random.default_rng(1)
+    a, b = rng.uniform(1000, 3000, 500), rng.uniform(1000, 3000, 300)
+    left, right, both = Moments(), Moments(), Moments()
+    left.add(a)
+    right.add(b)
+    both.add(np.concatenate((a, b)))
+
+    left.merge(right)
+
+    assert left.count == both.count == 800
+    assert left.min == both.min and left.max == both.max
+    assert np.isclose(left.mean, both.mean)
+    assert np.isclose(left.std, np.concatenate((a, b)).std())
+
+
+def test_kll_is_exact_below_capacity():
+    sketch = KllSketch(k=200)
+    sketch.add(np.arange(1.0, 101.0))
+
+    assert sketch.quantile(0.0) == 1.0
+    assert sketch.quantile(0.5) == 50.0
+    assert sketch.quantile(1.0) == 100.0
+
+
+def test_kll_stays_small_and_accurate():
+    data = np.random.default_rng(2).lognormal(7.5, 0.4, 200_000)
+    sketch = KllSketch(k=200)
+    sketch.add(data)
+
+    assert sketch.count == data.size
+    assert sum(items.size for items in sketch.levels) < 1000
+    for q in (0.1, 0.25, 0.5, 0.75, 0.9):
+        assert _rank_error(sketch, data, q) < 0.02
+
+
+def test_kll_merged_from_many_pieces_matches_whole():
+    data = np.random.default_rng(3).uniform(800, 5000, 100_000)
+    merged = KllSketch(k=200)
+    for chunk in np.array_split(data, 250):
+        piece = KllSketch(k=200)
+        piece.add(chunk)
+        merged.merge(piece)
+
+    assert merged.count == data.size
+    assert sum(items.size for items in merged.levels) < 1000
+    for q in (0.25, 0.5, 0.75):
+        assert _rank_error(merged, data, q) < 0.02
+
+
+def test_metric_sketch_ignores_missing_values():
+    sketch = MetricSketch()
+    sketch.add(np.array([np.nan, 2.0, 4.0]))
+
+    summary = sketch.describe()
+    assert summary["count"] == 2
+    assert summary["mean"] == 3.0
+    assert MetricSketch().describe()["min"] is None
+
+
+def _listing(i: int, zip_code: str, rent: float, sqft: int) -> NormalizedListing:
+    return NormalizedListing(
+        id=f"l{i}",
+        category="rental",
+        address=Address(zip=zip_code),
+        facts=Facts(sqft=sqft, property_type="condo"),
+        pricing=Pricing(list_price=rent),
+        dates=Dates(listed="2024-01-01", last_seen="2024-01-11"),
+    )
+
+
+def test_sketch_listings_groups_by_zip_and_property_type():
+    sketches = sketch_listings(
+        [
+            _listing(1, "78701", 2000, 1000),
+            _listing(2, "78701", 3000, 1000),
+            _listing(3, "78702", 1500, 500),
+        ]
+    )
+
+    assert set(sketches) == {"zip:78701", "zip:78702", "type:condo"}
+    assert sketches["zip:78701"].listings == 2
+    assert sketches["zip:78701"].rent.moments.mean == 2500.0
+    assert sketches["zip:78702"].rent_per_sqft.describe()["median"] == 3.0
+    assert sketches["type:condo"].dom.describe()["mean"] == 10.0
+
+
+def test_sketch_listings_counts_zip_plus_four_toward_its_zip():
+    sketches = sketch_listings(
+        [
+            _listing(1, "78701", 2000, 1000),
+            _listing(2, "78701-1234", 3000, 1000),
+            _listing(3, " 78701-9999", 4000, 1000),
+        ]
+    )
+
+    assert set(sketches) == {"zip:78701", "type:condo"}
+    assert sketches["zip:78701"].listings == 3
+    assert sketches["zip:78701"].rent.moments.mean == 3000.0
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import io
+import zipfile
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.core.config import Settings
+from app.domain.dto import Center, ListingsRequest
+from app.domain.ports.geocoding_port import GeocodingPort
+from app.providers.gazetteer import build
+from app.providers.gazetteer.build import read_places, read_zctas
+from app.providers.gazetteer.gazetteer import MmapGazetteer, centroid_key
+from app.providers.gazetteer.table import DEFAULT_PATH, write_gazetteer
+from app.providers.shared.lru_cache import LruTtlCache
+from app.services.geocoding_service import GeocodingService
+from app.utils.distance import great_circle_miles
+
+
+@pytest.fixture
+def gazetteer(tmp_path):
+    path = tmp_path / "centroids.bin"
+    write_gazetteer(
+        path,
+        {
+            "zip:78701": (30.270569, -97.742589),
+            "place:austin, tx": (30.301, -97.7522),
+            "place:st louis, mo": (38.6358, -90.2451),
+        },
+    )
+    gazetteer = MmapGazetteer(path)
+    yield gazetteer
+    gazetteer.close()
+
+
+def test_zip_and_city_state_resolve_to_centroids(gazetteer):
+    assert gazetteer.lookup(ListingsRequest(zip="78701-1234")) == Center(
+        lat=30.270569, lon=-97.742589
+    )
+    assert gazetteer.lookup(ListingsRequest(city=" AUSTIN", state="Texas")) == Center(
+        lat=30.301, lon=-97.7522
+    )
+    assert gazetteer.lookup(ListingsRequest(city="St. Louis", state="MO")) is not None
+
+
+def test_unknown_locations_miss(gazetteer):
+    assert gazetteer.lookup(ListingsRequest(zip="99999")) is None
+    assert gazetteer.lookup(ListingsRequest(city="Austin", state="MN")) is None
+
+
+def test_street_addresses_and_coordinates_are_not_looked_up():
+    assert centroid_key(ListingsRequest(address="1 Main St", zip="78701")) is None
+    assert centroid_key(ListingsRequest(latitude=30.0, longitude=-97.0)) is None
+    assert centroid_key(ListingsRequest(city="Austin", state="TX", zip="78701")) == (
+        "place:austin, tx"
+    )
+
+
+def test_missing_file_disables_lookups(tmp_path):
+    gazetteer = MmapGazetteer(tmp_path / "absent.bin")
+
+    assert gazetteer.lookup(ListingsRequest(zip="78701")) is None
+
+
+def test_unknown_format_disables_lookups(tmp_path):
+    path = tmp_path / "bad.bin"
+    path.write_bytes(b"not a gazetteer")
+
+    assert MmapGazetteer(path).lookup(ListingsRequest(zip="78701")) is None
+
+
+def test_build_reads_census_gazetteer_files(tmp_path):
+    zcta = tmp_path / "zcta.txt"
+    zcta.write_text(
+        "GEOID\tALAND\tAWATER\tALAND_SQMI\tAWATER_SQMI\tINTPTLAT\tINTPTLONG      \n"
+        "78701\t100\t0\t1\t0\t30.270569\t-97.742589\n"
+    )
+    places = tmp_path / "places.txt"
+    places.write_text(
+        "USPS\tGEOID\tANSICODE\tNAME\tLSAD\tFUNCSTAT\tALAND\tAWATER\t"
+        "ALAND_SQMI\tAWATER_SQMI\tINTPTLAT\tINTPTLONG\n"
+        "TX\t4805000\t1\tAustin city\t25\tA\t800\t0\t1\t0\t30.301\t-97.7522\n"
+        "TX\t4899999\t2\tAustin CDP\t57\tS\t10\t0\t1\t0\t31.0\t-98.0\n"
+    )
+
+    assert read_zctas(zcta) == {"zip:78701": (30.270569, -97.742589)}
+    assert read_places(places) == {"place:austin, tx": (30.301, -97.7522)}
+
+
+def test_available_is_false_for_missing_file_and_true_for_valid(tmp_path, gazetteer):
+    assert MmapGazetteer(tmp_path / "absent.bin").available() is False
+    assert gazetteer.available() is True
+
+
+def test_startup_warns_when_enabled_without_file(tmp_path, monkeypatch, caplog):
+    monkeypatch.setattr(main, "us_gazetteer", MmapGazetteer(tmp_path / "absent.bin"))
+    monkeypatch.setattr(main.settings, "gazetteer_enabled", True)
+
+    with TestClient(main.app) as client:
+        assert client.get("/api/v1/health").status_code == 200
+
+    assert "no gazetteer is available" in caplog.text
+
+
+def test_gazetteer_is_disabled_by_default():
+    assert Settings.model_fields["gazetteer_enabled"].default is False
+
+
+@pytest.mark.asyncio
+async def test_built_gazetteer_geocodes_without_the_provider(tmp_path):
+    zcta = tmp_path / "zcta.txt"
+    zcta.write_text(
+        "GEOID\tALAND\tAWATER\tALAND_SQMI\tAWATER_SQMI\tINTPTLAT\tINTPTLONG\n"
+        "78701\t100\t0\t1\t0\t30.270569\t-97.742589\n"
+    )
+    path = tmp_path / "centroids.bin"
+    write_gazetteer(path, read_zctas(zcta))
+    port = AsyncMock(spec=GeocodingPort)
+    port.geocode = AsyncMock(return_value=Center(lat=1.0, lon=2.0))
+    port.cache_key = MagicMock(side_effect=lambda request: request.zip)
+
+    def service(gazetteer):
+        return GeocodingService(
+            geocoding_port=port,
+            cache_port=AsyncMock(get=AsyncMock(return_value=None)),
+            negative_cache=LruTtlCache(max_weight=10, ttl_seconds=60),
+            gazetteer=gazetteer,
+        )
+
+    built = MmapGazetteer(path)
+    try:
+        found = await service(built).geocode(ListingsRequest(zip="78701"))
+    finally:
+        built.close()
+    assert found == Center(lat=30.270569, lon=-97.742589)
+    port.geocode.assert_not_awaited()
+
+    missing = MmapGazetteer(tmp_path / "absent.bin")
+    fallback = await service(missing).geocode(ListingsRequest(zip="78701"))
+    assert fallback == Center(lat=1.0, lon=2.0)
+    port.geocode.assert_awaited_once()
+
+
+def test_download_extracts_census_file(tmp_path, monkeypatch):
+    payload = io.BytesIO()
+    with zipfile.ZipFile(payload, "w") as archive:
+        archive.writestr("2023_Gaz_zcta_national.txt", "GEOID\n")
+    requested = []
+
+    def fake_urlopen(url, timeout):
+        requested.append(url)
+        return io.BytesIO(payload.getvalue())
+
+    monkeypatch.setattr(build.urllib.request, "urlopen", fake_urlopen)
+
+    path = build.download("zcta", 2023, tmp_path)
+
+    assert path == tmp_path / "2023_Gaz_zcta_national.txt"
+    assert path.read_text() == "GEOID\n"
+    assert requested == [
+        "https://www2.census.gov/geo/docs/maps-data/data/gazetteer/"
+        "2023_Gazetteer/2023_Gaz_zcta_national.zip"
+    ]
+
+
+@pytest.mark.skipif(
+    not DEFAULT_PATH.exists(),
+    reason="gazetteer not built (python -m app.providers.gazetteer.build)",
+)
+def test_bundled_gazetteer_resolves_real_places():
+    gazetteer = MmapGazetteer(DEFAULT_PATH)
+    try:
+        assert gazetteer.available()
+        downtown = gazetteer.lookup(ListingsRequest(zip="78701"))
+        austin = gazetteer.lookup(ListingsRequest(city="Austin", state="TX"))
+        manhattan = gazetteer.lookup(ListingsRequest(zip="10001"))
+    finally:
+        gazetteer.close()
+
+    assert great_circle_miles(downtown.lat, downtown.lon, 30.2706, -97.7426) < 2
+    assert great_circle_miles(austin.lat, austin.lon, 30.30, -97.75) < 10
+    assert great_circle_miles(manhattan.lat, manhattan.lon, 40.7506, -73.9972) < 2
@@ -6,6 +6,7 @@ import pytest
 
 from app.domain.dto import Center, ListingsRequest
 from app.providers.opencage.adapter import OpenCageAdapter
+from app.providers.opencage.quota import RateWindow
 
 
 # TODO: refactor to use fixture
@@ -39,3 +40,28 @@ async def test_adapter_geocode(monkeypatch):
     mock_client.geocode.assert_awaited_once_with({"q": "123"})
     assert center.lat == 1.0
     assert center.lon == -2.0
+
+
+def test_adapter_cache_key_is_normalized_query():
+    adapter = OpenCageAdapter(AsyncMock())
+
+    key = adapter.cache_key(ListingsRequest(city=" Austin", state="tx "))
+
+    assert key == "austin, tx"
+
+
+@pytest.mark.asyncio
+async def test_adapter_records_rate_block(monkeypatch):
+    monkeypatch.setattr(
+        "app.providers.opencage.adapter.normalize_response",
+        lambda resp: Center(lat=1.0, lon=-2.0),
+    )
+    mock_client = AsyncMock()
+    mock_client.geocode.return_value = {
+        "rate": {"limit": 2500, "remaining": 7, "reset": 4102444800}
+    }
+    adapter = OpenCageAdapter(mock_client, rate=RateWindow())
+
+    await adapter.geocode(ListingsRequest(address="1 Main St"))
+
+    assert adapter.call_budget() == 7
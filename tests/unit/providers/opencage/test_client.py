@@ -34,5 +34,6 @@ async def test_geocode_calls_http_get_json(monkeypatch):
         OperationType.GEOCODING,
         Provider.OPENCAGE,
         dict,
+        client=None,
     )
     assert result == {"results": []}
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from app.domain.dto import ListingsRequest
-from app.providers.opencage.mapper import build_params
+from app.providers.opencage.mapper import build_params, normalize_query
 
 
 def test_build_params_with_lat_lon():
@@ -43,3 +43,20 @@ def test_build_params_when_missing_location():
     params = build_params(req)
 
     assert params["q"] == ""
+
+
+def test_normalize_query_folds_case_spacing_and_abbreviation_dots():
+    a = normalize_query(
+        build_params(ListingsRequest(address="123 Main St.,Austin , TX"))
+    )
+    b = normalize_query(
+        build_params(ListingsRequest(address="123  main st, austin, tx"))
+    )
+
+    assert a == b == "123 main st, austin, tx"
+
+
+def test_normalize_query_keeps_decimal_points():
+    params = {"q": "Unit 1.5, Austin"}
+
+    assert normalize_query(params) == "unit 1.5, austin"
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import pytest
+
 from app.domain.dto import Center
+from app.domain.exceptions.provider_exceptions import (ProviderNoResultsError,
+                                                       ProviderParsingError)
 from app.providers.opencage.models import (Components, GeocodeResponse,
                                            Geometry, License, Rate, Result,
                                            Status, Timestamp)
@@ -39,3 +43,20 @@ def test_normalize_response_returns_center():
     assert isinstance(center, Center)
     assert center.lat == 30.0
     assert center.lon == -97.0
+
+
+def test_normalize_response_without_results_raises():
+    response = make_response(30.0, -97.0)
+    response.results = []
+
+    with pytest.raises(ProviderNoResultsError):
+        normalize_response(response)
+
+
+def test_normalize_response_validates_raw_payload():
+    raw = make_response(30.0, -97.0).model_dump(by_alias=True)
+
+    assert normalize_response(raw) == Center(lat=30.0, lon=-97.0)
+
+    with pytest.raises(ProviderParsingError):
+        normalize_response({"raw": "data"})
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from app.providers.opencage.quota import RateWindow
+
+
+def test_remaining_is_unknown_until_reported():
+    window = RateWindow()
+
+    assert window.remaining() is None
+
+
+def test_remaining_tracks_latest_rate_block_until_reset():
+    window = RateWindow()
+    window.update({"limit": 2500, "remaining": 12, "reset": 1000})
+
+    assert window.remaining(now=999) == 12
+    assert window.remaining(now=1000) is None
+    assert window.snapshot() == {"limit": 2500, "remaining": 12, "reset": 1000.0}
+
+
+def test_malformed_rate_block_is_ignored():
+    window = RateWindow()
+    window.update({"remaining": "lots"})
+
+    assert window.remaining() is None
@@ -1,3 +1,4 @@
+import time
 from typing import Any, Dict, Optional
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -150,3 +151,151 @@ class TestRedisModelCacheAdapter:
         assert result.id == "456"
         assert result.name == "custom_test"
         assert result.value == 0
+
+
+class TestRedisModelCacheAdapterLeases:
+    @pytest.fixture
+    def lease_adapter(self, mock_redis: AsyncMock) -> RedisModelCacheAdapter[TestModel]:
+        return RedisModelCacheAdapter(
+            redis=mock_redis,
+            model_cls=TestModel,
+            prefix="test",
+            default_ttl=3600,
+            lease_ttl_ms=1000,
+            lease_poll_interval_ms=1,
+        )
+
+    def test_leases_disabled_by_default(
+        self, cache_adapter: RedisModelCacheAdapter[TestModel]
+    ):
+        assert cache_adapter.leases_enabled is False
+
+    @pytest.mark.asyncio
+    async def test_acquire_lease_uses_set_nx_px(
+        self, lease_adapter: RedisModelCacheAdapter[TestModel], mock_redis: AsyncMock
+    ):
+        mock_redis.set.return_value = True
+
+        token = await lease_adapter.acquire_lease("k")
+
+        assert token
+        args, kwargs = mock_redis.set.await_args
+        assert args[0] == "test:lease:k"
+        assert kwargs == {"nx": True, "px": 1000}
+
+    @pytest.mark.asyncio
+    async def test_acquire_lease_returns_none_when_held(
+        self, lease_adapter: RedisModelCacheAdapter[TestModel], mock_redis: AsyncMock
+    ):
+        mock_redis.set.return_value = None
+
+        assert await lease_adapter.acquire_lease("k") is None
+
+    @pytest.mark.asyncio
+    async def test_acquire_lease_falls_back_to_leader_on_redis_error(
+        self, lease_adapter: RedisModelCacheAdapter[TestModel], mock_redis: AsyncMock
+    ):
+        mock_redis.set.side_effect = RedisError("down")
+
+        assert await lease_adapter.acquire_lease("k")
+
+    @pytest.mark.asyncio
+    async def test_wait_for_value_returns_filled_value(
+        self, lease_adapter: RedisModelCacheAdapter[TestModel], mock_redis: AsyncMock
+    ):
+        mock_redis.get.side_effect = [None, b'{"id": "1", "name": "n", "value": 1}']
+        mock_redis.exists.return_value = 1
+
+        result = await lease_adapter.wait_for_value("k", timeout_seconds=1)
+
+        assert result is not None and result.id == "1"
+
+    @pytest.mark.asyncio
+    async def test_wait_for_value_stops_when_lease_released_without_value(
+        self, lease_adapter: RedisModelCacheAdapter[TestModel], mock_redis: AsyncMock
+    ):
+        mock_redis.get.return_value = None
+        mock_redis.exists.return_value = 0
+
+        assert await lease_adapter.wait_for_value("k", timeout_seconds=1) is None
+        mock_redis.exists.assert_awaited_once_with("test:lease:k")
+
+    @pytest.mark.asyncio
+    async def test_wait_for_value_is_bounded(
+        self, lease_adapter: RedisModelCacheAdapter[TestModel], mock_redis: AsyncMock
+    ):
+        mock_redis.get.return_value = None
+        mock_redis.exists.return_value = 1
+
+        assert await lease_adapter.wait_for_value("k", timeout_seconds=0.01) is None
+
+
+class TestRedisModelCacheAdapterXFetch:
+    @pytest.fixture
+    def xfetch_adapter(
+        self, mock_redis: AsyncMock
+    ) -> RedisModelCacheAdapter[TestModel]:
+        return RedisModelCacheAdapter(
+            redis=mock_redis,
+            model_cls=TestModel,
+            prefix="test",
+            default_ttl=600,
+            xfetch_beta=1.0,
+            ttl_jitter_ratio=0.1,
+        )
+
+    @pytest.mark.asyncio
+    async def test_set_stores_compute_cost_and_expiry(
+        self, xfetch_adapter: RedisModelCacheAdapter[TestModel], mock_redis: AsyncMock
+    ):
+        await xfetch_adapter.set(
+            "k", TestModel(id="1", name="n", value=1), compute_seconds=0.8
+        )
+
+        args, kwargs = mock_redis.set.await_args
+        header, payload = args[1].decode().split("\n", 1)
+        _, cost, expiry = header.split()
+        assert float(cost) == 0.8
+        assert 540 <= kwargs["ex"] <= 600
+        assert abs(float(expiry) - (time.time() + kwargs["ex"])) < 2
+        assert payload == '{"id":"1","name":"n","value":1}'
+
+    @pytest.mark.asyncio
+    async def test_get_reads_entries_with_header(
+        self, xfetch_adapter: RedisModelCacheAdapter[TestModel], mock_redis: AsyncMock
+    ):
+        expiry = time.time() + 600
+        mock_redis.get.return_value = (
+            f'xf1 0.5000 {expiry:.3f}\n{{"id":"1","name":"n","value":1}}'.encode()
+        )
+
+        result = await xfetch_adapter.get("k")
+
+        assert result.id == "1"
+
+    @pytest.mark.asyncio
+    async def test_costly_entry_near_expiry_is_recomputed_early(
+        self, xfetch_adapter: RedisModelCacheAdapter[TestModel], mock_redis: AsyncMock
+    ):
+        expiry = time.time() + 1
+        mock_redis.get.return_value = (
+            f'xf1 30.0000 {expiry:.3f}\n{{"id":"1","name":"n","value":1}}'.encode()
+        )
+
+        with patch("app.providers.redis.adapter.random.random", return_value=0.5):
+            assert await xfetch_adapter.get("k") is None
+            # Waiting on a peer's refill or probing a covering key never
+            # expires early
+            assert (await xfetch_adapter.get("k", early_expiry=False)).id == "1"
+
+    @pytest.mark.asyncio
+    async def test_entry_far_from_expiry_is_served(
+        self, xfetch_adapter: RedisModelCacheAdapter[TestModel], mock_redis: AsyncMock
+    ):
+        expiry = time.time() + 600
+        mock_redis.get.return_value = (
+            f'xf1 0.5000 {expiry:.3f}\n{{"id":"1","name":"n","value":1}}'.encode()
+        )
+
+        with patch("app.providers.redis.adapter.random.random", return_value=0.5):
+            assert await xfetch_adapter.get("k") is not None
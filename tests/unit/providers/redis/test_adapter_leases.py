@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from app.providers.redis.adapter import RedisModelCacheAdapter
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+class Item(BaseModel):
+    id: str
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.FakeAsyncRedis()
+
+
+def make_adapter(redis) -> RedisModelCacheAdapter[Item]:
+    return RedisModelCacheAdapter(
+        redis=redis,
+        model_cls=Item,
+        prefix="rb:listings",
+        default_ttl=60,
+        lease_ttl_ms=2000,
+        lease_poll_interval_ms=5,
+    )
+
+
+@pytest.mark.asyncio
+async def test_only_one_worker_acquires_the_lease(redis):
+    workers = [make_adapter(redis) for _ in range(5)]
+
+    tokens = await asyncio.gather(*(w.acquire_lease("k") for w in workers))
+
+    assert sum(t is not None for t in tokens) == 1
+
+
+@pytest.mark.asyncio
+async def test_release_only_deletes_own_lease(redis):
+    adapter = make_adapter(redis)
+    token = await adapter.acquire_lease("k")
+
+    await adapter.release_lease("k", "someone-else")
+    assert await redis.exists("rb:listings:lease:k")
+
+    await adapter.release_lease("k", token)
+    assert not await redis.exists("rb:listings:lease:k")
+
+
+@pytest.mark.asyncio
+async def test_waiters_receive_value_filled_by_leaseholder(redis):
+    leader, follower = make_adapter(redis), make_adapter(redis)
+    token = await leader.acquire_lease("k")
+    assert await follower.acquire_lease("k") is None
+
+    async def fill():
+        await asyncio.sleep(0.02)
+        await leader.set("k", Item(id="filled"))
+        await leader.release_lease("k", token)
+
+    filled, _ = await asyncio.gather(follower.wait_for_value("k", 1.0), fill())
+
+    assert filled == Item(id="filled")
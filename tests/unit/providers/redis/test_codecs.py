@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import pytest
+
+from app.domain.dto import (HOA, Address, CachedListings, Dates, Facts,
+                            NormalizedListing, Pricing)
+from app.providers.redis.adapter import RedisModelCacheAdapter
+from app.providers.redis.codecs import CachedListingsCodec
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def make_listings(count: int) -> CachedListings:
+    return CachedListings(
+        items=[
+            NormalizedListing(
+                id=f"prov:rentcast:{i}",
+                category="rental",
+                status="Active",
+                address=Address(
+                    formatted=f"{i} Main St, Austin, TX 78701",
+                    city="Austin",
+                    state="TX",
+                    zip="78701",
+                    lat=30.26 + i / 1000,
+                    lon=-97.74,
+                ),
+                facts=Facts(beds=i % 4, baths=1.5, sqft=900 + i, property_type="Condo"),
+                pricing=Pricing(list_price=1500 + i * 10, period="monthly"),
+                dates=Dates(listed="2025-01-02T00:00:00Z"),
+                hoa=HOA(monthly=None if i % 2 else 120.0),
+            )
+            for i in range(count)
+        ],
+        fetched_at=1700000000.5,
+    )
+
+
+def test_round_trip_preserves_listings():
+    codec = CachedListingsCodec()
+    value = make_listings(25)
+
+    decoded = codec.decode(codec.encode(value))
+
+    assert decoded == value
+    assert decoded.items[3].pricing.currency == "USD"
+    assert decoded.items[3].provider.name == "RentCast"
+
+
+def test_round_trip_of_empty_result():
+    codec = CachedListingsCodec()
+
+    decoded = codec.decode(codec.encode(CachedListings(items=[])))
+
+    assert decoded.items == []
+    assert decoded.error is None
+
+
+def test_round_trip_of_negative_entry():
+    codec = CachedListingsCodec()
+    value = CachedListings(items=[], fetched_at=1.0, error="rentcast client error 400")
+
+    assert codec.decode(codec.encode(value)) == value
+
+
+def test_encoding_is_smaller_than_json():
+    codec = CachedListingsCodec()
+    value = make_listings(100)
+
+    encoded = codec.encode(value)
+
+    assert encoded.startswith(codec.tag)
+    assert len(encoded) * 3 < len(value.model_dump_json())
+
+
+def test_missing_columns_fall_back_to_defaults():
+    codec = CachedListingsCodec()
+    codec._layout = [entry for entry in codec._layout if entry[0] != "hoa"]
+    encoded = codec.encode(make_listings(2))
+
+    decoded = CachedListingsCodec().decode(encoded)
+
+    assert decoded.items[0].hoa.monthly is None
+
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError):
+        CachedListingsCodec().decode(b"RBL9...")
+
+
+@pytest.mark.asyncio
+async def test_adapter_reads_codec_and_legacy_json_entries():
+    redis = fakeredis.FakeAsyncRedis()
+    adapter = RedisModelCacheAdapter(
+        redis=redis,
+        model_cls=CachedListings,
+        prefix="rb:listings",
+        default_ttl=60,
+        codec=CachedListingsCodec(),
+        xfetch_beta=1.0,
+    )
+    value = make_listings(3)
+    await redis.set("rb:listings:legacy", value.model_dump_json())
+
+    await adapter.set("new", value, compute_seconds=0.2)
+
+    assert (await redis.get("rb:listings:new")).startswith(b"xf1 ")
+    assert await adapter.get("new") == value
+    assert await adapter.get("legacy") == value
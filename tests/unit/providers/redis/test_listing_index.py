@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import pytest
+
+from app.domain.dto import Address, Facts, NormalizedListing, Pricing
+from app.providers.redis.listing_index import RedisListingIndex
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def make_listing(
+    listing_id: str, price: float = 1500, category: str = "sale"
+) -> NormalizedListing:
+    return NormalizedListing(
+        id=listing_id,
+        category=category,
+        address=Address(formatted=f"{listing_id} Main St"),
+        facts=Facts(beds=3),
+        pricing=Pricing(list_price=price),
+    )
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.FakeAsyncRedis()
+
+
+@pytest.mark.asyncio
+async def test_resolve_returns_found_in_request_order_and_missing_ids(redis):
+    index = RedisListingIndex(redis=redis, prefix="rb", ttl_seconds=60)
+    await index.register([make_listing("a"), make_listing("b")])
+
+    found, missing = await index.resolve(["b", "zzz", "a"])
+
+    assert [l.id for l in found] == ["b", "a"]
+    assert missing == ["zzz"]
+
+
+@pytest.mark.asyncio
+async def test_register_refreshes_body_and_ttl(redis):
+    index = RedisListingIndex(redis=redis, prefix="rb", ttl_seconds=60)
+    await index.register([make_listing("a", 1500)])
+
+    await index.register([make_listing("a", 1400)], ttl_seconds=300)
+
+    found, _ = await index.resolve(["a"])
+    assert found[0].pricing.list_price == 1400
+    assert 60 < await redis.ttl("rb:listing:sale:a") <= 300
+
+
+@pytest.mark.asyncio
+async def test_oldest_entries_are_trimmed_past_max_entries(redis):
+    index = RedisListingIndex(redis=redis, prefix="rb", ttl_seconds=60, max_entries=2)
+    await index.register([make_listing("a")])
+    await index.register([make_listing("b")])
+    await index.register([make_listing("c")])
+
+    found, missing = await index.resolve(["a", "b", "c"])
+
+    assert [l.id for l in found] == ["b", "c"]
+    assert missing == ["a"]
+    assert await redis.zcard("rb:listing-ids") == 2
+
+
+@pytest.mark.asyncio
+async def test_resolve_of_no_ids_skips_redis(redis):
+    index = RedisListingIndex(redis=redis, prefix="rb", ttl_seconds=60)
+
+    assert await index.resolve([]) == ([], [])
+
+
+@pytest.mark.asyncio
+async def test_rental_and_sale_of_one_property_are_kept_apart(redis):
+    index = RedisListingIndex(redis=redis, prefix="rb", ttl_seconds=60)
+    await index.register([make_listing("a", 2100, category="rental")])
+    await index.register([make_listing("a", 350000)])
+
+    (rental,) = await index.get_many(["a"], "rental")
+    found, missing = await index.resolve(["a"])
+
+    assert (rental.category, rental.pricing.list_price) == ("rental", 2100)
+    assert [l.category for l in found] == ["rental", "sale"]
+    assert missing == []
+    sale, _ = await index.resolve(["a"], category="sale")
+    assert [l.pricing.list_price for l in sale] == [350000]
+
+
+@pytest.mark.asyncio
+async def test_listings_without_provider_id_are_not_stored(redis):
+    index = RedisListingIndex(redis=redis, prefix="rb", ttl_seconds=60)
+
+    await index.register(
+        [make_listing("prov:rentcast:unknown"), make_listing("prov:rentcast:unknown")]
+    )
+
+    assert await redis.keys("rb:*") == []
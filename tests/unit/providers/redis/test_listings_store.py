@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import pytest
+
+from app.domain.dto import (Address, CachedListings, CachedSearchRefs, Facts,
+                            NormalizedListing, Pricing)
+from app.providers.redis.adapter import RedisModelCacheAdapter
+from app.providers.redis.listing_index import RedisListingIndex
+from app.providers.redis.listings_store import NormalizedListingsCacheAdapter
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def make_listing(listing_id: str, price: float) -> NormalizedListing:
+    return NormalizedListing(
+        id=listing_id,
+        category="rental",
+        address=Address(formatted=f"{listing_id} Main St"),
+        facts=Facts(beds=2),
+        pricing=Pricing(list_price=price),
+    )
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.FakeAsyncRedis()
+
+
+@pytest.fixture
+def store(redis) -> NormalizedListingsCacheAdapter:
+    searches = RedisModelCacheAdapter(
+        redis=redis,
+        model_cls=CachedSearchRefs,
+        prefix="rb:searches",
+        default_ttl=60,
+        lease_ttl_ms=1000,
+    )
+    index = RedisListingIndex(redis=redis, prefix="rb", ttl_seconds=120)
+    return NormalizedListingsCacheAdapter(searches=searches, index=index)
+
+
+@pytest.mark.asyncio
+async def test_round_trip_keeps_provider_order(store, redis):
+    value = CachedListings(
+        items=[make_listing("b", 2000), make_listing("a", 1500)], fetched_at=12.5
+    )
+
+    await store.set("rental:k", value)
+    result = await store.get("rental:k")
+
+    assert result == value
+    assert 60 < await redis.ttl("rb:listing:rental:a") <= 120
+    refs = await store.searches.get("rental:k")
+    assert refs.ids == ["b", "a"]
+    assert refs.category == "rental"
+    assert refs.provider == "RentCast"
+
+
+@pytest.mark.asyncio
+async def test_listings_without_provider_id_stay_in_the_search(store, redis):
+    unknown = "prov:rentcast:unknown"
+    value = CachedListings(
+        items=[
+            make_listing(unknown, 900),
+            make_listing("a", 1500),
+            make_listing(unknown, 1100),
+        ]
+    )
+
+    await store.set("rental:k", value)
+
+    assert (await store.get("rental:k")).items == value.items
+    assert await redis.keys("rb:listing:*") == [b"rb:listing:rental:a"]
+
+
+@pytest.mark.asyncio
+async def test_listing_body_is_shared_between_searches(store, redis):
+    await store.set("rental:wide", CachedListings(items=[make_listing("a", 1500)]))
+    await store.set(
+        "rental:narrow",
+        CachedListings(items=[make_listing("a", 1400), make_listing("c", 900)]),
+    )
+
+    wide = await store.get("rental:wide")
+
+    assert wide.items[0].pricing.list_price == 1400
+    assert len(await redis.keys("rb:listing:*")) == 2
+
+
+@pytest.mark.asyncio
+async def test_missing_body_is_a_miss(store, redis):
+    await store.set("rental:k", CachedListings(items=[make_listing("a", 1500)]))
+    await redis.delete("rb:listing:rental:a")
+
+    assert await store.get("rental:k") is None
+
+
+@pytest.mark.asyncio
+async def test_empty_search_round_trips(store):
+    await store.set("rental:k", CachedListings(items=[]))
+
+    assert (await store.get("rental:k")).items == []
+
+
+@pytest.mark.asyncio
+async def test_leases_are_delegated_to_search_keys(store, redis):
+    token = await store.acquire_lease("rental:k")
+
+    assert store.leases_enabled
+    assert await redis.exists("rb:searches:lease:rental:k")
+    await store.release_lease("rental:k", token)
+    assert not await redis.exists("rb:searches:lease:rental:k")
+
+
+@pytest.mark.asyncio
+async def test_clear_removes_searches_and_bodies(store, redis):
+    await store.set("rental:k", CachedListings(items=[make_listing("a", 1500)]))
+
+    await store.clear()
+
+    assert await redis.keys("rb:*") == []
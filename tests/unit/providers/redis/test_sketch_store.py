@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from app.domain.sketches import KllSketch, ListingSketch, MetricSketch
+from app.providers.redis import sketch_store
+from app.providers.redis.codecs import ListingSketchCodec
+from app.providers.redis.sketch_store import RedisSketchStore
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def make_sketch(values, k: int = 50) -> ListingSketch:
+    sketch = ListingSketch(
+        rent=MetricSketch(quantiles=KllSketch(k)), listings=len(values)
+    )
+    sketch.rent.add(np.asarray(values, dtype=float))
+    return sketch
+
+
+@pytest.fixture
+def redis():
+    return fakeredis.FakeAsyncRedis()
+
+
+def test_codec_round_trips_compacted_sketch():
+    codec = ListingSketchCodec()
+    sketch = make_sketch(np.random.default_rng(1).uniform(900, 4000, 5000))
+    sketch.dom.add(np.array([3.0, 9.0]))
+
+    decoded = codec.decode(codec.encode(sketch))
+
+    assert decoded.listings == sketch.listings
+    assert decoded.rent.moments == sketch.rent.moments
+    assert decoded.rent.quantiles.k == 50
+    assert len(decoded.rent.quantiles.levels) > 1
+    for ours, theirs in zip(
+        decoded.rent.quantiles.levels, sketch.rent.quantiles.levels
+    ):
+        assert ours.tolist() == theirs.tolist()
+    assert decoded.dom.describe() == sketch.dom.describe()
+    assert decoded.rent_per_sqft.describe()["count"] == 0
+
+
+def test_codec_rejects_other_formats():
+    with pytest.raises(ValueError):
+        ListingSketchCodec().decode(b"{}")
+
+
+@pytest.mark.asyncio
+async def test_merge_accumulates_across_calls(redis):
+    store = RedisSketchStore(redis=redis, prefix="rb", ttl_seconds=60)
+
+    await store.merge({"zip:78701": make_sketch([1000, 2000])})
+    await store.merge({"zip:78701": make_sketch([3000]), "zip:78702": make_sketch([5])})
+
+    found = await store.get_many(["zip:78701", "zip:78702", "zip:00000"])
+    assert set(found) == {"zip:78701", "zip:78702"}
+    assert found["zip:78701"].listings == 3
+    assert found["zip:78701"].rent.describe()["median"] == 2000.0
+    assert 0 < await redis.ttl("rb:sketch:zip:78701") <= 60
+
+
+@pytest.mark.asyncio
+async def test_first_merge_keeps_incoming_k(redis):
+    store = RedisSketchStore(redis=redis, prefix="rb", ttl_seconds=60)
+    sketch = make_sketch([1000, 2000], k=32)
+
+    await store.merge({"zip:78701": sketch})
+
+    found = await store.get_many(["zip:78701"])
+    assert found["zip:78701"].rent.quantiles.k == 32
+    assert sketch.listings == 2
+
+
+@pytest.mark.asyncio
+async def test_merge_reports_dropped_merges(redis, monkeypatch):
+    store = RedisSketchStore(redis=redis, prefix="rb", ttl_seconds=60)
+    assert await store.merge({"zip:78701": make_sketch([1000])}) is True
+
+    monkeypatch.setattr(sketch_store, "MAX_MERGE_ATTEMPTS", 0)
+    assert await store.merge({"zip:78701": make_sketch([2000])}) is False
+
+    found = await store.get_many(["zip:78701"])
+    assert found["zip:78701"].listings == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_merges_are_not_lost(redis):
+    store = RedisSketchStore(redis=redis, prefix="rb", ttl_seconds=60)
+
+    await asyncio.gather(
+        *(store.merge({"type:condo": make_sketch([float(i)])}) for i in range(4))
+    )
+
+    found = await store.get_many(["type:condo"])
+    assert found["type:condo"].rent.moments.count == 4
+
+
+@pytest.mark.asyncio
+async def test_undecodable_entries_are_replaced(redis):
+    store = RedisSketchStore(redis=redis, prefix="rb", ttl_seconds=60)
+    await redis.set("rb:sketch:zip:78701", b"RBS2\x00")
+
+    assert await store.get_many(["zip:78701"]) == {}
+    await store.merge({"zip:78701": make_sketch([1200])})
+
+    found = await store.get_many(["zip:78701"])
+    assert found["zip:78701"].rent.moments.total == 1200.0
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from app.providers.redis import tiered_adapter
+from app.providers.redis.adapter import RedisModelCacheAdapter
+from app.providers.redis.tiered_adapter import (CacheInvalidator,
+                                                TieredCacheAdapter,
+                                                get_tiered_cache)
+from app.providers.shared.lru_cache import LruTtlCache
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+class Item(BaseModel):
+    id: str
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    yield
+    tiered_adapter._invalidators.clear()
+    tiered_adapter._l1_caches.clear()
+
+
+def make_worker(server) -> TieredCacheAdapter[Item]:
+    redis = fakeredis.FakeAsyncRedis(server=server)
+    l1 = LruTtlCache(max_weight=100, ttl_seconds=60)
+    l2 = RedisModelCacheAdapter(
+        redis=redis, model_cls=Item, prefix="rb:listings", default_ttl=60
+    )
+    return TieredCacheAdapter(
+        l1=l1, l2=l2, invalidator=CacheInvalidator(redis, "rb:listings:invalidate", l1)
+    )
+
+
+async def wait_until(predicate, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_l1_serves_repeat_reads_without_decoding(server):
+    worker = make_worker(server)
+    await worker.set("k", Item(id="1"))
+
+    first = await worker.get("k")
+    second = await worker.get("k")
+
+    assert first is second
+    assert worker.l1.hits == 2
+
+
+@pytest.mark.asyncio
+async def test_l1_is_filled_from_l2(server):
+    writer, reader = make_worker(server), make_worker(server)
+    await writer.set("k", Item(id="1"))
+
+    assert (await reader.get("k")).id == "1"
+    assert reader.l1.get("k").id == "1"
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_other_workers_l1(server):
+    writer, reader = make_worker(server), make_worker(server)
+    await reader._invalidator.start()
+    await writer.set("k", Item(id="old"))
+    assert (await reader.get("k")).id == "old"
+
+    await writer.set("k", Item(id="new"))
+    await wait_until(lambda: reader.l1.get("k") is None)
+
+    assert (await reader.get("k")).id == "new"
+    await reader._invalidator.stop()
+
+
+@pytest.mark.asyncio
+async def test_own_invalidations_are_ignored(server):
+    worker = make_worker(server)
+    worker._invalidator.handle(f"{worker._invalidator.node_id}|k".encode())
+    worker.l1.set("k", Item(id="1"))
+    worker._invalidator.handle(f"{worker._invalidator.node_id}|k".encode())
+
+    assert worker.l1.get("k") is not None
+    worker._invalidator.handle(b"other|*")
+    assert len(worker.l1) == 0
+
+
+@pytest.mark.asyncio
+async def test_delete_removes_both_tiers(server):
+    worker = make_worker(server)
+    await worker.set("k", Item(id="1"))
+
+    await worker.delete("k")
+
+    assert await worker.get("k") is None
+    assert await worker.l2.get("k") is None
+
+
+@pytest.mark.asyncio
+async def test_get_tiered_cache_shares_l1_per_prefix(server):
+    redis = fakeredis.FakeAsyncRedis(server=server)
+    l2 = RedisModelCacheAdapter(redis=redis, model_cls=Item, prefix="rb:listings")
+
+    first = await get_tiered_cache(l2, redis, "rb:listings")
+    second = await get_tiered_cache(l2, redis, "rb:listings")
+
+    assert first.l1 is second.l1
+    assert tiered_adapter._invalidators["rb:listings"].running
+    assert "rb:listings" in tiered_adapter.l1_cache_snapshot()
+    await tiered_adapter.close_cache_invalidators()
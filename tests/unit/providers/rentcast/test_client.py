@@ -10,6 +10,8 @@ from app.domain.exceptions.provider_exceptions import (ProviderAuthError,
                                                        ProviderServerError,
                                                        ProviderTimeoutError)
 from app.providers.rentcast.client import RentCastClient
+from app.providers.shared import http_client, resilience
+from app.providers.shared.resilience import RetryPolicy
 from tests.unit.services.fixtures.rentcast_mocks import (
     MOCK_RENTCAST_RESPONSE, MOCK_RENTCAST_SALES_REQUEST)
 
@@ -41,6 +43,22 @@ class DummyResponse:
 class TestRentCastClient:
     """Test the RentCastClient class"""
 
+    @pytest.fixture(autouse=True)
+    def reset_http_clients(self):
+        http_client._http_clients.clear()
+        yield
+        http_client._http_clients.clear()
+
+    @pytest.fixture(autouse=True)
+    def single_attempt(self, monkeypatch):
+        resilience._breakers.clear()
+        monkeypatch.setattr(
+            "app.providers.shared.http.get_retry_policy",
+            lambda provider, operation: RetryPolicy(max_attempts=1),
+        )
+        yield
+        resilience._breakers.clear()
+
     @pytest.fixture
     def mock_settings(self):
         with patch("app.providers.rentcast.client.settings") as mock_settings:
@@ -73,7 +91,7 @@ class TestRentCastClient:
         with patch("httpx.AsyncClient") as mock_client_cls:
             mock_client = AsyncMock()
             mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client_cls.return_value.__aenter__.return_value = mock_client
+            mock_client_cls.return_value = mock_client
 
             listings = await client.get_sales(mock_request)
 
@@ -150,7 +168,7 @@ class TestRentCastClient:
             mock_client = AsyncMock()
             mock_response.status_code = status_code
             mock_client.get = AsyncMock(side_effect=exception)
-            mock_client_cls.return_value.__aenter__.return_value = mock_client
+            mock_client_cls.return_value = mock_client
 
             with pytest.raises(expected_exception):
                 await client.get_sales({})
@@ -164,7 +182,7 @@ class TestRentCastClient:
             mock_response.status_code = 200
             mock_response.json_exc = ValueError("Invalid JSON")
             mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client_cls.return_value.__aenter__.return_value = mock_client
+            mock_client_cls.return_value = mock_client
 
             with pytest.raises(ProviderParsingError):
                 await client.get_sales({})
@@ -180,7 +198,7 @@ class TestRentCastClient:
         with patch("httpx.AsyncClient") as mock_client_cls:
             mock_client = AsyncMock()
             mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client_cls.return_value.__aenter__.return_value = mock_client
+            mock_client_cls.return_value = mock_client
 
             listings = await client.get_rentals(mock_request)
 
@@ -257,7 +275,7 @@ class TestRentCastClient:
             mock_client = AsyncMock()
             mock_response.status_code = status_code
             mock_client.get = AsyncMock(side_effect=exception)
-            mock_client_cls.return_value.__aenter__.return_value = mock_client
+            mock_client_cls.return_value = mock_client
 
             with pytest.raises(expected_exception):
                 await client.get_rentals({})
@@ -271,7 +289,31 @@ class TestRentCastClient:
             mock_response.status_code = 200
             mock_response.json_exc = ValueError("Invalid JSON")
             mock_client.get = AsyncMock(return_value=mock_response)
-            mock_client_cls.return_value.__aenter__.return_value = mock_client
+            mock_client_cls.return_value = mock_client
 
             with pytest.raises(ProviderParsingError):
                 await client.get_rentals({})
+
+    @pytest.mark.asyncio
+    async def test_get_rentals_runs_through_hedger_when_enabled(
+        self, client: RentCastClient, mock_settings
+    ):
+        class RecordingHedger:
+            def __init__(self):
+                self.runs = 0
+
+            async def run(self, fn):
+                self.runs += 1
+                return await fn()
+
+        hedger = RecordingHedger()
+        with patch(
+            "app.providers.rentcast.client.get_hedger", return_value=hedger
+        ), patch(
+            "app.providers.rentcast.client.http_get_json",
+            AsyncMock(return_value=[{"id": "1"}]),
+        ):
+            listings = await client.get_rentals({})
+
+        assert listings == [{"id": "1"}]
+        assert hedger.runs == 1
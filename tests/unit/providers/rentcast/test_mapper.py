@@ -24,7 +24,7 @@ def test_build_params_uses_lat_lon_with_radius(monkeypatch):
     assert params["latitude"] == 30.0
     assert params["longitude"] == -97.0
     assert params["radius"] == 10
-    assert params["limit"] == 25
+    assert params["limit"] == min(settings.rentcast_request_cap, 100)
     assert params["daysOld"] == settings.rentcast_days_old_default
 
 
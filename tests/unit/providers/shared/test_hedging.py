@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.domain.enums.context_request import OperationType
+from app.providers.enums.provider import Provider
+from app.providers.shared import hedging
+from app.providers.shared.hedging import (HedgeBudget, Hedger, LatencyTracker,
+                                          get_hedger)
+
+
+@pytest.fixture(autouse=True)
+def reset_hedgers():
+    hedging._hedgers.clear()
+    yield
+    hedging._hedgers.clear()
+
+
+def make_hedger(**overrides) -> Hedger:
+    kwargs = {
+        "name": "test",
+        "percentile": 0.9,
+        "budget_ratio": 1.0,
+        "min_samples": 3,
+        "min_delay_seconds": 0.01,
+    }
+    kwargs.update(overrides)
+    hedger = Hedger(**kwargs)
+    for _ in range(kwargs["min_samples"]):
+        hedger.latency.record(0.01)
+        hedger.budget.record_call(False)
+    return hedger
+
+
+def test_latency_tracker_percentile():
+    tracker = LatencyTracker()
+    for value in range(1, 101):
+        tracker.record(value / 100)
+
+    assert tracker.percentile(0.95) == 0.95
+    assert tracker.percentile(0.5) == 0.5
+
+
+def test_hedge_budget_caps_extra_calls():
+    budget = HedgeBudget(ratio=0.05)
+    for _ in range(19):
+        budget.record_call(False)
+
+    assert budget.allows_hedge() is False
+    budget.record_call(False)
+    assert budget.allows_hedge() is True
+    budget.record_call(True)
+    assert budget.allows_hedge() is False
+
+
+def test_no_hedge_delay_until_enough_samples():
+    hedger = Hedger("test", 0.9, 1.0, min_samples=5, min_delay_seconds=0.01)
+    hedger.latency.record(0.2)
+
+    assert hedger.hedge_delay() is None
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_hedge_wins():
+    hedger = make_hedger()
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(1.0 if calls == 1 else 0)
+        return calls
+
+    result = await hedger.run(call)
+
+    assert result == 2
+    assert hedger.hedges == 1
+    assert hedger.hedge_wins == 1
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged():
+    hedger = make_hedger()
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        return "ok"
+
+    assert await hedger.run(call) == "ok"
+    assert calls == 1
+    assert hedger.hedges == 0
+
+
+@pytest.mark.asyncio
+async def test_hedge_skipped_when_budget_exhausted():
+    hedger = make_hedger(budget_ratio=0.0)
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.03)
+        return calls
+
+    assert await hedger.run(call) == 1
+    assert hedger.hedges == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_primary_falls_through_to_hedge():
+    hedger = make_hedger()
+    calls = 0
+
+    async def call():
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(0.03)
+            raise RuntimeError("primary failed")
+        await asyncio.sleep(0.05)
+        return "hedge"
+
+    assert await hedger.run(call) == "hedge"
+
+
+@pytest.mark.asyncio
+async def test_error_raised_when_every_attempt_fails():
+    hedger = make_hedger()
+
+    async def call():
+        await asyncio.sleep(0.02)
+        raise RuntimeError("down")
+
+    with pytest.raises(RuntimeError):
+        await hedger.run(call)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_cancels_primary_before_hedge_delay():
+    hedger = make_hedger(min_delay_seconds=10)
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def call():
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    runner = asyncio.ensure_future(hedger.run(call))
+    await started.wait()
+    runner.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await runner
+
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+def test_get_hedger_disabled_by_default():
+    with patch("app.providers.shared.hedging.settings") as mock_settings:
+        mock_settings.hedge_enabled = False
+
+        assert get_hedger(Provider.RENTCAST, OperationType.RENTALS) is None
@@ -4,19 +4,38 @@ import httpx
 import pytest
 
 from app.domain.enums.context_request import OperationType
-from app.domain.exceptions.provider_exceptions import (ProviderAuthError,
-                                                       ProviderClientError,
-                                                       ProviderNetworkError,
-                                                       ProviderParsingError,
-                                                       ProviderRateLimitError,
-                                                       ProviderServerError,
-                                                       ProviderTimeoutError,
-                                                       ProviderUnexpectedError)
+from app.domain.exceptions.provider_exceptions import (
+    ProviderAuthError, ProviderCircuitOpenError, ProviderClientError,
+    ProviderNetworkError, ProviderParsingError, ProviderRateLimitError,
+    ProviderServerError, ProviderTimeoutError, ProviderUnexpectedError)
 from app.providers.enums.provider import Provider
+from app.providers.shared import http_client, resilience
 from app.providers.shared.http import http_get_json
+from app.providers.shared.resilience import RetryPolicy
+
+
+@pytest.fixture(autouse=True)
+def reset_http_clients():
+    http_client._http_clients.clear()
+    yield
+    http_client._http_clients.clear()
+
+
+@pytest.fixture(autouse=True)
+def single_attempt(monkeypatch):
+    # Error-mapping tests exercise one attempt; retries are covered below
+    resilience._breakers.clear()
+    monkeypatch.setattr(
+        "app.providers.shared.http.get_retry_policy",
+        lambda provider, operation: RetryPolicy(max_attempts=1),
+    )
+    yield
+    resilience._breakers.clear()
 
 
 class MockAsyncClient:
+    is_closed = False
+
     def __init__(self, response=None, exc: Exception | None = None):
         self._response = response
         self._exc = exc
@@ -185,3 +204,219 @@ async def test_http_get_json_schema_mismatch(monkeypatch):
             Provider.RENTCAST,
             expected_type=list,
         )
+
+
+@pytest.mark.asyncio
+async def test_http_get_json_uses_injected_client(monkeypatch):
+    def _factory(*args, **kwargs):
+        raise AssertionError("pooled client should not be created")
+
+    monkeypatch.setattr("app.providers.shared.http.httpx.AsyncClient", _factory)
+    client = MockAsyncClient(response=DummyResponse(json_data=[1, 2]))
+
+    result = await http_get_json(
+        "http://example.com",
+        {},
+        None,
+        1.0,
+        OperationType.SALES,
+        Provider.RENTCAST,
+        expected_type=list,
+        client=client,
+    )
+
+    assert result == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_http_get_json_rate_limited_before_request(monkeypatch):
+    class RejectingLimiter:
+        async def acquire(self):
+            raise ProviderRateLimitError("RentCast rate limit wait exceeded")
+
+    async def _limiter(provider):
+        return RejectingLimiter()
+
+    client = MockAsyncClient(exc=AssertionError("request should not be sent"))
+    monkeypatch.setattr("app.providers.shared.http.get_rate_limiter", _limiter)
+
+    with pytest.raises(ProviderRateLimitError):
+        await http_get_json(
+            "http://example.com",
+            {},
+            None,
+            1.0,
+            OperationType.SALES,
+            Provider.RENTCAST,
+            client=client,
+        )
+
+
+class SequenceClient:
+    is_closed = False
+
+    def __init__(self, outcomes):
+        self._outcomes = list(outcomes)
+        self.calls = 0
+
+    async def get(self, *args, **kwargs):
+        self.calls += 1
+        outcome = self._outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def fast_retries(monkeypatch):
+    async def _no_limiter(provider):
+        return None
+
+    monkeypatch.setattr(
+        "app.providers.shared.http.get_retry_policy",
+        lambda provider, operation: RetryPolicy(
+            max_attempts=3, base_delay_seconds=0.001, max_delay_seconds=0.005
+        ),
+    )
+    monkeypatch.setattr("app.providers.shared.http.get_rate_limiter", _no_limiter)
+
+
+@pytest.mark.asyncio
+async def test_http_get_json_retries_transient_errors(fast_retries):
+    client = SequenceClient(
+        [
+            httpx.TimeoutException("slow"),
+            DummyResponse(status_code=503),
+            DummyResponse(json_data={"ok": True}),
+        ]
+    )
+
+    result = await http_get_json(
+        "http://example.com",
+        {},
+        None,
+        1.0,
+        OperationType.RENTALS,
+        Provider.RENTCAST,
+        client=client,
+    )
+
+    assert result == {"ok": True}
+    assert client.calls == 3
+    assert resilience.get_circuit_breaker(Provider.RENTCAST).state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_http_get_json_gives_up_after_max_attempts(fast_retries):
+    client = SequenceClient([DummyResponse(status_code=500)] * 3)
+
+    with pytest.raises(ProviderServerError):
+        await http_get_json(
+            "http://example.com",
+            {},
+            None,
+            1.0,
+            OperationType.RENTALS,
+            Provider.RENTCAST,
+            client=client,
+        )
+    assert client.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_http_get_json_does_not_retry_client_errors(fast_retries):
+    client = SequenceClient([DummyResponse(status_code=400)])
+
+    with pytest.raises(ProviderClientError):
+        await http_get_json(
+            "http://example.com",
+            {},
+            None,
+            1.0,
+            OperationType.RENTALS,
+            Provider.RENTCAST,
+            client=client,
+        )
+    assert client.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_http_get_json_fails_fast_when_circuit_open():
+    breaker = resilience.get_circuit_breaker(Provider.RENTCAST)
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    client = SequenceClient([])
+
+    with pytest.raises(ProviderCircuitOpenError):
+        await http_get_json(
+            "http://example.com",
+            {},
+            None,
+            1.0,
+            OperationType.RENTALS,
+            Provider.RENTCAST,
+            client=client,
+        )
+    assert client.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_http_get_json_open_circuit_spends_no_token(monkeypatch):
+    breaker = resilience.get_circuit_breaker(Provider.RENTCAST)
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+    class CountingLimiter:
+        acquired = 0
+
+        async def acquire(self):
+            self.acquired += 1
+
+    limiter = CountingLimiter()
+
+    async def _limiter(provider):
+        return limiter
+
+    monkeypatch.setattr("app.providers.shared.http.get_rate_limiter", _limiter)
+
+    with pytest.raises(ProviderCircuitOpenError):
+        await http_get_json(
+            "http://example.com",
+            {},
+            None,
+            1.0,
+            OperationType.RENTALS,
+            Provider.RENTCAST,
+            client=SequenceClient([]),
+        )
+    assert limiter.acquired == 0
+
+
+@pytest.mark.asyncio
+async def test_http_get_json_rate_limit_frees_half_open_probe(monkeypatch):
+    breaker = resilience.get_circuit_breaker(Provider.RENTCAST)
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    breaker._opened_at -= breaker.reset_seconds
+
+    class RejectingLimiter:
+        async def acquire(self):
+            raise ProviderRateLimitError("RentCast rate limit wait exceeded")
+
+    async def _limiter(provider):
+        return RejectingLimiter()
+
+    monkeypatch.setattr("app.providers.shared.http.get_rate_limiter", _limiter)
+
+    with pytest.raises(ProviderRateLimitError):
+        await http_get_json(
+            "http://example.com",
+            {},
+            None,
+            1.0,
+            OperationType.RENTALS,
+            Provider.RENTCAST,
+            client=SequenceClient([]),
+        )
+    assert breaker.state == "half_open"
+    breaker.before_call()  # the probe slot is free again
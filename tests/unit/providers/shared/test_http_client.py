@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from app.providers.enums.provider import Provider
+from app.providers.shared import http_client
+
+
+@pytest.fixture(autouse=True)
+def reset_http_clients():
+    http_client._http_clients.clear()
+    yield
+    http_client._http_clients.clear()
+
+
+@pytest.fixture
+def mock_settings():
+    with patch("app.providers.shared.http_client.settings") as mock_settings:
+        mock_settings.request_timeout_seconds = 5
+        mock_settings.http_max_connections = 10
+        mock_settings.http_max_keepalive_connections = 4
+        mock_settings.http_keepalive_expiry_seconds = 15.0
+        mock_settings.http2_enabled = False
+        mock_settings.rentcast_base_url = "https://api.rentcast.io/v1"
+        mock_settings.opencage_base_url = None
+        yield mock_settings
+
+
+@pytest.mark.asyncio
+async def test_get_http_client_reuses_client_per_provider(mock_settings):
+    first = http_client.get_http_client(Provider.RENTCAST)
+    second = http_client.get_http_client(Provider.RENTCAST)
+    other = http_client.get_http_client(Provider.OPENCAGE)
+
+    assert first is second
+    assert first is not other
+    await http_client.close_http_clients()
+
+
+@pytest.mark.asyncio
+async def test_get_http_client_applies_pool_settings(mock_settings):
+    client = http_client.get_http_client(Provider.RENTCAST)
+
+    assert str(client.base_url) == "https://api.rentcast.io/v1/"
+    assert client.timeout.read == 5
+    assert http_client.get_http_client(Provider.OPENCAGE).base_url == httpx.URL("")
+    await http_client.close_http_clients()
+
+
+@pytest.mark.asyncio
+async def test_http2_falls_back_when_h2_missing(mock_settings):
+    mock_settings.http2_enabled = True
+
+    with patch("importlib.util.find_spec", return_value=None):
+        assert http_client._http2_enabled() is False
+
+
+@pytest.mark.asyncio
+async def test_close_http_clients_closes_and_resets(mock_settings):
+    client = http_client.get_http_client(Provider.RENTCAST)
+
+    await http_client.close_http_clients()
+
+    assert client.is_closed
+    assert http_client._http_clients == {}
+    assert http_client.get_http_client(Provider.RENTCAST) is not client
+    await http_client.close_http_clients()
+
+
+@pytest.mark.asyncio
+async def test_init_http_clients_creates_one_per_provider(mock_settings):
+    await http_client.init_http_clients()
+
+    assert set(http_client._http_clients) == set(Provider)
+    await http_client.close_http_clients()
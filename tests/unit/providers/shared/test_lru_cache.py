@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from app.providers.shared.lru_cache import LruTtlCache
+
+
+def test_get_returns_value_and_counts_hits():
+    cache = LruTtlCache(max_weight=10, ttl_seconds=60)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_evicts_least_recently_used_by_weight():
+    cache = LruTtlCache(max_weight=5, ttl_seconds=60, weigher=len)
+    cache.set("a", "xx")
+    cache.set("b", "xx")
+    cache.get("a")
+    cache.set("c", "xx")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "xx"
+    assert cache.get("c") == "xx"
+    assert cache.stats()["weight"] == 4
+    assert cache.evictions == 1
+
+
+def test_oversized_values_are_not_cached():
+    cache = LruTtlCache(max_weight=3, ttl_seconds=60, weigher=len)
+    cache.set("big", "xxxx")
+
+    assert len(cache) == 0
+
+
+class FakeTimer:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    timer = FakeTimer()
+    cache = LruTtlCache(max_weight=10, ttl_seconds=60, timer=timer)
+    cache.set("a", 1)
+
+    timer.now = 60
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_is_capped_at_cache_ttl():
+    timer = FakeTimer()
+    cache = LruTtlCache(max_weight=10, ttl_seconds=5, timer=timer)
+    cache.set("a", 1, ttl_seconds=600)
+    cache.set("b", 1, ttl_seconds=1)
+
+    timer.now = 1
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+    timer.now = 5
+    assert cache.get("a") is None
+    assert cache.stats()["weight"] == 0
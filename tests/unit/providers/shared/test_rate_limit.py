@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from redis.exceptions import RedisError
+
+from app.domain.exceptions.provider_exceptions import ProviderRateLimitError
+from app.providers.enums.provider import Provider
+from app.providers.shared import rate_limit
+from app.providers.shared.rate_limit import (RedisTokenBucket, TokenBucket,
+                                             get_rate_limiter)
+
+
+def _kwargs(**overrides) -> dict:
+    kwargs = {
+        "name": "test",
+        "rate": 100.0,
+        "capacity": 2,
+        "max_waiters": 10,
+        "max_wait_seconds": 1.0,
+    }
+    kwargs.update(overrides)
+    return kwargs
+
+
+def make_bucket(**overrides) -> TokenBucket:
+    return TokenBucket(**_kwargs(**overrides))
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limiters():
+    rate_limit._rate_limiters.clear()
+    yield
+    rate_limit._rate_limiters.clear()
+
+
+@pytest.mark.asyncio
+async def test_burst_within_capacity_does_not_wait():
+    bucket = make_bucket()
+
+    assert await bucket._reserve() == 0
+    assert await bucket._reserve() == 0
+    assert await bucket._reserve() > 0
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_refill():
+    bucket = make_bucket(capacity=1)
+    await bucket.acquire()
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await bucket.acquire()
+
+    assert loop.time() - start >= 0.005
+
+
+@pytest.mark.asyncio
+async def test_acquire_rejects_when_wait_exceeds_deadline():
+    bucket = make_bucket(rate=1.0, capacity=1, max_wait_seconds=0.1)
+    await bucket.acquire()
+
+    with pytest.raises(ProviderRateLimitError):
+        await bucket.acquire()
+
+
+@pytest.mark.asyncio
+async def test_acquire_rejects_when_queue_full():
+    bucket = make_bucket(rate=10.0, capacity=1, max_waiters=1)
+    await bucket.acquire()
+    waiter = asyncio.create_task(bucket.acquire())
+    await asyncio.sleep(0)
+
+    with pytest.raises(ProviderRateLimitError):
+        await bucket.acquire()
+    await waiter
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_refunds_token():
+    bucket = make_bucket(rate=1.0, capacity=1)
+    await bucket.acquire()
+    waiter = asyncio.create_task(bucket.acquire())
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert bucket.waiters == 0
+    assert bucket._tokens > -0.5
+
+
+@pytest.mark.asyncio
+async def test_redis_bucket_uses_shared_wait():
+    redis = AsyncMock()
+    redis.eval.return_value = b"0.25"
+    bucket = RedisTokenBucket(redis=redis, key="rb:ratelimit:RentCast", **_kwargs())
+
+    assert await bucket._reserve() == 0.25
+    assert redis.eval.await_args.args[2] == "rb:ratelimit:RentCast"
+
+
+@pytest.mark.asyncio
+async def test_redis_bucket_rejects_over_deadline():
+    redis = AsyncMock()
+    redis.eval.return_value = b"-1"
+    bucket = RedisTokenBucket(redis=redis, key="k", **_kwargs())
+
+    with pytest.raises(ProviderRateLimitError):
+        await bucket._reserve()
+
+
+@pytest.mark.asyncio
+async def test_redis_bucket_falls_back_to_local_on_error():
+    redis = AsyncMock()
+    redis.eval.side_effect = RedisError("down")
+    bucket = RedisTokenBucket(redis=redis, key="k", **_kwargs())
+
+    assert await bucket._reserve() == 0
+
+
+@pytest.mark.asyncio
+async def test_redis_bucket_is_shared_between_workers():
+    fakeredis = pytest.importorskip("fakeredis")
+    redis = fakeredis.FakeAsyncRedis()
+    workers = [
+        RedisTokenBucket(redis=redis, key="k", **_kwargs(rate=1.0, capacity=2))
+        for _ in range(3)
+    ]
+
+    waits = [await w._reserve() for w in workers]
+
+    assert waits[:2] == [0, 0]
+    assert waits[2] > 0
+
+
+@pytest.mark.asyncio
+async def test_get_rate_limiter_respects_provider_override():
+    with patch("app.providers.shared.rate_limit.settings") as mock_settings:
+        mock_settings.rate_limit_rps = 20
+        mock_settings.rentcast_rate_limit_rps = None
+        mock_settings.opencage_rate_limit_rps = 0
+        mock_settings.rate_limit_burst = None
+        mock_settings.rate_limit_max_waiters = 5
+        mock_settings.rate_limit_max_wait_seconds = 1.0
+        mock_settings.rate_limit_shared = False
+
+        rentcast = await get_rate_limiter(Provider.RENTCAST)
+        opencage = await get_rate_limiter(Provider.OPENCAGE)
+
+    assert rentcast is not None and rentcast.rate == 20
+    assert rentcast.capacity == 20
+    assert opencage is None
+
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from app.domain.enums.context_request import OperationType
+from app.domain.exceptions.provider_exceptions import ProviderCircuitOpenError
+from app.providers.enums.provider import Provider
+from app.providers.shared import resilience
+from app.providers.shared.resilience import (CircuitBreaker, CircuitState,
+                                             RetryPolicy, get_retry_policy)
+
+
+@pytest.fixture(autouse=True)
+def reset_breakers():
+    resilience._breakers.clear()
+    yield
+    resilience._breakers.clear()
+
+
+def test_next_delay_is_bounded():
+    policy = RetryPolicy(base_delay_seconds=0.1, max_delay_seconds=1.0)
+    delay = policy.base_delay_seconds
+    for _ in range(50):
+        delay = policy.next_delay(delay)
+        assert 0.1 <= delay <= 1.0
+
+
+def test_get_retry_policy_applies_most_specific_override():
+    with patch("app.providers.shared.resilience.settings") as mock_settings:
+        mock_settings.retry_max_attempts = 3
+        mock_settings.retry_base_delay_seconds = 0.2
+        mock_settings.retry_max_delay_seconds = 2.0
+        mock_settings.retry_deadline_seconds = 20.0
+        mock_settings.retry_policies = {
+            "RentCast": {"max_attempts": 4, "deadline_seconds": 10.0},
+            "RentCast:sale": {"max_attempts": 1},
+        }
+
+        sales = get_retry_policy(Provider.RENTCAST, OperationType.SALES)
+        rentals = get_retry_policy(Provider.RENTCAST, OperationType.RENTALS)
+        geocoding = get_retry_policy(Provider.OPENCAGE, OperationType.GEOCODING)
+
+    assert sales == RetryPolicy(max_attempts=1, deadline_seconds=10.0)
+    assert rentals == RetryPolicy(max_attempts=4, deadline_seconds=10.0)
+    assert geocoding == RetryPolicy()
+
+
+def test_breaker_opens_after_threshold():
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_seconds=60)
+
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    with pytest.raises(ProviderCircuitOpenError):
+        breaker.before_call()
+
+
+def test_breaker_success_resets_failure_count():
+    breaker = CircuitBreaker("test", failure_threshold=2, reset_seconds=60)
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_breaker_half_open_allows_single_probe():
+    breaker = CircuitBreaker("test", failure_threshold=1, reset_seconds=0)
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.HALF_OPEN
+    breaker.before_call()
+    with pytest.raises(ProviderCircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_success()
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_breaker_half_open_failure_reopens():
+    breaker = CircuitBreaker("test", failure_threshold=3, reset_seconds=60)
+    for _ in range(3):
+        breaker.record_failure()
+    breaker._opened_at -= 60
+
+    breaker.before_call()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitState.OPEN
+    assert breaker.snapshot()["retry_in_seconds"] > 0
+
+
+def test_circuit_breaker_snapshot_lists_every_provider():
+    snapshot = resilience.circuit_breaker_snapshot()
+
+    assert set(snapshot) == {p.value for p in Provider}
+    assert snapshot["RentCast"]["state"] == "closed"
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from app.domain.dto import (Address, Dates, Facts, ListingsRequest,
+                            NormalizedListing, Pricing)
+from app.domain.enums.context_request import OperationType
+from app.domain.range_types import Range
+from app.services.geo_cache import (CoveredSearch, GeoContainmentIndex,
+                                    covered_search_for, filter_to_request)
+
+AUSTIN = (30.2672, -97.7431)
+
+
+def make_listing(listing_id: str, lat: float, lon: float, listed: str | None = None):
+    return NormalizedListing(
+        id=listing_id,
+        category="rental",
+        status="Active",
+        address=Address(lat=lat, lon=lon),
+        facts=Facts(beds=2),
+        pricing=Pricing(list_price=1500),
+        dates=Dates(listed=listed),
+    )
+
+
+def register(index: GeoContainmentIndex, request: ListingsRequest, count: int = 1):
+    entry = covered_search_for(
+        "wide",
+        request,
+        OperationType.RENTALS,
+        [make_listing(str(i), *AUSTIN) for i in range(count)],
+    )
+    index.register(entry, ttl_seconds=60)
+    return entry
+
+
+def test_smaller_concentric_search_is_covered():
+    index = GeoContainmentIndex()
+    register(
+        index, ListingsRequest(latitude=AUSTIN[0], longitude=AUSTIN[1], radius_miles=5)
+    )
+
+    request = ListingsRequest(latitude=30.28, longitude=-97.75, radius_miles=2)
+
+    assert index.find_covering(request, OperationType.RENTALS).key == "wide"
+    assert index.find_covering(request, OperationType.SALES) is None
+
+
+def test_circle_poking_outside_is_not_covered():
+    index = GeoContainmentIndex()
+    register(
+        index, ListingsRequest(latitude=AUSTIN[0], longitude=AUSTIN[1], radius_miles=5)
+    )
+
+    # ~4.8 miles north; a 1 mile radius crosses the cached boundary
+    request = ListingsRequest(latitude=30.337, longitude=AUSTIN[1], radius_miles=1)
+
+    assert index.find_covering(request, OperationType.RENTALS) is None
+
+
+def test_truncated_search_is_never_used():
+    index = GeoContainmentIndex()
+    entry = register(
+        index,
+        ListingsRequest(latitude=AUSTIN[0], longitude=AUSTIN[1], radius_miles=5),
+        count=500,
+    )
+    request = ListingsRequest(latitude=AUSTIN[0], longitude=AUSTIN[1], radius_miles=1)
+
+    assert entry.truncated
+    assert index.find_covering(request, OperationType.RENTALS) is None
+
+
+def test_days_old_window_must_be_covered():
+    index = GeoContainmentIndex()
+    register(
+        index,
+        ListingsRequest(
+            latitude=AUSTIN[0],
+            longitude=AUSTIN[1],
+            radius_miles=5,
+            days_old=Range[int](max=30),
+        ),
+    )
+
+    narrower_age = ListingsRequest(
+        latitude=AUSTIN[0],
+        longitude=AUSTIN[1],
+        radius_miles=1,
+        days_old=Range[int](max=7),
+    )
+    wider_age = ListingsRequest(
+        latitude=AUSTIN[0],
+        longitude=AUSTIN[1],
+        radius_miles=1,
+        days_old=Range[int](max=90),
+    )
+
+    assert index.find_covering(narrower_age, OperationType.RENTALS) is not None
+    assert index.find_covering(wider_age, OperationType.RENTALS) is None
+
+
+def test_expired_entries_are_dropped():
+    index = GeoContainmentIndex()
+    entry = register(
+        index, ListingsRequest(latitude=AUSTIN[0], longitude=AUSTIN[1], radius_miles=5)
+    )
+    entry.expires_at = 0
+
+    request = ListingsRequest(latitude=AUSTIN[0], longitude=AUSTIN[1], radius_miles=1)
+
+    assert index.find_covering(request, OperationType.RENTALS) is None
+    assert len(index) == 0
+
+
+def test_tightest_covering_search_wins():
+    index = GeoContainmentIndex()
+    for key, radius in (("wide", 10), ("tight", 3)):
+        entry = covered_search_for(
+            key,
+            ListingsRequest(
+                latitude=AUSTIN[0], longitude=AUSTIN[1], radius_miles=radius
+            ),
+            OperationType.RENTALS,
+            [],
+        )
+        index.register(entry, ttl_seconds=60)
+
+    request = ListingsRequest(latitude=AUSTIN[0], longitude=AUSTIN[1], radius_miles=1)
+
+    assert index.find_covering(request, OperationType.RENTALS).key == "tight"
+
+
+def test_filter_to_request_applies_radius_and_age():
+    now = datetime.now(timezone.utc)
+    recent = (now - timedelta(days=2)).isoformat()
+    stale = (now - timedelta(days=20)).isoformat()
+    listings = [
+        make_listing("near-recent", 30.27, -97.74, recent),
+        make_listing("near-stale", 30.27, -97.74, stale),
+        make_listing("far", 30.40, -97.74, recent),
+    ]
+    covering = CoveredSearch(
+        key="wide",
+        category=OperationType.RENTALS,
+        lat=AUSTIN[0],
+        lon=AUSTIN[1],
+        radius_miles=15,
+        location={},
+        ranges={},
+        days_old=Range(max=30),
+        truncated=False,
+    )
+    request = ListingsRequest(
+        latitude=AUSTIN[0],
+        longitude=AUSTIN[1],
+        radius_miles=2,
+        days_old=Range[int](max=7),
+    )
+
+    result = filter_to_request(listings, request, covering)
+
+    assert [l.id for l in result] == ["near-recent"]
+
+
+def test_wider_range_filters_cover_narrower_ones():
+    index = GeoContainmentIndex()
+    entry = covered_search_for(
+        "austin",
+        ListingsRequest(city="Austin", state="TX", price=Range[float](max=3000)),
+        OperationType.RENTALS,
+        [],
+    )
+    index.register(entry, ttl_seconds=60)
+
+    narrower = ListingsRequest(
+        city=" austin",
+        state="tx",
+        beds=Range[int](min=2, max=3),
+        price=Range[float](min=1500, max=2500),
+    )
+    looser_price = ListingsRequest(city="Austin", state="TX")
+    other_city = ListingsRequest(
+        city="Dallas", state="TX", price=Range[float](max=2000)
+    )
+
+    assert index.find_covering(narrower, OperationType.RENTALS).key == "austin"
+    assert index.find_covering(looser_price, OperationType.RENTALS) is None
+    assert index.find_covering(other_city, OperationType.RENTALS) is None
+
+
+def test_filter_to_request_applies_tighter_ranges():
+    listings = [
+        NormalizedListing(
+            id=f"{beds}-{price}",
+            category="rental",
+            address=Address(),
+            facts=Facts(beds=beds),
+            pricing=Pricing(list_price=price),
+        )
+        for beds, price in ((1, 1800), (2, 1400), (2, 2000), (3, 2600), (None, 2000))
+    ]
+    request = ListingsRequest(
+        zip="78701",
+        beds=Range[int](min=2, max=3),
+        price=Range[float](min=1500, max=2500),
+    )
+    covering = covered_search_for(
+        "zip", ListingsRequest(zip="78701"), OperationType.RENTALS, listings
+    )
+
+    result = filter_to_request(listings, request, covering)
+
+    assert [l.id for l in result] == ["2-2000"]
+
+
+def test_own_entry_can_be_excluded():
+    index = GeoContainmentIndex()
+    request = ListingsRequest(latitude=AUSTIN[0], longitude=AUSTIN[1], radius_miles=5)
+    register(index, request)
+
+    assert index.find_covering(request, OperationType.RENTALS).key == "wide"
+    assert (
+        index.find_covering(request, OperationType.RENTALS, exclude_key="wide") is None
+    )
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
-from unittest.mock import AsyncMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from app.domain.dto import Center, ListingsRequest
+from app.domain.exceptions.provider_exceptions import (ProviderClientError,
+                                                       ProviderNoResultsError,
+                                                       ProviderRateLimitError,
+                                                       ProviderTimeoutError)
 from app.domain.ports.geocoding_port import GeocodingPort
+from app.providers.shared.lru_cache import LruTtlCache
 from app.services.geocoding_service import GeocodingService
 
 
@@ -13,19 +19,42 @@ from app.services.geocoding_service import GeocodingService
 def geocoding_port() -> GeocodingPort:
     port = AsyncMock(spec=GeocodingPort)
     port.geocode = AsyncMock()
+    port.cache_key = MagicMock(side_effect=lambda request: request.address.lower())
     return port
 
 
+class CacheStub:
+    def __init__(self):
+        self.store = {}
+        self.set_calls = 0
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ttl_seconds=None, compute_seconds=None):
+        self.set_calls += 1
+        self.store[key] = value
+
+
 @pytest.fixture
-def service(geocoding_port: GeocodingPort) -> GeocodingService:
-    return GeocodingService(geocoding_port=geocoding_port)
+def cache_port() -> CacheStub:
+    return CacheStub()
+
+
+@pytest.fixture
+def service(geocoding_port: GeocodingPort, cache_port: CacheStub) -> GeocodingService:
+    return GeocodingService(
+        geocoding_port=geocoding_port,
+        cache_port=cache_port,
+        negative_cache=LruTtlCache(max_weight=10, ttl_seconds=60),
+    )
 
 
 @pytest.mark.asyncio
 async def test_geocode_delegates_to_port(
     service: GeocodingService, geocoding_port: GeocodingPort
 ):
-    request = ListingsRequest(latitude=30.0, longitude=-97.0, radius_miles=5.0, limit=1)
+    request = ListingsRequest(address="123 Main St, Austin, TX")
     expected = Center(lat=30.0, lon=-97.0)
     geocoding_port.geocode.return_value = expected
 
@@ -33,3 +62,216 @@ async def test_geocode_delegates_to_port(
 
     geocoding_port.geocode.assert_awaited_once_with(request)
     assert result == expected
+
+
+@pytest.mark.asyncio
+async def test_lat_lon_short_circuits_without_port(
+    service: GeocodingService, geocoding_port: GeocodingPort, cache_port: CacheStub
+):
+    request = ListingsRequest(latitude=30.0, longitude=-97.0, radius_miles=5.0, limit=1)
+
+    result = await service.geocode(request)
+
+    assert result == Center(lat=30.0, lon=-97.0)
+    geocoding_port.geocode.assert_not_awaited()
+    assert cache_port.set_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_repeat_location_is_served_from_cache(
+    service: GeocodingService, geocoding_port: GeocodingPort, cache_port: CacheStub
+):
+    geocoding_port.geocode.return_value = Center(lat=30.0, lon=-97.0)
+
+    first = await service.geocode(ListingsRequest(address="123 Main St"))
+    second = await service.geocode(ListingsRequest(address="123 MAIN ST"))
+
+    assert first == second == Center(lat=30.0, lon=-97.0)
+    geocoding_port.geocode.assert_awaited_once()
+    assert cache_port.store == {"123 main st": first}
+
+
+@pytest.mark.asyncio
+async def test_unresolved_location_is_not_retried(
+    service: GeocodingService, geocoding_port: GeocodingPort
+):
+    geocoding_port.geocode.side_effect = ProviderNoResultsError("no results")
+    request = ListingsRequest(address="nowhere at all")
+
+    for _ in range(2):
+        with pytest.raises(ProviderNoResultsError):
+            await service.geocode(request)
+
+    geocoding_port.geocode.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_client_error_is_cached_per_location(
+    service: GeocodingService, geocoding_port: GeocodingPort
+):
+    geocoding_port.geocode.side_effect = ProviderClientError("client error 400")
+
+    with pytest.raises(ProviderClientError):
+        await service.geocode(ListingsRequest(address="bad"))
+    with pytest.raises(ProviderClientError):
+        await service.geocode(ListingsRequest(address="bad"))
+    geocoding_port.geocode.side_effect = None
+    geocoding_port.geocode.return_value = Center(lat=1.0, lon=2.0)
+    center = await service.geocode(ListingsRequest(address="good"))
+
+    assert center == Center(lat=1.0, lon=2.0)
+    assert geocoding_port.geocode.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_timeout_is_not_cached(
+    service: GeocodingService, geocoding_port: GeocodingPort
+):
+    geocoding_port.geocode.side_effect = ProviderTimeoutError("slow")
+
+    for _ in range(2):
+        with pytest.raises(ProviderTimeoutError):
+            await service.geocode(ListingsRequest(address="123 Main St"))
+
+    assert geocoding_port.geocode.await_count == 2
+
+
+class GazetteerStub:
+    def __init__(self, centroids):
+        self.centroids = centroids
+
+    def lookup(self, request):
+        return self.centroids.get(request.zip)
+
+
+@pytest.mark.asyncio
+async def test_gazetteer_answers_before_cache_and_port(
+    geocoding_port: GeocodingPort, cache_port: CacheStub
+):
+    service = GeocodingService(
+        geocoding_port=geocoding_port,
+        cache_port=cache_port,
+        negative_cache=LruTtlCache(max_weight=10, ttl_seconds=60),
+        gazetteer=GazetteerStub({"78701": Center(lat=30.27, lon=-97.74)}),
+    )
+
+    result = await service.geocode(ListingsRequest(zip="78701"))
+
+    assert result == Center(lat=30.27, lon=-97.74)
+    geocoding_port.geocode.assert_not_awaited()
+    assert cache_port.set_calls == 0
+
+
+@pytest.mark.asyncio
+async def test_gazetteer_miss_falls_back_to_port(
+    geocoding_port: GeocodingPort, cache_port: CacheStub
+):
+    geocoding_port.geocode.return_value = Center(lat=1.0, lon=2.0)
+    service = GeocodingService(
+        geocoding_port=geocoding_port,
+        cache_port=cache_port,
+        negative_cache=LruTtlCache(max_weight=10, ttl_seconds=60),
+        gazetteer=GazetteerStub({}),
+    )
+
+    result = await service.geocode(ListingsRequest(address="1 Main St", zip="00001"))
+
+    assert result == Center(lat=1.0, lon=2.0)
+    geocoding_port.geocode.assert_awaited_once()
+
+
+class BatchPort:
+    """Geocoding port that records concurrency and spends a call budget."""
+
+    def __init__(self, budget=None, delay=0.01):
+        self.budget = budget
+        self.delay = delay
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+
+    def cache_key(self, request):
+        return (request.address or request.zip or "").lower()
+
+    def call_budget(self):
+        return self.budget
+
+    async def geocode(self, request):
+        self.calls.append(request.address)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        if self.budget is not None:
+            self.budget -= 1
+        if request.address.startswith("bad"):
+            raise ProviderNoResultsError("no results")
+        return Center(lat=float(len(request.address)), lon=0.0)
+
+
+async def collect(service, requests, max_concurrency=4):
+    return [r async for r in service.geocode_batch(requests, max_concurrency)]
+
+
+@pytest.mark.asyncio
+async def test_batch_dedupes_and_serves_cache_first(cache_port: CacheStub):
+    port = BatchPort()
+    cache_port.store["cached st"] = Center(lat=9.0, lon=9.0)
+    service = GeocodingService(
+        geocoding_port=port,
+        cache_port=cache_port,
+        negative_cache=LruTtlCache(max_weight=10, ttl_seconds=60),
+    )
+    requests = [
+        ListingsRequest(address="1 Main St"),
+        ListingsRequest(address="Cached St"),
+        ListingsRequest(address="1 MAIN ST"),
+        ListingsRequest(latitude=1.0, longitude=2.0),
+        ListingsRequest(address="bad place"),
+    ]
+
+    results = await collect(service, requests)
+
+    assert [r.indexes for r in results[:2]] == [[1], [3]]
+    assert all(r.cached for r in results[:2])
+    by_index = {tuple(r.indexes): r for r in results}
+    assert by_index[(0, 2)].center == Center(lat=9.0, lon=0.0)
+    assert not by_index[(0, 2)].cached
+    assert isinstance(by_index[(4,)].error, ProviderNoResultsError)
+    assert sorted(port.calls) == ["1 Main St", "bad place"]
+
+
+@pytest.mark.asyncio
+async def test_batch_fan_out_is_bounded_by_concurrency(cache_port: CacheStub):
+    port = BatchPort()
+    service = GeocodingService(
+        geocoding_port=port,
+        cache_port=cache_port,
+        negative_cache=LruTtlCache(max_weight=10, ttl_seconds=60),
+    )
+    requests = [ListingsRequest(address=f"{i} Main St") for i in range(12)]
+
+    results = await collect(service, requests, max_concurrency=3)
+
+    assert len(results) == 12
+    assert port.peak == 3
+
+
+@pytest.mark.asyncio
+async def test_batch_stops_calling_once_budget_is_spent(cache_port: CacheStub):
+    port = BatchPort(budget=2)
+    service = GeocodingService(
+        geocoding_port=port,
+        cache_port=cache_port,
+        negative_cache=LruTtlCache(max_weight=10, ttl_seconds=60),
+    )
+    requests = [ListingsRequest(address=f"{i} Main St") for i in range(5)]
+
+    results = await collect(service, requests, max_concurrency=8)
+
+    assert len(port.calls) == 2
+    assert port.peak <= 2
+    limited = [r for r in results if isinstance(r.error, ProviderRateLimitError)]
+    assert len(limited) == 3
@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import List
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from app.domain.dto import (Address, CachedListings, Facts, ListingsRequest,
                             NormalizedListing, Pricing, SortSpec)
+from app.domain.enums.context_request import OperationType
+from app.domain.exceptions.provider_exceptions import (ProviderClientError,
+                                                       ProviderServerError)
 from app.domain.ports.listings_port import ListingsPort
+from app.domain.range_types import Range
+from app.services import listings_service
 from app.services.listings_service import ListingsService, sort_listings
+from app.services.spatial_index import ListingSpatialIndex
 
 
 def make_listing(
@@ -75,7 +83,8 @@ async def test_get_sale_data_sorts_by_requested_field(
     cache_port.set.assert_awaited_once()
     args, _ = cache_port.set.await_args
     assert isinstance(args[1], CachedListings)
-    assert [l.id for l in args[1].items] == ["a", "b"]
+    # cached in provider order so any sort can be served from it
+    assert [l.id for l in args[1].items] == ["b", "a"]
 
 
 @pytest.mark.asyncio
@@ -182,3 +191,523 @@ async def test_get_regional_metrics_returns_computed_values(
     assert metrics.overall.mean_rent == 1900
     assert metrics.overall.median_rent == 1900
     assert metrics.overall.fastest_days_on_market == 10
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_rental_requests_share_one_fetch(
+    service: ListingsService, listings_port: ListingsPort, cache_port
+):
+    gate = asyncio.Event()
+    listings = [make_listing(1, 1, 1.0, 1, "a", category="rental")]
+
+    async def slow_fetch(_request):
+        await gate.wait()
+        return listings
+
+    listings_port.fetch_rentals.side_effect = slow_fetch
+    req = ListingsRequest(latitude=1.0, longitude=1.0, radius_miles=5.0, limit=10)
+
+    waiters = [asyncio.create_task(service.get_rental_data(req)) for _ in range(3)]
+    await asyncio.sleep(0)
+    gate.set()
+    results = await asyncio.gather(*waiters)
+
+    assert all(r == listings for r in results)
+    listings_port.fetch_rentals.assert_awaited_once_with(req)
+    cache_port.set.assert_awaited_once()
+    assert service.single_flight.joins == 2
+
+
+class LeasingCacheStub:
+    def __init__(self, token=None, peer_value=None):
+        self.leases_enabled = True
+        self.get = AsyncMock(return_value=None)
+        self.set = AsyncMock()
+        self.delete = AsyncMock()
+        self.clear = AsyncMock()
+        self.acquire_lease = AsyncMock(return_value=token)
+        self.release_lease = AsyncMock()
+        self.wait_for_value = AsyncMock(return_value=peer_value)
+
+
+@pytest.mark.asyncio
+async def test_leaseholder_fetches_and_releases_lease(listings_port: ListingsPort):
+    cache = LeasingCacheStub(token="tok")
+    listings_port.fetch_rentals.return_value = [make_listing(1, 1, 1.0, 1, "a")]
+    service = ListingsService(listings_port=listings_port, cache_port=cache)
+    req = ListingsRequest(latitude=1.0, longitude=1.0, radius_miles=5.0)
+
+    await service.get_rental_data(req)
+
+    listings_port.fetch_rentals.assert_awaited_once()
+    cache.set.assert_awaited_once()
+    cache.release_lease.assert_awaited_once()
+    assert cache.release_lease.await_args.args[1] == "tok"
+
+
+@pytest.mark.asyncio
+async def test_lease_waiter_uses_value_filled_by_peer(listings_port: ListingsPort):
+    peer = [make_listing(1, 1, 1.0, 1, "peer")]
+    cache = LeasingCacheStub(token=None, peer_value=CachedListings(items=peer))
+    service = ListingsService(listings_port=listings_port, cache_port=cache)
+    req = ListingsRequest(latitude=1.0, longitude=1.0, radius_miles=5.0)
+
+    result = await service.get_rental_data(req)
+
+    assert result == peer
+    listings_port.fetch_rentals.assert_not_awaited()
+    cache.release_lease.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_lease_waiter_falls_back_to_provider_after_wait(
+    listings_port: ListingsPort,
+):
+    cache = LeasingCacheStub(token=None, peer_value=None)
+    listings_port.fetch_sales.return_value = [make_listing(1, 1, 1.0, 1, "a")]
+    service = ListingsService(listings_port=listings_port, cache_port=cache)
+    req = ListingsRequest(latitude=1.0, longitude=1.0, radius_miles=5.0)
+
+    result = await service.get_sale_data(req)
+
+    assert [l.id for l in result] == ["a"]
+    cache.wait_for_value.assert_awaited_once()
+    listings_port.fetch_sales.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_cached_superset_is_sorted_per_request(
+    service: ListingsService, listings_port: ListingsPort, cache_port
+):
+    cache_port.get.return_value = CachedListings(
+        items=[
+            make_listing(300, 3, 2.0, 1400, "b"),
+            make_listing(100, 2, 1.5, 1000, "a"),
+        ]
+    )
+    req = ListingsRequest(
+        latitude=1.0, longitude=1.0, sort=SortSpec(by="price", dir="desc")
+    )
+
+    result = await service.get_sale_data(req)
+
+    assert [l.id for l in result] == ["b", "a"]
+    req.sort = SortSpec(by="price", dir="asc")
+    assert [l.id for l in await service.get_sale_data(req)] == ["a", "b"]
+    listings_port.fetch_sales.assert_not_awaited()
+
+
+def test_cache_key_ignores_pagination_and_sort(service: ListingsService):
+    page_one = ListingsRequest(latitude=1.0, longitude=1.0, limit=10, offset=0)
+    page_two = ListingsRequest(
+        latitude=1.0,
+        longitude=1.0,
+        limit=25,
+        offset=10,
+        sort=SortSpec(by="price", dir="desc"),
+    )
+
+    assert service._build_cache_key(
+        page_one, OperationType.RENTALS
+    ) == service._build_cache_key(page_two, OperationType.RENTALS)
+
+
+@pytest.mark.asyncio
+async def test_smaller_radius_is_served_from_covering_search(
+    service: ListingsService, listings_port: ListingsPort, cache_port
+):
+    near = make_listing(100, 2, 1.0, 900, "near", category="rental")
+    near.address.lat, near.address.lon = 30.27, -97.74
+    far = make_listing(200, 2, 1.0, 900, "far", category="rental")
+    far.address.lat, far.address.lon = 30.40, -97.74
+    listings_port.fetch_rentals.return_value = [near, far]
+    stored = {}
+
+    async def fake_set(key, value, **kwargs):
+        stored[key] = value
+
+    async def fake_get(key, early_expiry=True):
+        return stored.get(key)
+
+    cache_port.set.side_effect = fake_set
+    cache_port.get.side_effect = fake_get
+
+    wide = await service.search_rentals(
+        ListingsRequest(latitude=30.2672, longitude=-97.7431, radius_miles=15)
+    )
+    narrow = await service.search_rentals(
+        ListingsRequest(latitude=30.2672, longitude=-97.7431, radius_miles=2)
+    )
+
+    assert (wide.cache, wide.provider_calls) == ("miss", 1)
+    assert (narrow.cache, narrow.provider_calls) == ("partial", 0)
+    assert [l.id for l in narrow.listings] == ["near"]
+    listings_port.fetch_rentals.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_radius_search_is_served_from_spatial_index(
+    listings_port: ListingsPort, cache_port
+):
+    service = ListingsService(
+        listings_port=listings_port,
+        cache_port=cache_port,
+        spatial_index=ListingSpatialIndex(),
+    )
+    near = make_listing(100, 2, 1.0, 900, "near", category="rental")
+    near.address.lat, near.address.lon = 30.27, -97.74
+    pricey = make_listing(900, 2, 1.0, 900, "pricey", category="rental")
+    pricey.address.lat, pricey.address.lon = 30.271, -97.741
+    far = make_listing(200, 2, 1.0, 900, "far", category="rental")
+    far.address.lat, far.address.lon = 30.40, -97.74
+    listings_port.fetch_rentals.return_value = [near, pricey, far]
+
+    await service.search_rentals(
+        ListingsRequest(latitude=30.2672, longitude=-97.7431, radius_miles=15)
+    )
+    narrow = await service.search_rentals(
+        ListingsRequest(
+            latitude=30.2672,
+            longitude=-97.7431,
+            radius_miles=2,
+            price=Range[float](max=500),
+        )
+    )
+
+    assert (narrow.cache, narrow.provider_calls) == ("partial", 0)
+    assert [l.id for l in narrow.listings] == ["near"]
+    listings_port.fetch_rentals.assert_awaited_once()
+    # Only the exact-key lookups; the covering search was never read back
+    assert cache_port.get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_stale_spatial_index_batch_falls_back_to_cache(
+    listings_port: ListingsPort, cache_port, monkeypatch
+):
+    spatial_index = ListingSpatialIndex()
+    service = ListingsService(
+        listings_port=listings_port,
+        cache_port=cache_port,
+        spatial_index=spatial_index,
+    )
+    listings_port.fetch_rentals.return_value = []
+    wide = ListingsRequest(latitude=30.2672, longitude=-97.7431, radius_miles=15)
+    wide_key = service._build_cache_key(wide, OperationType.RENTALS)
+    await service.search_rentals(wide)
+    spatial_index.add(wide_key, OperationType.RENTALS, [], fetched_at=time.time() - 600)
+    monkeypatch.setattr(listings_service.settings, "cache_soft_ttl_seconds", 300)
+
+    result = await service.search_rentals(
+        ListingsRequest(latitude=30.2672, longitude=-97.7431, radius_miles=2)
+    )
+
+    # The cache stub holds nothing, so the covering search is gone too
+    assert result.cache == "miss"
+    assert listings_port.fetch_rentals.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_early_expiry_miss_refetches_instead_of_serving_itself(
+    listings_port: ListingsPort, cache_port
+):
+    service = ListingsService(
+        listings_port=listings_port,
+        cache_port=cache_port,
+        spatial_index=ListingSpatialIndex(),
+    )
+    listing = make_listing(100, 2, 1.0, 900, "near", category="rental")
+    listing.address.lat, listing.address.lon = 30.27, -97.74
+    listings_port.fetch_rentals.return_value = [listing]
+    request = ListingsRequest(latitude=30.2672, longitude=-97.7431, radius_miles=5)
+
+    await service.search_rentals(request)
+    # XFetch rolled an early expiry: the adapter reports a miss
+    again = await service.search_rentals(request)
+
+    assert (again.cache, again.provider_calls) == ("miss", 1)
+    assert listings_port.fetch_rentals.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_evicted_covering_search_falls_back_to_provider(
+    service: ListingsService, listings_port: ListingsPort, cache_port
+):
+    listings_port.fetch_rentals.return_value = []
+    wide = ListingsRequest(latitude=30.2672, longitude=-97.7431, radius_miles=15)
+    wide_key = service._build_cache_key(wide, OperationType.RENTALS)
+
+    await service.search_rentals(wide)
+    result = await service.search_rentals(
+        ListingsRequest(latitude=30.2672, longitude=-97.7431, radius_miles=2)
+    )
+
+    assert result.cache == "miss"
+    assert listings_port.fetch_rentals.await_count == 2
+    assert wide_key not in service.geo_index._entries
+
+
+@pytest.mark.asyncio
+async def test_narrower_price_range_is_served_from_wider_search(
+    service: ListingsService, listings_port: ListingsPort, cache_port
+):
+    listings_port.fetch_sales.return_value = [
+        make_listing(250000, 3, 2.0, 1400, "cheap"),
+        make_listing(450000, 3, 2.0, 1800, "pricey"),
+    ]
+    stored = {}
+
+    async def fake_set(key, value, **kwargs):
+        stored[key] = value
+
+    async def fake_get(key, early_expiry=True):
+        return stored.get(key)
+
+    cache_port.set.side_effect = fake_set
+    cache_port.get.side_effect = fake_get
+
+    await service.search_sales(ListingsRequest(zip="78701"))
+    narrow = await service.search_sales(
+        ListingsRequest(zip="78701", price=Range[float](max=300000))
+    )
+
+    assert narrow.cache == "partial"
+    assert [l.id for l in narrow.listings] == ["cheap"]
+    listings_port.fetch_sales.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_stale_hit_is_served_and_refreshed_once(
+    service: ListingsService, listings_port: ListingsPort, cache_port
+):
+    cache_port.get.return_value = CachedListings(
+        items=[make_listing(100, 2, 1.0, 900, "old")],
+        fetched_at=time.time() - 120,
+    )
+    listings_port.fetch_sales.return_value = [make_listing(110, 2, 1.0, 900, "new")]
+    req = ListingsRequest(latitude=1.0, longitude=1.0)
+
+    with patch.object(listings_service.settings, "cache_soft_ttl_seconds", 60):
+        first, second = await asyncio.gather(
+            service.search_sales(req), service.search_sales(req)
+        )
+        await asyncio.gather(*listings_service._background_refreshes.values())
+
+    assert [l.id for l in first.listings] == ["old"]
+    assert first.stale and second.stale
+    assert (first.cache, first.provider_calls) == ("hit", 0)
+    listings_port.fetch_sales.assert_awaited_once()
+    stored = cache_port.set.await_args.args[1]
+    assert [l.id for l in stored.items] == ["new"]
+    assert stored.fetched_at > time.time() - 5
+
+
+@pytest.mark.asyncio
+async def test_fresh_hit_is_not_refreshed(
+    service: ListingsService, listings_port: ListingsPort, cache_port
+):
+    cache_port.get.return_value = CachedListings(
+        items=[make_listing(100, 2, 1.0, 900, "a")], fetched_at=time.time()
+    )
+
+    with patch.object(listings_service.settings, "cache_soft_ttl_seconds", 60):
+        result = await service.search_sales(
+            ListingsRequest(latitude=1.0, longitude=1.0)
+        )
+
+    assert not result.stale
+    assert not listings_service._background_refreshes
+    listings_port.fetch_sales.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_stale_refresh_is_left_to_lease_holder(listings_port: ListingsPort):
+    cache = LeasingCacheStub()
+    cache.get.return_value = CachedListings(
+        items=[make_listing(100, 2, 1.0, 900, "old")], fetched_at=0.0
+    )
+    cache.acquire_lease.return_value = None
+    service = ListingsService(listings_port=listings_port, cache_port=cache)
+
+    with patch.object(listings_service.settings, "cache_soft_ttl_seconds", 60):
+        result = await service.search_sales(
+            ListingsRequest(latitude=1.0, longitude=1.0)
+        )
+        await asyncio.gather(*listings_service._background_refreshes.values())
+
+    assert result.stale
+    listings_port.fetch_sales.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_fetch_passes_provider_latency_to_cache(
+    service: ListingsService, listings_port: ListingsPort, cache_port
+):
+    listings_port.fetch_rentals.return_value = []
+
+    await service.get_rental_data(ListingsRequest(latitude=1.0, longitude=1.0))
+
+    assert cache_port.set.await_args.kwargs["compute_seconds"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_fetched_listings_are_registered_in_listing_index(
+    listings_port: ListingsPort, cache_port
+):
+    index = AsyncMock()
+    listings = [make_listing(100, 2, 1.0, 900, "a")]
+    listings_port.fetch_sales.return_value = listings
+    service = ListingsService(
+        listings_port=listings_port, cache_port=cache_port, listing_index=index
+    )
+
+    await service.get_sale_data(ListingsRequest(latitude=1.0, longitude=1.0))
+
+    index.register.assert_awaited_once_with(listings)
+
+
+@pytest.mark.asyncio
+async def test_fetched_rentals_feed_the_rent_index(
+    listings_port: ListingsPort, cache_port
+):
+    rent_index = MagicMock()
+    rentals = [make_listing(2000, 2, 1.0, 900, "a")]
+    listings_port.fetch_rentals.return_value = rentals
+    listings_port.fetch_sales.return_value = [make_listing(300000, 3, 2.0, 1500, "b")]
+    service = ListingsService(
+        listings_port=listings_port, cache_port=cache_port, rent_index=rent_index
+    )
+
+    await service.get_rental_data(ListingsRequest(latitude=1.0, longitude=1.0))
+    await service.get_sale_data(ListingsRequest(latitude=1.0, longitude=1.0))
+
+    rent_index.record.assert_called_once_with(rentals)
+
+
+@pytest.mark.asyncio
+async def test_empty_result_is_cached_with_short_ttl(
+    service: ListingsService, listings_port: ListingsPort, cache_port
+):
+    listings_port.fetch_rentals.return_value = []
+
+    with patch.object(listings_service.settings, "cache_empty_ttl_seconds", 45):
+        await service.get_rental_data(ListingsRequest(zip="99999"))
+
+    assert cache_port.set.await_args.kwargs["ttl_seconds"] == 45
+    assert cache_port.set.await_args.args[1].items == []
+
+
+@pytest.mark.asyncio
+async def test_non_empty_result_uses_default_ttl(
+    service: ListingsService, listings_port: ListingsPort, cache_port
+):
+    listings_port.fetch_rentals.return_value = [make_listing(1, 1, 1.0, 1, "a")]
+
+    await service.get_rental_data(ListingsRequest(zip="78701"))
+
+    assert cache_port.set.await_args.kwargs["ttl_seconds"] is None
+
+
+@pytest.mark.asyncio
+async def test_client_error_is_cached_and_replayed(
+    service: ListingsService, listings_port: ListingsPort, cache_port
+):
+    listings_port.fetch_sales.side_effect = ProviderClientError(
+        "rentcast client error 400"
+    )
+    req = ListingsRequest(zip="00000")
+
+    with patch.object(listings_service.settings, "cache_error_ttl_seconds", 20):
+        with pytest.raises(ProviderClientError):
+            await service.get_sale_data(req)
+
+    negative = cache_port.set.await_args.args[1]
+    assert negative.error == "rentcast client error 400"
+    assert cache_port.set.await_args.kwargs["ttl_seconds"] == 20
+
+    cache_port.get.return_value = negative
+    with pytest.raises(ProviderClientError, match="client error 400"):
+        await service.get_sale_data(req)
+    listings_port.fetch_sales.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_server_error_is_not_cached(
+    service: ListingsService, listings_port: ListingsPort, cache_port
+):
+    listings_port.fetch_sales.side_effect = ProviderServerError("boom")
+
+    with pytest.raises(ProviderServerError):
+        await service.get_sale_data(ListingsRequest(zip="78701"))
+
+    cache_port.set.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_lease_waiter_replays_peer_client_error(listings_port: ListingsPort):
+    cache = LeasingCacheStub(
+        token=None, peer_value=CachedListings(items=[], error="client error 402")
+    )
+    service = ListingsService(listings_port=listings_port, cache_port=cache)
+
+    with pytest.raises(ProviderClientError):
+        await service.get_rental_data(ListingsRequest(zip="78701"))
+
+    listings_port.fetch_rentals.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_covering_search_is_read_without_early_expiry(
+    service: ListingsService, listings_port: ListingsPort, cache_port
+):
+    listing = make_listing(100, 2, 1.0, 900, "near", category="rental")
+    listing.address.lat, listing.address.lon = 30.27, -97.74
+    listings_port.fetch_rentals.return_value = [listing]
+    stored = {}
+
+    async def fake_set(key, value, **kwargs):
+        stored[key] = value
+
+    async def fake_get(key, early_expiry=True):
+        # Every XFetch roll comes up "expire early"
+        return None if early_expiry else stored.get(key)
+
+    cache_port.set.side_effect = fake_set
+    cache_port.get.side_effect = fake_get
+    wide = ListingsRequest(latitude=30.2672, longitude=-97.7431, radius_miles=15)
+    wide_key = service._build_cache_key(wide, OperationType.RENTALS)
+
+    await service.search_rentals(wide)
+    narrow = await service.search_rentals(
+        ListingsRequest(latitude=30.2672, longitude=-97.7431, radius_miles=2)
+    )
+
+    assert (narrow.cache, narrow.provider_calls) == ("partial", 0)
+    assert wide_key in service.geo_index._entries
+    listings_port.fetch_rentals.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_serving_stale_entry(
+    service: ListingsService, listings_port: ListingsPort, cache_port
+):
+    stale = CachedListings(
+        items=[make_listing(100, 2, 1.0, 900, "old")],
+        fetched_at=time.time() - 120,
+    )
+    cache_port.get.return_value = stale
+    listings_port.fetch_sales.side_effect = ProviderClientError("quota exceeded")
+    req = ListingsRequest(latitude=1.0, longitude=1.0)
+
+    with patch.object(listings_service.settings, "cache_soft_ttl_seconds", 60):
+        first = await service.search_sales(req)
+        await asyncio.gather(
+            *listings_service._background_refreshes.values(), return_exceptions=True
+        )
+        second = await service.search_sales(req)
+
+    listings_port.fetch_sales.assert_awaited()
+    cache_port.set.assert_not_awaited()
+    assert [l.id for l in first.listings] == ["old"]
+    assert [l.id for l in second.listings] == ["old"]
+    assert second.stale
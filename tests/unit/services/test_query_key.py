@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from app.core.config import settings
+from app.domain.dto import ListingsRequest
+from app.domain.enums.context_request import OperationType
+from app.domain.range_types import Range
+from app.services.query_key import (build_query_key, canonical_query,
+                                    normalize_text)
+
+
+def test_normalize_text_collapses_whitespace_and_case():
+    assert normalize_text("  123  Main   St,\tAUSTIN ") == "123 main st, austin"
+    assert normalize_text("   ") is None
+    assert normalize_text(None) is None
+
+
+def test_canonical_query_rounds_coordinates():
+    a = ListingsRequest(latitude=30.267201, longitude=-97.743099)
+    b = ListingsRequest(latitude=30.26718, longitude=-97.74312)
+
+    assert canonical_query(a) == canonical_query(b)
+    assert canonical_query(a)["lat"] == 30.2672
+
+
+def test_canonical_query_normalizes_city_state():
+    a = ListingsRequest(city="Austin", state="TX")
+    b = ListingsRequest(city="  austin ", state="tx")
+
+    assert build_query_key(a, OperationType.RENTALS) == build_query_key(
+        b, OperationType.RENTALS
+    )
+
+
+def test_canonical_query_only_keeps_location_provider_uses():
+    req = ListingsRequest(latitude=30.0, longitude=-97.0, zip="78701", city="X")
+
+    query = canonical_query(req)
+
+    assert "zip" not in query and "city" not in query
+    assert query["radius"] == 5.0
+
+
+def test_canonical_query_defaults_days_old_and_drops_open_ranges():
+    explicit = ListingsRequest(
+        zip="78701",
+        days_old=Range[int](max=270),
+        beds=Range[int](),
+    )
+    implicit = ListingsRequest(zip="78701")
+
+    assert canonical_query(implicit)["days_old"] == settings.rentcast_days_old_default
+    assert "beds" not in canonical_query(explicit)
+    assert canonical_query(explicit)["days_old"] == "*:270"
+
+
+def test_build_query_key_separates_categories_and_filters():
+    req = ListingsRequest(zip="78701", beds=Range[int](min=2, max=3))
+    other = ListingsRequest(zip="78701", beds=Range[int](min=2))
+
+    assert build_query_key(req, OperationType.SALES).startswith("sale:")
+    assert build_query_key(req, OperationType.SALES) != build_query_key(
+        req, OperationType.RENTALS
+    )
+    assert build_query_key(req, OperationType.SALES) != build_query_key(
+        other, OperationType.SALES
+    )
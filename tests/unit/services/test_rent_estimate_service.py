@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.domain.dto import (Address, Facts, ListingsRequest,
+                            ListingsSearchResult, NormalizedListing, Pricing)
+from app.domain.exceptions.provider_exceptions import (ProviderServerError,
+                                                       ProviderTimeoutError)
+from app.domain.range_types import Range
+from app.providers.shared.lru_cache import LruTtlCache
+from app.services.rent_estimate_service import (RentalSearchError,
+                                                RentEstimateService,
+                                                rental_search_for)
+
+
+def _listing(listing_id: str, price: float, beds: int, category: str):
+    return NormalizedListing(
+        id=listing_id,
+        category=category,
+        address=Address(),
+        facts=Facts(beds=beds, baths=1.0, sqft=beds * 500),
+        pricing=Pricing(list_price=price),
+    )
+
+
+SALES = [_listing(f"s{i}", 300000 + i, 1 + i % 3, "sale") for i in range(5)]
+RENTALS = [
+    _listing("r1", 1500, 1, "rental"),
+    _listing("r2", 2000, 2, "rental"),
+    _listing("r3", 2500, 3, "rental"),
+]
+
+
+@pytest.fixture
+def listings_service():
+    service = MagicMock()
+    service.search_sales = AsyncMock(
+        return_value=ListingsSearchResult(listings=SALES, provider_calls=1)
+    )
+    service.search_rentals = AsyncMock(
+        return_value=ListingsSearchResult(listings=RENTALS, provider_calls=1)
+    )
+    return service
+
+
+@pytest.fixture
+def service(listings_service) -> RentEstimateService:
+    return RentEstimateService(
+        listings_service, models=LruTtlCache(max_weight=10, ttl_seconds=60)
+    )
+
+
+def test_rental_search_drops_price_and_paging():
+    request = ListingsRequest(
+        zip="78701",
+        beds=Range[int](min=2),
+        price=Range[float](max=400000),
+        offset=20,
+    )
+
+    rental = rental_search_for(request)
+
+    assert rental.price is None
+    assert rental.offset == 0
+    assert rental.beds == request.beds
+    assert rental.zip == "78701"
+
+
+@pytest.mark.asyncio
+async def test_first_search_fetches_both_and_caches_the_model(
+    service, listings_service
+):
+    request = ListingsRequest(zip="78701", limit=2, offset=1)
+
+    first = await service.estimate_sales(request)
+    second = await service.estimate_sales(request.model_copy(update={"offset": 3}))
+
+    assert listings_service.search_rentals.await_count == 1
+    assert listings_service.search_sales.await_count == 2
+    assert (first.estimator_cached, second.estimator_cached) == (False, True)
+    assert (first.provider_calls, second.provider_calls) == (2, 1)
+    assert first.region_key.startswith("rental:")
+    assert first.rentals_used == 3
+    assert first.total == 5
+    assert [listing.id for listing in first.listings] == ["s1", "s2"]
+    assert first.listings[0].rent_estimate.rent == pytest.approx(2000, abs=1)
+    assert first.listings[0].pricing.list_price == 300001
+
+
+@pytest.mark.asyncio
+async def test_region_without_rentals_returns_sales_unestimated(
+    service, listings_service
+):
+    listings_service.search_rentals.return_value = ListingsSearchResult(listings=[])
+
+    result = await service.estimate_sales(ListingsRequest(zip="78701"))
+
+    assert result.rentals_used == 0
+    assert [listing.rent_estimate for listing in result.listings] == [None] * 5
+    assert len(service.models) == 0
+
+
+@pytest.mark.asyncio
+async def test_sale_and_rental_searches_run_concurrently(service, listings_service):
+    rentals_started = asyncio.Event()
+
+    async def search_sales(request):
+        # Deadlocks (and times out) if the rental search only starts afterwards
+        await rentals_started.wait()
+        return ListingsSearchResult(listings=SALES)
+
+    async def search_rentals(request):
+        rentals_started.set()
+        return ListingsSearchResult(listings=RENTALS)
+
+    listings_service.search_sales = search_sales
+    listings_service.search_rentals = search_rentals
+
+    result = await asyncio.wait_for(
+        service.estimate_sales(ListingsRequest(zip="78701")), timeout=1
+    )
+
+    assert result.rentals_used == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_rental_search_is_raised_as_such(service, listings_service):
+    error = ProviderTimeoutError("slow")
+    listings_service.search_rentals.side_effect = error
+
+    with pytest.raises(RentalSearchError) as raised:
+        await service.estimate_sales(ListingsRequest(zip="78701"))
+
+    assert raised.value.error is error
+
+
+@pytest.mark.asyncio
+async def test_failed_sale_search_wins_when_both_fail(service, listings_service):
+    listings_service.search_sales.side_effect = ProviderServerError("down")
+    listings_service.search_rentals.side_effect = ProviderTimeoutError("slow")
+
+    with pytest.raises(ProviderServerError):
+        await service.estimate_sales(ListingsRequest(zip="78701"))
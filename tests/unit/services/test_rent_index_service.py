@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.domain.dto import Address, Dates, Facts, NormalizedListing, Pricing
+from app.providers.redis.sketch_store import RedisSketchStore
+from app.providers.shared.lru_cache import LruTtlCache
+from app.services import rent_index_service
+from app.services.rent_index_service import RentIndexService
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def make_rental(
+    listing_id: str, rent: float, beds: int | None, zip_code: str = "78701"
+) -> NormalizedListing:
+    return NormalizedListing(
+        id=listing_id,
+        category="rental",
+        address=Address(zip=zip_code),
+        facts=Facts(beds=beds, sqft=1000),
+        pricing=Pricing(list_price=rent),
+        dates=Dates(listed="2024-01-01", last_seen="2024-01-15"),
+    )
+
+
+@pytest.fixture
+def service() -> RentIndexService:
+    store = RedisSketchStore(
+        redis=fakeredis.FakeAsyncRedis(), prefix="rb", ttl_seconds=60
+    )
+    return RentIndexService(store, seen=LruTtlCache(max_weight=100, ttl_seconds=60))
+
+
+async def _drain() -> None:
+    await asyncio.gather(*rent_index_service._pending_merges)
+
+
+@pytest.mark.asyncio
+async def test_recorded_rentals_build_zip_and_bedroom_buckets(service):
+    service.record(
+        [
+            make_rental("a", 2000, 2),
+            make_rental("b", 2400, 2),
+            make_rental("c", 3000, 3),
+            make_rental("d", 5000, 7),
+            make_rental("e", 1500, None),
+            make_rental("f", 9999, 2, zip_code="10001"),
+        ]
+    )
+    await _drain()
+
+    index = await service.get_zip_index("78701")
+
+    assert index.overall.listings == 5
+    assert index.overall.rent.count == 5
+    assert index.overall.rent.mean == 2780.0
+    assert index.overall.days_on_market.median == 14.0
+    assert index.overall.updated_at is not None
+    assert 0 <= index.overall.age_seconds < 60
+    assert [(b.beds, b.listings) for b in index.by_beds] == [
+        ("2", 2),
+        ("3", 1),
+        ("6+", 1),
+    ]
+    assert index.by_beds[0].rent_per_sqft.min == 2.0
+
+
+@pytest.mark.asyncio
+async def test_searches_accumulate_and_repeats_are_skipped(service):
+    service.record([make_rental("a", 2000, 2)])
+    await _drain()
+    service.record([make_rental("a", 2000, 2), make_rental("b", 3000, 2)])
+    await _drain()
+    # Same listing at a new price counts as a new observation
+    service.record([make_rental("a", 2100, 2)])
+    await _drain()
+
+    index = await service.get_zip_index("78701")
+
+    assert index.overall.listings == 3
+    assert index.overall.rent.max == 3000.0
+
+
+@pytest.mark.asyncio
+async def test_unknown_zip_has_no_index(service):
+    assert await service.get_zip_index("99999") is None
+
+
+@pytest.mark.asyncio
+async def test_record_skips_when_backlog_is_full(service):
+    service.max_pending = 1
+    blocker = asyncio.ensure_future(asyncio.sleep(0))
+    rent_index_service._pending_merges.add(blocker)
+    try:
+        service.record([make_rental("a", 2000, 2)])
+    finally:
+        rent_index_service._pending_merges.discard(blocker)
+        await blocker
+
+    assert service.seen.get("a:2000.0") is None
+    assert await service.get_zip_index("78701") is None
+
+
+class FailingSketchStore:
+    def __init__(self, result: bool = False):
+        self.result = result
+        self.calls = 0
+
+    async def merge(self, sketches) -> bool:
+        self.calls += 1
+        if self.result is None:
+            raise RuntimeError("store unavailable")
+        return self.result
+
+    async def get_many(self, keys):
+        return {}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("result", [False, None])
+async def test_failed_merge_releases_dedup_keys(result):
+    store = FailingSketchStore(result)
+    service = RentIndexService(store, seen=LruTtlCache(max_weight=100, ttl_seconds=60))
+
+    service.record([make_rental("a", 2000, 2)])
+    await asyncio.gather(*rent_index_service._pending_merges, return_exceptions=True)
+
+    assert service.seen.get("a:2000.0") is None
+    service.record([make_rental("a", 2000, 2)])
+    await asyncio.gather(*rent_index_service._pending_merges, return_exceptions=True)
+    assert store.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_listings_without_id_are_not_recorded(service):
+    service.record(
+        [
+            make_rental("prov:rentcast:unknown", 2000, 2),
+            make_rental("prov:rentcast:unknown", 2000, 3),
+        ]
+    )
+    await _drain()
+
+    assert service.seen.get("prov:rentcast:unknown:2000.0") is None
+    assert await service.get_zip_index("78701") is None
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.services.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    flight: SingleFlight[int] = SingleFlight()
+    calls = 0
+    gate = asyncio.Event()
+
+    async def work() -> int:
+        nonlocal calls
+        calls += 1
+        await gate.wait()
+        return 42
+
+    waiters = [asyncio.create_task(flight.do("k", work)) for _ in range(5)]
+    await asyncio.sleep(0)
+    gate.set()
+    results = await asyncio.gather(*waiters)
+
+    assert results == [42] * 5
+    assert calls == 1
+    assert flight.stats() == {"in_flight": 0, "executions": 1, "joins": 4}
+
+
+@pytest.mark.asyncio
+async def test_exception_is_shared_by_all_waiters():
+    flight: SingleFlight[int] = SingleFlight()
+    gate = asyncio.Event()
+
+    async def work() -> int:
+        await gate.wait()
+        raise ValueError("boom")
+
+    waiters = [asyncio.create_task(flight.do("k", work)) for _ in range(3)]
+    await asyncio.sleep(0)
+    gate.set()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+
+    assert all(isinstance(r, ValueError) for r in results)
+    assert flight.executions == 1
+    assert flight.joins == 2
+
+
+@pytest.mark.asyncio
+async def test_sequential_calls_execute_again():
+    flight: SingleFlight[int] = SingleFlight()
+    calls = 0
+
+    async def work() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await flight.do("k", work) == 1
+    assert await flight.do("k", work) == 2
+    assert flight.joins == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_flight():
+    flight: SingleFlight[str] = SingleFlight()
+    gate = asyncio.Event()
+
+    async def work() -> str:
+        await gate.wait()
+        return "done"
+
+    leader = asyncio.create_task(flight.do("k", work))
+    follower = asyncio.create_task(flight.do("k", work))
+    await asyncio.sleep(0)
+    leader.cancel()
+    gate.set()
+
+    assert await follower == "done"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import random
+import time
+
+from app.domain.dto import Address, Facts, NormalizedListing, Pricing
+from app.domain.enums.context_request import OperationType
+from app.services.spatial_index import ListingSpatialIndex
+from app.utils.distance import great_circle_miles
+
+AUSTIN = (30.2672, -97.7431)
+RENTALS = OperationType.RENTALS
+
+
+def make_listing(listing_id: str, lat: float | None, lon: float | None, price=1500):
+    return NormalizedListing(
+        id=listing_id,
+        category="rental",
+        address=Address(lat=lat, lon=lon),
+        facts=Facts(beds=2),
+        pricing=Pricing(list_price=price),
+    )
+
+
+def test_radius_matches_brute_force_haversine():
+    rng = random.Random(7)
+    listings = [
+        make_listing(
+            str(i),
+            AUSTIN[0] + rng.uniform(-0.5, 0.5),
+            AUSTIN[1] + rng.uniform(-0.5, 0.5),
+        )
+        for i in range(2000)
+    ]
+    index = ListingSpatialIndex(cell_degrees=0.05)
+    index.add("search", RENTALS, listings)
+
+    for radius in (0.5, 3.0, 12.0, 40.0):
+        expected = {
+            listing.id
+            for listing in listings
+            if great_circle_miles(*AUSTIN, listing.address.lat, listing.address.lon)
+            <= radius
+        }
+        found = index.radius(RENTALS, *AUSTIN, radius)
+        assert {listing.id for listing in found} == expected
+        distances = [
+            great_circle_miles(*AUSTIN, listing.address.lat, listing.address.lon)
+            for listing in found
+        ]
+        assert distances == sorted(distances)
+
+
+def test_bbox_includes_edges_and_wraps_antimeridian():
+    index = ListingSpatialIndex(cell_degrees=1.0)
+    index.add(
+        "pacific",
+        RENTALS,
+        [
+            make_listing("west", 10.0, 179.5),
+            make_listing("east", 10.0, -179.5),
+            make_listing("far", 10.0, 0.0),
+            make_listing("edge", 11.0, 179.0),
+        ],
+    )
+
+    found = index.bbox(RENTALS, 9.0, 179.0, 11.0, -179.0)
+
+    assert {listing.id for listing in found} == {"west", "east", "edge"}
+    assert index.radius(RENTALS, 10.0, 179.9, 40.0)[0].id == "west"
+
+
+def test_categories_and_missing_coordinates_are_kept_apart():
+    index = ListingSpatialIndex()
+    index.add(
+        "rent", RENTALS, [make_listing("a", *AUSTIN), make_listing("b", None, None)]
+    )
+
+    assert len(index) == 1
+    assert index.radius(OperationType.SALES, *AUSTIN, 5) == []
+
+
+def test_expired_batches_are_evicted(monkeypatch):
+    index = ListingSpatialIndex(ttl_seconds=60)
+    index.add("short", RENTALS, [make_listing("a", *AUSTIN)], ttl_seconds=10)
+    index.add("long", RENTALS, [make_listing("b", *AUSTIN)])
+    now = time.monotonic()
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 30)
+    assert not index.is_fresh("short")
+    assert [listing.id for listing in index.radius(RENTALS, *AUSTIN, 1)] == ["b"]
+
+    monkeypatch.setattr(time, "monotonic", lambda: now + 120)
+    assert index.radius(RENTALS, *AUSTIN, 1) == []
+    assert len(index) == 0
+
+
+def test_listing_lives_while_any_batch_holds_it():
+    index = ListingSpatialIndex()
+    index.add("one", RENTALS, [make_listing("shared", *AUSTIN, price=1500)])
+    index.add("two", RENTALS, [make_listing("shared", *AUSTIN, price=1600)])
+
+    index.discard("one")
+    (found,) = index.radius(RENTALS, *AUSTIN, 1)
+    assert found.pricing.list_price == 1600
+
+    index.discard("two")
+    assert len(index) == 0
+
+
+def test_listings_without_ids_are_kept_apart():
+    index = ListingSpatialIndex()
+    unknown = [
+        make_listing("prov:rentcast:unknown", *AUSTIN, price=1500 + i) for i in range(3)
+    ]
+    index.add("one", RENTALS, unknown)
+    index.add("two", RENTALS, unknown[:1])
+
+    prices = [
+        listing.pricing.list_price for listing in index.radius(RENTALS, *AUSTIN, 1)
+    ]
+    assert sorted(prices) == [1500, 1500, 1501, 1502]
+
+    index.discard("one")
+    index.discard("two")
+    assert len(index) == 0
+
+
+def test_capacity_evicts_whole_batches_oldest_first():
+    index = ListingSpatialIndex(max_listings=3)
+    index.add("old", RENTALS, [make_listing("a", *AUSTIN), make_listing("b", *AUSTIN)])
+    index.add("new", RENTALS, [make_listing("c", *AUSTIN), make_listing("d", *AUSTIN)])
+
+    assert not index.is_fresh("old")
+    assert index.is_fresh("new")
+    assert {listing.id for listing in index.radius(RENTALS, *AUSTIN, 1)} == {"c", "d"}
+    assert index.evictions == 1
+
+
+def test_freshness_follows_fetch_age():
+    index = ListingSpatialIndex()
+    index.add("search", RENTALS, [], fetched_at=time.time() - 120)
+
+    assert index.is_fresh("search")
+    assert index.is_fresh("search", max_age_seconds=300)
+    assert not index.is_fresh("search", max_age_seconds=60)
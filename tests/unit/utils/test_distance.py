@@ -1,6 +1,9 @@
+import math
+
 import pytest
 
-from app.utils.distance import haversine_distance
+from app.utils.distance import (bounding_box, great_circle_miles,
+                                haversine_distance)
 
 
 def test_haversine_distance_same_point():
@@ -28,3 +31,43 @@ def test_haversine_distance_rounding():
 
     # Check that result has at most 1 decimal place
     assert len(str(distance).split(".")[-1]) <= 1
+
+
+def test_great_circle_miles_is_unrounded():
+    distance = great_circle_miles(40.7128, -74.0060, 40.7129, -74.0061)
+
+    assert 0 < distance < 0.05
+    assert haversine_distance(40.7128, -74.0060, 40.7129, -74.0061) == round(
+        distance, 1
+    )
+
+
+def test_bounding_box_holds_circle_edge_points():
+    lat, lon, radius = 47.6, -122.3, 25.0
+    min_lat, min_lon, max_lat, max_lon = bounding_box(lat, lon, radius)
+
+    # Extreme points sit on the circle, just inside the box
+    assert great_circle_miles(lat, lon, max_lat, lon) == pytest.approx(radius)
+    assert great_circle_miles(lat, lon, min_lat, lon) == pytest.approx(radius)
+    for bearing in range(0, 360, 5):
+        angular = radius / 3956
+        theta = math.radians(bearing)
+        lat1 = math.radians(lat)
+        lat2 = math.asin(
+            math.sin(lat1) * math.cos(angular)
+            + math.cos(lat1) * math.sin(angular) * math.cos(theta)
+        )
+        lon2 = math.radians(lon) + math.atan2(
+            math.sin(theta) * math.sin(angular) * math.cos(lat1),
+            math.cos(angular) - math.sin(lat1) * math.sin(lat2),
+        )
+        assert min_lat - 1e-9 <= math.degrees(lat2) <= max_lat + 1e-9
+        assert min_lon - 1e-9 <= math.degrees(lon2) <= max_lon + 1e-9
+
+
+def test_bounding_box_wraps_antimeridian_and_poles():
+    min_lat, min_lon, max_lat, max_lon = bounding_box(0.0, 179.9, 50.0)
+    assert min_lon > max_lon
+    assert min_lon < 179.9 and max_lon < -179.0
+
+    assert bounding_box(89.9, 10.0, 50.0)[1::2] == (-180.0, 180.0)